@@ -1,6 +1,7 @@
 """Base agent class with common functionality"""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from uuid import uuid4
 from datetime import datetime
 from supabase import Client
@@ -14,13 +15,19 @@ settings = get_settings()
 logger = structlog.get_logger()
 
 
+@lru_cache(maxsize=1)
+def get_anthropic_client() -> Anthropic:
+    """Process-wide Anthropic client, so agents share one HTTP connection pool"""
+    return Anthropic(api_key=settings.anthropic_api_key)
+
+
 class BaseAgent(ABC):
     """Base class for all AI agents"""
 
     def __init__(self, db: Client, agent_name: str = None):
         self.db = db
         self.agent_name = agent_name or self.__class__.__name__
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+        self.client = get_anthropic_client()
         self.model = settings.anthropic_model
         self.max_tokens = settings.max_tokens
 
@@ -190,8 +197,6 @@ Timezone: {person.get('timezone')}
                     },
                     'execution_time_ms': execution_time_ms,
                     'tokens_used': tokens_used,
-                    'created_at': datetime.utcnow().isoformat(),
-                    'updated_at': datetime.utcnow().isoformat()
                 }
                 SupabaseQuery.insert(self.db, 'agent_execution_logs', log_data)
         except Exception as e:
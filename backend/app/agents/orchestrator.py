@@ -4,6 +4,9 @@ from sqlalchemy.orm import Session
 import structlog
 
 from app.agents.base import BaseAgent
+from app.agents.project_management import ProjectManagementAgent
+from app.agents.recommendation import RecommendationAgent
+from app.agents.reminder_management import ReminderManagementAgent
 
 logger = structlog.get_logger()
 
@@ -61,7 +64,6 @@ When you're uncertain or need staff approval for significant actions (booking ex
 
         # Route to specialized agents based on intent
         if intent == "reminder_create":
-            from app.agents.reminder_management import ReminderManagementAgent
             reminder_agent = ReminderManagementAgent(self.db)
             response = reminder_agent.process_reminder_request(
                 user_message=user_message,
@@ -70,15 +72,12 @@ When you're uncertain or need staff approval for significant actions (booking ex
                 context=context
             )
         elif intent == "reminder_list":
-            from app.agents.reminder_management import ReminderManagementAgent
             reminder_agent = ReminderManagementAgent(self.db)
             response = reminder_agent.list_reminders(person=person)
         elif intent == "recommendation":
-            from app.agents.recommendation import RecommendationAgent
             recommendation_agent = RecommendationAgent(self.db)
             response = recommendation_agent.recommend(user_message, context)
         elif intent == "project_management":
-            from app.agents.project_management import ProjectManagementAgent
             project_agent = ProjectManagementAgent(self.db)
             # For now, use execute method; can be enhanced with specific methods
             response = project_agent.execute(user_message, context)
@@ -1,7 +1,8 @@
 """Proactive Agent - Generates and sends unsolicited but helpful recommendations"""
 
 from supabase import Client
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import json
 import structlog
 
 from app.agents.base import BaseAgent
@@ -82,17 +83,23 @@ EXAMPLE:
         """
         logger.info("Starting proactive message scan")
 
-        # Get all active persons
-        persons = SupabaseQuery.select_active(
+        # All active clients, a page at a time
+        persons = SupabaseQuery.select_active_iter(
             client=self.db,
             table='persons',
+            order_by='person_id',
             filters={'person_type': 'client'}
         )
 
+        # One clock read for the scan's frequency-window checks
+        now = datetime.now(timezone.utc)
+
         messages_sent = 0
+        total_persons = 0
         for person in persons:
+            total_persons += 1
             try:
-                sent = self._check_and_send_proactive(person)
+                sent = self._check_and_send_proactive(person, now)
                 if sent:
                     messages_sent += 1
             except Exception as e:
@@ -105,14 +112,18 @@ EXAMPLE:
 
         logger.info(
             "Proactive message scan completed",
-            total_persons=len(persons),
+            total_persons=total_persons,
             messages_sent=messages_sent
         )
 
-    def _check_and_send_proactive(self, person: dict) -> bool:
+    def _check_and_send_proactive(self, person: dict, now: datetime) -> bool:
         """
         Check if we should send a proactive message to this person.
 
+        Args:
+            person: Person record
+            now: Scan time (timezone-aware UTC)
+
         Returns:
             bool: True if message was sent, False otherwise
         """
@@ -135,7 +146,9 @@ EXAMPLE:
         last_sent = proactive_prefs.get('last_proactive_sent')
         if last_sent:
             last_sent_dt = datetime.fromisoformat(last_sent.replace('Z', '+00:00'))
-            now = datetime.utcnow()
+            if last_sent_dt.tzinfo is None:
+                # Written before timestamps carried an offset; those were UTC
+                last_sent_dt = last_sent_dt.replace(tzinfo=timezone.utc)
 
             # Determine frequency window
             if frequency == 'daily':
@@ -181,7 +194,6 @@ Remember: Only suggest sending if it's genuinely helpful, not just to fill space
         response = self.execute(analysis_prompt, context)
 
         # Parse response
-        import json
         try:
             response_clean = response.strip()
             if response_clean.startswith('```json'):
@@ -227,11 +239,12 @@ Remember: Only suggest sending if it's genuinely helpful, not just to fill space
                 message_text=message_text,
                 agent_name='proactive',
                 channel_type='slack',  # Default to Slack for now
-                subject='Helpful Suggestion'
+                subject='Helpful Suggestion',
+                person=person
             )
 
             # Update last_proactive_sent in user metadata
-            self._update_last_sent(person, datetime.utcnow().isoformat())
+            self._update_last_sent(person, datetime.now(timezone.utc).isoformat())
 
             logger.info(
                 "Sent proactive message",
@@ -276,13 +289,14 @@ Just reply with "daily", "weekly", or "off" and I'll remember your preference!""
                 message_text=preference_message,
                 agent_name='proactive',
                 channel_type='slack',
-                subject='Proactive Message Preferences'
+                subject='Proactive Message Preferences',
+                person=person
             )
 
             # Set a temporary preference to avoid asking again immediately
             metadata = person.get('metadata_jsonb', {})
             proactive_prefs = metadata.get('proactive_preferences', {})
-            proactive_prefs['preference_asked_at'] = datetime.utcnow().isoformat()
+            proactive_prefs['preference_asked_at'] = datetime.now(timezone.utc).isoformat()
             proactive_prefs['frequency'] = 'daily'  # Set default while waiting for response
             metadata['proactive_preferences'] = proactive_prefs
 
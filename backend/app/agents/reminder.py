@@ -1,11 +1,13 @@
 """Reminder Agent - Scheduled agent that generates and sends proactive reminders"""
 
 from supabase import Client
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import structlog
 from uuid import uuid4
 
 from app.agents.base import BaseAgent
+from app.services.context_builder import ContextBuilder
+from app.services.proactive_messaging import ProactiveMessagingService
 from app.utils.supabase_helpers import SupabaseQuery
 
 logger = structlog.get_logger()
@@ -17,8 +19,18 @@ class ReminderAgent(BaseAgent):
     and generates contextual reminder messages.
     """
 
-    def __init__(self, db: Client):
+    def __init__(self, db: Client, shard: int = 0, shard_count: int = 1):
+        """
+        Args:
+            db: Supabase client
+            shard: Which slice of due reminders this agent scans
+            shard_count: Number of workers splitting the scan (1 = unsharded)
+        """
+        if not 0 <= shard < shard_count:
+            raise ValueError(f"Reminder shard {shard} out of range for {shard_count} shards")
         super().__init__(db, agent_name="reminder")
+        self.shard = shard
+        self.shard_count = shard_count
 
     def get_system_prompt(self) -> str:
         return """You are a reminder agent for an AI concierge platform.
@@ -42,26 +54,53 @@ Example: "Hi Sarah! Just a reminder that John's birthday is coming up on March 1
         """
         logger.info("Starting reminder scan")
 
-        now = datetime.utcnow().isoformat()
-
-        # Find reminders that should be sent
-        # Note: Complex filtering (<=, IS NULL) needs custom query or fetch & filter
-        all_reminders = SupabaseQuery.select_active(
-            client=self.db,
-            table='reminder_rules'
-        )
-
-        # Filter in Python for sent_at IS NULL and scheduled_datetime <= now
-        pending_reminders = [
-            r for r in all_reminders
-            if r.get('sent_at') is None and r.get('scheduled_datetime') and r.get('scheduled_datetime') <= now
-        ]
+        now = datetime.now(timezone.utc).isoformat()
+
+        # Due, unsent reminders: a range scan on idx_reminder_rules_pending
+        # (scheduled_datetime WHERE sent_at IS NULL AND deleted_at IS NULL)
+        if self.shard_count > 1:
+            # Only this worker's hash partition (see migration 026)
+            pending_reminders = self.db.rpc('due_reminders', {
+                'p_now': now,
+                'p_shard': self.shard,
+                'p_shard_count': self.shard_count
+            }).execute().data or []
+        else:
+            pending_reminders = self.db.table('reminder_rules').select('*').is_(
+                'deleted_at', 'null'
+            ).is_('sent_at', 'null').lte('scheduled_datetime', now).order('scheduled_datetime').execute().data
 
         logger.info(f"Found {len(pending_reminders)} pending reminders")
 
+        # Resolve the batch's date items, identities and persons with one IN
+        # query per table rather than a lookup chain per reminder
+        date_items = self._rows_by_id('date_items', 'date_item_id', {
+            r['date_item_id'] for r in pending_reminders if r.get('date_item_id')
+        })
+        categories = self._rows_by_id('date_categories', 'category_id', {
+            d['category_id'] for d in date_items.values() if d.get('category_id')
+        })
+        comm_identities = self._rows_by_id('comm_identities', 'comm_identity_id', {
+            r['comm_identity_id'] for r in pending_reminders
+        })
+        persons = self._rows_by_id('persons', 'person_id', {
+            c['person_id'] for c in comm_identities.values()
+        })
+
         for reminder in pending_reminders:
             try:
-                self._send_reminder(reminder)
+                date_item = date_items.get(reminder.get('date_item_id'))
+                comm_identity = comm_identities.get(reminder['comm_identity_id'])
+                if not comm_identity or comm_identity['person_id'] not in persons:
+                    raise ValueError("Reminder recipient no longer exists")
+
+                self._send_reminder(
+                    reminder,
+                    date_item=date_item,
+                    category=categories.get(date_item.get('category_id')) if date_item else None,
+                    comm_identity=comm_identity,
+                    person=persons[comm_identity['person_id']]
+                )
             except Exception as e:
                 logger.error("Failed to send reminder",
                            reminder_id=str(reminder['reminder_rule_id']),
@@ -69,55 +108,40 @@ Example: "Hi Sarah! Just a reminder that John's birthday is coming up on March 1
 
         logger.info("Reminder scan completed")
 
-    def _send_reminder(self, reminder: dict):
-        """Send a single reminder"""
-        # Fetch related entities
-        date_item = None
-        if reminder.get('date_item_id'):
-            date_item = SupabaseQuery.get_by_id(
+    def _rows_by_id(self, table: str, id_column: str, ids: set) -> dict:
+        """Fetch active rows of table whose id_column is in ids, keyed by id"""
+        if not ids:
+            return {}
+        return {
+            row[id_column]: row
+            for row in SupabaseQuery.select_active(
                 client=self.db,
-                table='date_items',
-                id_column='date_item_id',
-                id_value=reminder['date_item_id']
+                table=table,
+                filters={id_column: list(ids)}
             )
-
-        # Get person from comm_identity
-        comm_identity = SupabaseQuery.get_by_id(
-            client=self.db,
-            table='comm_identities',
-            id_column='comm_identity_id',
-            id_value=reminder['comm_identity_id']
-        )
-
-        person = SupabaseQuery.get_by_id(
-            client=self.db,
-            table='persons',
-            id_column='person_id',
-            id_value=comm_identity['person_id']
-        )
-
+        }
+
+    def _send_reminder(
+        self,
+        reminder: dict,
+        date_item: dict | None,
+        category: dict | None,
+        comm_identity: dict,
+        person: dict
+    ):
+        """Send a single reminder (related rows are resolved by the scan)"""
         logger.info("Sending reminder",
                    person_id=str(person['person_id']),
                    date_item=date_item.get('title') if date_item else 'General reminder',
                    channel=comm_identity.get('channel_type'))
 
         # Build context for reminder
-        from app.services.context_builder import ContextBuilder
         context_builder = ContextBuilder(self.db)
         context = context_builder.build_context(person['person_id'])
 
         # Generate reminder message using Claude
         if date_item:
-            # Fetch category if present
-            category_name = 'N/A'
-            if date_item.get('date_category_id'):
-                category = SupabaseQuery.get_by_id(
-                    client=self.db,
-                    table='date_categories',
-                    id_column='date_category_id',
-                    id_value=date_item['date_category_id']
-                )
-                category_name = category.get('category_name') if category else 'N/A'
+            category_name = category.get('category_name') if category else 'N/A'
 
             reminder_request = f"""Generate a reminder message for this important date:
 - Title: {date_item.get('title')}
@@ -140,7 +164,6 @@ Use the client's context to personalize this reminder. Keep it concise and helpf
         reminder_message = self.execute(reminder_request, context)
 
         # Send via ProactiveMessagingService
-        from app.services.proactive_messaging import ProactiveMessagingService
         messaging_service = ProactiveMessagingService(self.db)
 
         try:
@@ -149,7 +172,9 @@ Use the client's context to personalize this reminder. Keep it concise and helpf
                 message_text=reminder_message,
                 agent_name='reminder',
                 channel_type=comm_identity.get('channel_type'),
-                subject='Reminder' if date_item else None
+                subject='Reminder' if date_item else None,
+                person=person,
+                comm_identity=comm_identity
             )
 
             # Mark reminder as sent
@@ -158,7 +183,7 @@ Use the client's context to personalize this reminder. Keep it concise and helpf
                 table='reminder_rules',
                 id_column='reminder_rule_id',
                 id_value=reminder['reminder_rule_id'],
-                data={'sent_at': datetime.utcnow().isoformat()}
+                data={'sent_at': datetime.now(timezone.utc).isoformat()}
             )
 
             logger.info("Reminder sent successfully",
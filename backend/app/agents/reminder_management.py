@@ -1,13 +1,13 @@
 """Reminder Management Agent - Handles user requests to create and manage reminders"""
 
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-from uuid import uuid4
+from datetime import datetime, timedelta, timezone
 import json
 import structlog
 
 from app.agents.base import BaseAgent
 from app.utils.supabase_helpers import SupabaseQuery
+from app.services.date_occurrences import expand_occurrences, lead_time_trigger, replace_occurrences
 
 logger = structlog.get_logger()
 
@@ -202,7 +202,7 @@ User: "Remind me about that thing"
                 timezone=user_tz_name,
                 error=str(e)
             )
-            current_dt_str = datetime.utcnow().replace(tzinfo=pytz.UTC).isoformat()
+            current_dt_str = datetime.now(timezone.utc).isoformat()
             user_tz_name = 'UTC'
 
         # Add current datetime to context for parsing relative times
@@ -428,7 +428,6 @@ Respond with ONLY the JSON object as specified in the system prompt. No addition
 
         # Create reminder_rule
         reminder_data = {
-            'reminder_rule_id': str(uuid4()),
             'org_id': person['org_id'],
             'date_item_id': date_item_id,
             'comm_identity_id': comm_identity['comm_identity_id'],
@@ -438,8 +437,6 @@ Respond with ONLY the JSON object as specified in the system prompt. No addition
                 'user_request': parsed_data,
                 'created_by': 'reminder_management_agent'
             },
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat()
         }
 
         # Add type-specific fields
@@ -456,12 +453,16 @@ Respond with ONLY the JSON object as specified in the system prompt. No addition
                     id_value=date_item_id
                 )
                 if date_item and date_item.get('next_occurrence'):
-                    target_date = datetime.fromisoformat(date_item['next_occurrence'])
-                    reminder_date = target_date - timedelta(days=reminder_data['lead_time_days'])
-                    reminder_data['scheduled_datetime'] = reminder_date.isoformat()
+                    reminder_data['scheduled_datetime'] = lead_time_trigger(
+                        date_item['next_occurrence'], reminder_data['lead_time_days']
+                    )
 
         reminder = SupabaseQuery.insert(self.db, 'reminder_rules', reminder_data)
 
+        # Deferred: the worker module imports app.agents, which imports this one
+        from app.workers import reminder_worker
+        reminder_worker.wakeup.set()
+
         logger.info(
             "Created reminder rule",
             reminder_id=str(reminder['reminder_rule_id']),
@@ -515,11 +516,8 @@ Respond with ONLY the JSON object as specified in the system prompt. No addition
         if not categories:
             # Create default category
             category_data = {
-                'date_category_id': str(uuid4()),
                 'org_id': person['org_id'],
                 'category_name': 'General',
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
             }
             category = SupabaseQuery.insert(self.db, 'date_categories', category_data)
         else:
@@ -527,19 +525,21 @@ Respond with ONLY the JSON object as specified in the system prompt. No addition
 
         # Create date_item
         date_item_data = {
-            'date_item_id': str(uuid4()),
             'org_id': person['org_id'],
             'person_id': person['person_id'],
-            'date_category_id': category['date_category_id'],
+            'category_id': category['category_id'],
             'title': title,
-            'date_value': date_value or datetime.utcnow().date().isoformat(),
+            'date_value': date_value or datetime.now(timezone.utc).date().isoformat(),
             'next_occurrence': date_value,
             'notes': notes,
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat()
         }
 
         date_item = SupabaseQuery.insert(self.db, 'date_items', date_item_data)
+        date_item['next_occurrence'] = replace_occurrences(
+            self.db,
+            date_item['date_item_id'],
+            expand_occurrences(datetime.fromisoformat(date_item_data['date_value']).date())
+        )
 
         logger.info(
             "Created date_item",
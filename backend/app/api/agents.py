@@ -1,7 +1,7 @@
 """Agent API endpoints"""
 
 from uuid import UUID, uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status
 from supabase import Client
 from pydantic import BaseModel
@@ -69,8 +69,6 @@ async def chat(request: ChatRequest, db: Client = Depends(get_db)):
             'person_id': person['person_id'],
             'channel_type': request.channel_type,
             'status': 'active',
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat()
         }
         conversation = SupabaseQuery.insert(
             client=db,
@@ -80,13 +78,11 @@ async def chat(request: ChatRequest, db: Client = Depends(get_db)):
 
     # Save inbound message
     inbound_message_data = {
-        'message_id': uuid4(),
         'org_id': person['org_id'],
         'conversation_id': conversation['conversation_id'],
         'direction': 'inbound',
         'sender_person_id': person['person_id'],
         'content_text': request.message,
-        'created_at': datetime.utcnow().isoformat()
     }
     SupabaseQuery.insert(
         client=db,
@@ -109,13 +105,11 @@ async def chat(request: ChatRequest, db: Client = Depends(get_db)):
 
     # Save outbound message
     outbound_message_data = {
-        'message_id': uuid4(),
         'org_id': person['org_id'],
         'conversation_id': conversation['conversation_id'],
         'direction': 'outbound',
         'agent_name': 'orchestrator',
         'content_text': ai_response,
-        'created_at': datetime.utcnow().isoformat()
     }
     outbound_message = SupabaseQuery.insert(
         client=db,
@@ -129,7 +123,7 @@ async def chat(request: ChatRequest, db: Client = Depends(get_db)):
         table='conversations',
         id_column='conversation_id',
         id_value=UUID(conversation['conversation_id']),
-        data={'updated_at': datetime.utcnow().isoformat()}
+        data={'updated_at': datetime.now(timezone.utc).isoformat()}
     )
 
     return ChatResponse(
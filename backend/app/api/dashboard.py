@@ -9,6 +9,7 @@ from pydantic import BaseModel
 
 from app.database import get_db
 from app.utils.supabase_helpers import SupabaseQuery
+from app.services.date_occurrences import OCCURRENCE_HORIZON_DAYS
 
 router = APIRouter()
 
@@ -115,6 +116,7 @@ async def get_person_dashboard(
         messages = SupabaseQuery.select_active(
             client=db,
             table='messages',
+            columns='content_text,created_at',
             filters={'conversation_id': conv['conversation_id']},
             order_by='created_at.desc',
             limit=1
@@ -126,6 +128,7 @@ async def get_person_dashboard(
         all_messages = SupabaseQuery.select_active(
             client=db,
             table='messages',
+            columns='message_id',
             filters={'conversation_id': conv['conversation_id']},
             limit=100
         )
@@ -138,79 +141,73 @@ async def get_person_dashboard(
             'message_count': len(all_messages)
         })
 
-    # Get upcoming dates
-    date_items = SupabaseQuery.select_active(
-        client=db,
-        table='date_items',
-        filters={'person_id': person_id},
-        order_by='next_occurrence',
-        limit=20
-    )
-
-    # Filter for upcoming only and calculate days_until
+    # Get the next 5 upcoming dates: each item's first occurrence within the
+    # expansion horizon, soonest first (date_item_occurrences, see migration 028)
     today = date.today()
+    date_items = db.rpc('upcoming_date_occurrences', {
+        'p_person_id': str(person_id),
+        'p_from': today.isoformat(),
+        'p_to': (today + timedelta(days=OCCURRENCE_HORIZON_DAYS)).isoformat()
+    }).execute().data or []
+
     upcoming_dates = []
 
-    for item in date_items:
-        next_occ = item.get('next_occurrence') or item.get('date_value')
-        if not next_occ:
-            continue
-
-        next_date = date.fromisoformat(next_occ)
-        if next_date >= today:
-            days_until = (next_date - today).days
-
-            # Get category
-            category = SupabaseQuery.get_by_id(
-                client=db,
-                table='date_categories',
-                id_column='category_id',
-                id_value=item['category_id']
-            )
-
-            # Count reminders
-            reminders = SupabaseQuery.select_active(
-                client=db,
-                table='reminder_rules',
-                filters={'date_item_id': item['date_item_id']}
-            )
-
-            upcoming_dates.append({
-                'date_item_id': item['date_item_id'],
-                'title': item['title'],
-                'date_value': item['date_value'],
-                'next_occurrence': next_occ,
-                'category_name': category.get('category_name') if category else 'General',
-                'category_icon': category.get('icon') if category else None,
-                'days_until': days_until,
-                'reminder_count': len(reminders)
-            })
+    for item in date_items[:5]:
+        next_occ = item['occurs_on']
+        days_until = (date.fromisoformat(next_occ) - today).days
 
-    # Sort by days_until and take top 5
-    upcoming_dates.sort(key=lambda x: x['days_until'])
-    upcoming_dates = upcoming_dates[:5]
+        # Get category
+        category = SupabaseQuery.get_by_id(
+            client=db,
+            table='date_categories',
+            id_column='category_id',
+            id_value=item['category_id']
+        )
+
+        # Count reminders
+        reminders = SupabaseQuery.select_active(
+            client=db,
+            table='reminder_rules',
+            filters={'date_item_id': item['date_item_id']}
+        )
+
+        upcoming_dates.append({
+            'date_item_id': item['date_item_id'],
+            'title': item['title'],
+            'date_value': item['date_value'],
+            'next_occurrence': next_occ,
+            'category_name': category.get('category_name') if category else 'General',
+            'category_icon': category.get('icon') if category else None,
+            'days_until': days_until,
+            'reminder_count': len(reminders)
+        })
 
     # Get active projects
     projects = SupabaseQuery.select_active(
         client=db,
         table='projects',
+        columns='project_id,title,status,priority,due_date',
         filters={'person_id': person_id},
         order_by='priority,created_at.desc',
         limit=10
     )
 
-    active_projects = []
-    for project in projects:
-        # Skip completed projects
-        if project['status'] in ['completed', 'cancelled']:
-            continue
+    open_projects = [p for p in projects if p['status'] not in ['completed', 'cancelled']]
 
-        # Get tasks
-        tasks = SupabaseQuery.select_active(
+    # Tasks for all open projects in one IN query instead of one per project
+    tasks_by_project: Dict[str, List[Dict[str, Any]]] = {}
+    if open_projects:
+        for task in SupabaseQuery.select_active(
             client=db,
             table='tasks',
-            filters={'project_id': project['project_id']}
-        )
+            columns='project_id,status',
+            filters={'project_id': [p['project_id'] for p in open_projects]}
+        ):
+            tasks_by_project.setdefault(task['project_id'], []).append(task)
+
+    active_projects = []
+    for project in open_projects:
+        tasks = tasks_by_project.get(project['project_id'], [])
 
         total_tasks = len(tasks)
         completed_tasks = len([t for t in tasks if t['status'] == 'done'])
@@ -230,58 +227,41 @@ async def get_person_dashboard(
     # Get recent recommendations (linked through projects)
     recent_recommendations = []
     if projects:
-        # Get recommendations for this person's projects
-        project_ids = [p['project_id'] for p in projects]
-
-        for project_id in project_ids[:5]:  # Limit to 5 projects
-            recs = SupabaseQuery.select_active(
-                client=db,
-                table='recommendations',
-                filters={'project_id': project_id},
-                order_by='created_at.desc',
-                limit=2
-            )
-
-            for rec in recs:
-                # Get item name based on item_type
-                item_name = None
-                if rec.get('item_type') == 'vendor' and rec.get('item_id'):
-                    item = SupabaseQuery.get_by_id(
-                        client=db,
-                        table='vendors',
-                        id_column='vendor_id',
-                        id_value=rec['item_id']
-                    )
-                    item_name = item.get('vendor_name') if item else None
-                elif rec.get('item_type') == 'venue' and rec.get('item_id'):
-                    item = SupabaseQuery.get_by_id(
-                        client=db,
-                        table='venues',
-                        id_column='venue_id',
-                        id_value=rec['item_id']
-                    )
-                    item_name = item.get('venue_name') if item else None
-                elif rec.get('item_type') == 'restaurant' and rec.get('item_id'):
-                    item = SupabaseQuery.get_by_id(
-                        client=db,
-                        table='restaurants',
-                        id_column='restaurant_id',
-                        id_value=rec['item_id']
-                    )
-                    item_name = item.get('restaurant_name') if item else None
-
-                recent_recommendations.append({
-                    'recommendation_id': rec['recommendation_id'],
-                    'vendor_name': item_name if rec.get('item_type') == 'vendor' else None,
-                    'venue_name': item_name if rec.get('item_type') == 'venue' else None,
-                    'category': rec.get('item_type', 'general'),
-                    'notes': rec.get('rationale_text'),
-                    'created_at': rec['created_at']
-                })
-
-        # Sort by created_at and take most recent 5
-        recent_recommendations.sort(key=lambda x: x['created_at'], reverse=True)
-        recent_recommendations = recent_recommendations[:5]
+        # Latest 2 recommendations from each of the first 5 projects in one
+        # RPC (per-project LIMIT, see migration 027); rows arrive newest first
+        project_ids = [p['project_id'] for p in projects][:5]
+        recs = db.rpc('recent_project_recommendations', {
+            'p_project_ids': project_ids,
+            'p_per_project': 2
+        }).execute().data or []
+
+        # Most recent 5 overall
+        recs = recs[:5]
+
+        # Resolve item names with one IN query per item table
+        item_tables = {'vendor': ('vendors', 'vendor_id'), 'venue': ('venues', 'venue_id')}
+        item_names: Dict[str, str] = {}
+        for item_type, (table, id_column) in item_tables.items():
+            item_ids = [r['item_id'] for r in recs if r.get('item_type') == item_type and r.get('item_id')]
+            if item_ids:
+                for item in SupabaseQuery.select_active(
+                    client=db,
+                    table=table,
+                    columns=f'{id_column},name',
+                    filters={id_column: item_ids}
+                ):
+                    item_names[item[id_column]] = item.get('name')
+
+        for rec in recs:
+            item_name = item_names.get(rec.get('item_id'))
+            recent_recommendations.append({
+                'recommendation_id': rec['recommendation_id'],
+                'vendor_name': item_name if rec.get('item_type') == 'vendor' else None,
+                'venue_name': item_name if rec.get('item_type') == 'venue' else None,
+                'category': rec.get('item_type', 'general'),
+                'notes': rec.get('rationale_text'),
+                'created_at': rec['created_at']
+            })
 
     # Calculate stats
     stats = {
@@ -322,55 +302,45 @@ async def get_upcoming_dates(
             detail="Person not found"
         )
 
-    # Get all date items
-    date_items = SupabaseQuery.select_active(
-        client=db,
-        table='date_items',
-        filters={'person_id': person_id}
-    )
-
-    # Filter for upcoming within days_ahead
+    # Each item's first occurrence in the window, soonest first
     today = date.today()
-    cutoff_date = today + timedelta(days=days_ahead)
+    date_items = db.rpc('upcoming_date_occurrences', {
+        'p_person_id': str(person_id),
+        'p_from': today.isoformat(),
+        'p_to': (today + timedelta(days=days_ahead)).isoformat()
+    }).execute().data or []
+
     upcoming_dates = []
 
     for item in date_items:
-        next_occ = item.get('next_occurrence') or item.get('date_value')
-        if not next_occ:
-            continue
-
-        next_date = date.fromisoformat(next_occ)
-        if today <= next_date <= cutoff_date:
-            days_until = (next_date - today).days
-
-            # Get category
-            category = SupabaseQuery.get_by_id(
-                client=db,
-                table='date_categories',
-                id_column='category_id',
-                id_value=item['category_id']
-            )
-
-            # Count reminders
-            reminders = SupabaseQuery.select_active(
-                client=db,
-                table='reminder_rules',
-                filters={'date_item_id': item['date_item_id']}
-            )
-
-            upcoming_dates.append({
-                'date_item_id': item['date_item_id'],
-                'title': item['title'],
-                'date_value': item['date_value'],
-                'next_occurrence': next_occ,
-                'category_name': category.get('category_name') if category else 'General',
-                'category_icon': category.get('icon') if category else None,
-                'days_until': days_until,
-                'reminder_count': len(reminders)
-            })
+        next_occ = item['occurs_on']
+        days_until = (date.fromisoformat(next_occ) - today).days
+
+        # Get category
+        category = SupabaseQuery.get_by_id(
+            client=db,
+            table='date_categories',
+            id_column='category_id',
+            id_value=item['category_id']
+        )
 
-    # Sort by days_until
-    upcoming_dates.sort(key=lambda x: x['days_until'])
+        # Count reminders
+        reminders = SupabaseQuery.select_active(
+            client=db,
+            table='reminder_rules',
+            filters={'date_item_id': item['date_item_id']}
+        )
+
+        upcoming_dates.append({
+            'date_item_id': item['date_item_id'],
+            'title': item['title'],
+            'date_value': item['date_value'],
+            'next_occurrence': next_occ,
+            'category_name': category.get('category_name') if category else 'General',
+            'category_icon': category.get('icon') if category else None,
+            'days_until': days_until,
+            'reminder_count': len(reminders)
+        })
 
     return upcoming_dates
 
@@ -1,8 +1,7 @@
 """Date Categories API endpoints"""
 
 from typing import List
-from uuid import UUID, uuid4
-from datetime import datetime
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from supabase import Client
 from pydantic import BaseModel
@@ -78,9 +77,6 @@ async def get_date_category(category_id: UUID, db: Client = Depends(get_db)):
 async def create_date_category(category: DateCategoryCreate, db: Client = Depends(get_db)):
     """Create new date category"""
     category_data = category.model_dump()
-    category_data['category_id'] = uuid4()
-    category_data['created_at'] = datetime.utcnow().isoformat()
-    category_data['updated_at'] = datetime.utcnow().isoformat()
 
     created_category = SupabaseQuery.insert(
         client=db,
@@ -1,18 +1,33 @@
 """Date Items API endpoints"""
 
 from typing import List
-from uuid import UUID, uuid4
-from datetime import datetime, date
+from uuid import UUID
+from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, status
 from supabase import Client
 from pydantic import BaseModel
 
 from app.database import get_db
 from app.utils.supabase_helpers import SupabaseQuery
+from app.services.date_occurrences import (
+    expand_occurrences, lead_time_trigger, refresh_lead_time_reminders, replace_occurrences
+)
+from app.workers import reminder_worker
 
 router = APIRouter()
 
 
+def _expand_or_400(date_value: str, recurrence_rule: str | None) -> List[date]:
+    """Expand occurrences, turning a malformed date or RRULE into a 400"""
+    try:
+        return expand_occurrences(date.fromisoformat(date_value), recurrence_rule)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid date_value or recurrence_rule: {e}"
+        )
+
+
 # Pydantic schemas
 class ReminderRuleCreate(BaseModel):
     """Embedded reminder rule for creating with date item"""
@@ -175,16 +190,16 @@ async def create_date_item(date_item: DateItemCreate, db: Client = Depends(get_d
 
     # Create date_item
     date_item_data = date_item.model_dump(exclude={'reminder_rules'})
-    date_item_data['date_item_id'] = uuid4()
-    date_item_data['next_occurrence'] = date_item.date_value  # Initial next occurrence
-    date_item_data['created_at'] = datetime.utcnow().isoformat()
-    date_item_data['updated_at'] = datetime.utcnow().isoformat()
+    occurrences = _expand_or_400(date_item.date_value, date_item.recurrence_rule)
 
     created_date_item = SupabaseQuery.insert(
         client=db,
         table='date_items',
         data=date_item_data
     )
+    created_date_item['next_occurrence'] = replace_occurrences(
+        db, created_date_item['date_item_id'], occurrences
+    )
 
     # Create reminder_rules if provided
     created_reminders = []
@@ -205,9 +220,9 @@ async def create_date_item(date_item: DateItemCreate, db: Client = Depends(get_d
 
         comm_identity = comm_identities[0]
 
+        reminder_rows = []
         for reminder_rule in date_item.reminder_rules:
             reminder_data = {
-                'reminder_rule_id': str(uuid4()),
                 'org_id': date_item.org_id,
                 'date_item_id': created_date_item['date_item_id'],
                 'comm_identity_id': comm_identity['comm_identity_id'],
@@ -218,23 +233,23 @@ async def create_date_item(date_item: DateItemCreate, db: Client = Depends(get_d
                     'created_by': 'date_items_api',
                     'channel_type': reminder_rule.channel_type
                 },
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
             }
 
             # Calculate scheduled_datetime for lead_time type
-            if reminder_rule.reminder_type == 'lead_time' and reminder_rule.lead_time_days:
-                from datetime import timedelta
-                target_date = datetime.fromisoformat(date_item.date_value)
-                reminder_date = target_date - timedelta(days=reminder_rule.lead_time_days)
-                reminder_data['scheduled_datetime'] = reminder_date.isoformat()
-
-            created_reminder = SupabaseQuery.insert(
-                client=db,
-                table='reminder_rules',
-                data=reminder_data
-            )
-            created_reminders.append(created_reminder)
+            if (reminder_rule.reminder_type == 'lead_time' and reminder_rule.lead_time_days
+                    and created_date_item['next_occurrence']):
+                reminder_data['scheduled_datetime'] = lead_time_trigger(
+                    created_date_item['next_occurrence'], reminder_rule.lead_time_days
+                )
+
+            reminder_rows.append(reminder_data)
+
+        created_reminders = SupabaseQuery.bulk_insert(
+            client=db,
+            table='reminder_rules',
+            rows=reminder_rows
+        )
+        reminder_worker.wakeup.set()
 
     created_date_item['reminder_rules'] = created_reminders
     return created_date_item
@@ -263,9 +278,23 @@ async def update_date_item(
     # Update date_item
     update_data = date_item_update.model_dump(exclude_unset=True)
 
-    # Update next_occurrence if date_value changed
-    if 'date_value' in update_data:
-        update_data['next_occurrence'] = update_data['date_value']
+    # Re-expand occurrences only when the schedule changed. Check key
+    # presence: recurrence_rule=None clears the rule and must re-expand too.
+    occurrences = None
+    if 'date_value' in update_data or 'recurrence_rule' in update_data:
+        if update_data.get('date_value') is None:
+            update_data.pop('date_value', None)  # date_value is NOT NULL
+        date_value = update_data.get('date_value', existing_date_item['date_value'])
+        recurrence_rule = update_data.get('recurrence_rule', existing_date_item.get('recurrence_rule'))
+        occurrences = _expand_or_400(date_value, recurrence_rule)
+
+        if 'recurrence_rule' in update_data and recurrence_rule is None:
+            # SupabaseQuery.update drops None values, so clear the rule directly
+            update_data.pop('recurrence_rule')
+            cleared = db.table('date_items').update({'recurrence_rule': None}).eq(
+                'date_item_id', str(date_item_id)
+            ).is_('deleted_at', 'null').execute().data
+            existing_date_item = cleared[0] if cleared else existing_date_item
 
     updated_date_item = SupabaseQuery.update(
         client=db,
@@ -273,7 +302,11 @@ async def update_date_item(
         id_column='date_item_id',
         id_value=date_item_id,
         data=update_data
-    )
+    ) if update_data else existing_date_item
+    if occurrences is not None:
+        updated_date_item['next_occurrence'] = replace_occurrences(db, date_item_id, occurrences)
+        refresh_lead_time_reminders(db, updated_date_item)
+        reminder_worker.wakeup.set()
 
     # Fetch reminder_rules
     reminder_rules = SupabaseQuery.select_active(
@@ -327,6 +360,8 @@ async def delete_date_item(date_item_id: UUID, db: Client = Depends(get_db)):
             id_value=reminder['reminder_rule_id']
         )
 
+    # Its occurrences are removed by the date_items soft-delete trigger
+
     return None
 
 
@@ -2,7 +2,6 @@
 
 from typing import List
 from uuid import UUID, uuid4
-from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from supabase import Client
 from pydantic import BaseModel
@@ -86,8 +85,6 @@ async def create_person(person: PersonCreate, db: Client = Depends(get_db)):
     person_data = person.model_dump()
     # Add required fields
     person_data['person_id'] = uuid4()
-    person_data['created_at'] = datetime.utcnow().isoformat()
-    person_data['updated_at'] = datetime.utcnow().isoformat()
 
     created_person = SupabaseQuery.insert(
         client=db,
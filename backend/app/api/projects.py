@@ -5,7 +5,7 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, Depends, HTTPException, status
 from supabase import Client
 from pydantic import BaseModel
-from datetime import date, datetime
+from datetime import date
 
 from app.database import get_db
 from app.utils.supabase_helpers import SupabaseQuery
@@ -116,8 +116,6 @@ async def create_project(project: ProjectCreate, db: Client = Depends(get_db)):
     """Create new project"""
     project_data = project.model_dump()
     project_data['project_id'] = uuid4()
-    project_data['created_at'] = datetime.utcnow().isoformat()
-    project_data['updated_at'] = datetime.utcnow().isoformat()
 
     created_project = SupabaseQuery.insert(
         client=db,
@@ -193,8 +191,6 @@ async def create_task(project_id: UUID, task: TaskCreate, db: Client = Depends(g
     task_data = task.model_dump()
     task_data['task_id'] = uuid4()
     task_data['org_id'] = project['org_id']
-    task_data['created_at'] = datetime.utcnow().isoformat()
-    task_data['updated_at'] = datetime.utcnow().isoformat()
 
     created_task = SupabaseQuery.insert(
         client=db,
@@ -1,14 +1,16 @@
 """Reminders API endpoints"""
 
 from typing import List
-from uuid import UUID, uuid4
-from datetime import datetime
+from uuid import UUID
+from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status
 from supabase import Client
 from pydantic import BaseModel
 
 from app.database import get_db
 from app.utils.supabase_helpers import SupabaseQuery
+from app.services.date_occurrences import lead_time_trigger
+from app.workers import reminder_worker
 
 router = APIRouter()
 
@@ -194,10 +196,9 @@ async def create_reminder(reminder: ReminderRuleCreate, db: Client = Depends(get
 
         # Calculate scheduled_datetime for lead_time type
         if reminder.reminder_type == 'lead_time' and reminder.lead_time_days:
-            from datetime import timedelta
-            target_date = datetime.fromisoformat(date_item['next_occurrence'] or date_item['date_value'])
-            reminder_date = target_date - timedelta(days=reminder.lead_time_days)
-            reminder.scheduled_datetime = reminder_date.isoformat()
+            reminder.scheduled_datetime = lead_time_trigger(
+                date_item['next_occurrence'] or date_item['date_value'], reminder.lead_time_days
+            )
 
     # Validate scheduled_datetime is provided for scheduled type
     if reminder.reminder_type == 'scheduled' and not reminder.scheduled_datetime:
@@ -208,10 +209,7 @@ async def create_reminder(reminder: ReminderRuleCreate, db: Client = Depends(get
 
     # Create reminder_rule
     reminder_data = reminder.model_dump(exclude={'person_id', 'action'})
-    reminder_data['reminder_rule_id'] = uuid4()
     reminder_data['comm_identity_id'] = comm_identity['comm_identity_id']
-    reminder_data['created_at'] = datetime.utcnow().isoformat()
-    reminder_data['updated_at'] = datetime.utcnow().isoformat()
 
     # Add action to metadata if provided
     if reminder.action:
@@ -224,6 +222,7 @@ async def create_reminder(reminder: ReminderRuleCreate, db: Client = Depends(get
         table='reminder_rules',
         data=reminder_data
     )
+    reminder_worker.wakeup.set()
 
     return created_reminder
 
@@ -263,6 +262,7 @@ async def update_reminder(
         id_value=reminder_id,
         data=update_data
     )
+    reminder_worker.wakeup.set()
 
     return updated_reminder
 
@@ -367,13 +367,14 @@ async def retry_reminder(reminder_id: UUID, db: Client = Depends(get_db)):
         )
 
     # Reset sent_at and update scheduled_datetime to now
+    now = datetime.now(timezone.utc).isoformat()
     update_data = {
         'sent_at': None,
-        'scheduled_datetime': datetime.utcnow().isoformat(),
+        'scheduled_datetime': now,
         'metadata_jsonb': {
             **reminder.get('metadata_jsonb', {}),
             'manually_retried': True,
-            'retry_at': datetime.utcnow().isoformat()
+            'retry_at': now
         }
     }
 
@@ -384,5 +385,6 @@ async def retry_reminder(reminder_id: UUID, db: Client = Depends(get_db)):
         id_value=reminder_id,
         data=update_data
     )
+    reminder_worker.wakeup.set()
 
     return updated_reminder
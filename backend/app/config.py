@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     supabase_url: str
     supabase_service_key: str
     supabase_anon_key: str
+    supabase_max_connections: int = 20  # Keep-alive HTTP pool shared by all threads
 
     # Anthropic AI
     anthropic_api_key: str
@@ -52,6 +53,8 @@ class Settings(BaseSettings):
 
     # Background Workers
     reminder_check_interval: int = 300  # 5 minutes (in seconds)
+    reminder_worker_shard: int = 0  # This process's shard, 0..reminder_worker_shard_count-1
+    reminder_worker_shard_count: int = 1  # Processes splitting the reminder scan
     proactive_check_interval: int = 86400  # 24 hours (in seconds)
 
     class Config:
@@ -1,6 +1,7 @@
 """Database connection and session management"""
 
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, Client, ClientOptions
 from contextlib import contextmanager
 from typing import Generator
 import structlog
@@ -23,10 +24,26 @@ def get_supabase_client() -> Client:
     """
     global _supabase_client
     if _supabase_client is None:
+        # One keep-alive pool for every thread (request handlers, context
+        # section executor, workers), sized explicitly instead of relying on
+        # httpx defaults
+        http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=settings.supabase_max_connections,
+                max_keepalive_connections=settings.supabase_max_connections
+            ),
+            timeout=120,
+            follow_redirects=True,
+            http2=True
+        )
         _supabase_client = create_client(
             settings.supabase_url,
-            settings.supabase_service_key
+            settings.supabase_service_key,
+            options=ClientOptions(httpx_client=http_client)
         )
+        # supabase-py builds its PostgREST client lazily on first .table()
+        # access; do it here so threads sharing the singleton can't race it
+        _supabase_client.postgrest
         logger.info("Supabase client initialized", url=settings.supabase_url)
     return _supabase_client
 
@@ -6,16 +6,37 @@ import structlog
 from slack_sdk import WebClient
 
 from app.config import get_settings
-from app.database import get_db_context
+from app.database import get_supabase_client
 from app.agents.orchestrator import OrchestratorAgent
 from app.services.context_builder import ContextBuilder
 from app.utils.supabase_helpers import SupabaseQuery
 from uuid import uuid4
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import threading
 
 settings = get_settings()
 logger = structlog.get_logger()
 
+# Shared pool for independent Supabase lookups made while handling a message
+_lookup_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slack-lookup")
+
+# Per-thread ContextBuilder/OrchestratorAgent, reused across messages (Bolt
+# dispatches events on a thread pool, so instances are never shared)
+_thread_agents = threading.local()
+
+# Slack user ID -> DM channel ID. A user's DM channel never changes, so
+# entries are kept for the life of the process.
+_dm_channels: dict[str, str] = {}
+
+
+def _get_message_agents(db):
+    """Return this thread's (ContextBuilder, OrchestratorAgent), rebuilt only if db changes"""
+    if getattr(_thread_agents, "db", None) is not db:
+        _thread_agents.db = db
+        _thread_agents.context_builder = ContextBuilder(db)
+        _thread_agents.orchestrator = OrchestratorAgent(db)
+    return _thread_agents.context_builder, _thread_agents.orchestrator
+
 
 class SlackUserIntegration:
     """Handles Slack integration as a user (Athena Concierge)"""
@@ -61,6 +82,25 @@ class SlackUserIntegration:
         """Check if a channel is blocked"""
         return channel in self.BLOCKED_CHANNELS
 
+    # System/edit subtypes that never need a reply - dropped before any other work
+    IGNORED_SUBTYPES = frozenset({
+        "message_changed",
+        "message_deleted",
+        "message_replied",
+        "channel_join",
+        "channel_leave",
+        "channel_topic",
+        "channel_purpose",
+        "bot_message",
+        "file_share",
+    })
+
+    def _is_ignored_event(self, event: dict) -> bool:
+        """Check if a message event is noise (system subtype or our own threaded reply)"""
+        if event.get("subtype") in self.IGNORED_SUBTYPES:
+            return True
+        return bool(event.get("thread_ts")) and event.get("user") == self.user_id
+
     def _register_handlers(self):
         """Register Slack event handlers"""
 
@@ -68,7 +108,16 @@ class SlackUserIntegration:
         def handle_message(event, say, client):
             """Handle messages in channels where Athena Concierge user is present"""
             try:
-                # FIRST: Ignore ALL events from blocked channels
+                # Cheapest check first: drop edits, deletes, joins and our own thread replies
+                if self._is_ignored_event(event):
+                    logger.debug(
+                        "Ignoring Slack system message",
+                        subtype=event.get("subtype"),
+                        channel=event.get("channel")
+                    )
+                    return
+
+                # Ignore ALL events from blocked channels
                 if self._is_blocked_channel(event.get("channel")):
                     logger.debug(
                         "Ignoring message from blocked channel",
@@ -154,113 +203,125 @@ class SlackUserIntegration:
                 )
 
                 # Look up person by Slack ID (must be pre-registered)
-                with get_db_context() as db:
-                    # Query CommIdentity by Slack ID
-                    comm_identities = SupabaseQuery.select_active(
-                        client=db,
-                        table='comm_identities',
-                        filters={
-                            'channel_type': 'slack',
-                            'identity_value': user_id
-                        },
-                        limit=1
-                    )
-                    comm_identity = comm_identities[0] if comm_identities else None
-
-                    # Only serve pre-registered clients - ignore unregistered users
-                    if not comm_identity:
-                        logger.info(
-                            "Message from unregistered Slack user - ignoring (only pre-registered clients are served)",
-                            user_id=user_id,
-                            channel=channel,
-                            text_preview=clean_text[:50]
-                        )
-                        return
-
-                    # Fetch person from comm_identity
-                    person = SupabaseQuery.get_by_id(
-                        client=db,
-                        table='persons',
-                        id_column='person_id',
-                        id_value=comm_identity['person_id']
-                    )
+                # get_supabase_client() returns the process-wide singleton, so the
+                # whole handler shares one client without a context manager per event
+                db = get_supabase_client()
+                # Query CommIdentity by Slack ID
+                comm_identities = SupabaseQuery.select_active(
+                    client=db,
+                    table='comm_identities',
+                    filters={
+                        'channel_type': 'slack',
+                        'identity_value': user_id
+                    },
+                    limit=1
+                )
+                comm_identity = comm_identities[0] if comm_identities else None
 
-                    # Get or create conversation
-                    conversations = SupabaseQuery.select_active(
-                        client=db,
-                        table='conversations',
-                        filters={
-                            'person_id': person['person_id'],
-                            'channel_type': 'slack',
-                            'external_thread_id': channel
-                        },
-                        limit=1
+                # Only serve pre-registered clients - ignore unregistered users
+                if not comm_identity:
+                    logger.info(
+                        "Message from unregistered Slack user - ignoring (only pre-registered clients are served)",
+                        user_id=user_id,
+                        channel=channel,
+                        text_preview=clean_text[:50]
                     )
-                    conversation = conversations[0] if conversations else None
-
-                    if conversation:
-                        logger.info("Found existing conversation",
-                                   conversation_id=conversation['conversation_id'],
-                                   person_id=person['person_id'])
-                    else:
-                        logger.info("Creating new conversation",
-                                   person_id=person['person_id'],
-                                   channel=channel)
-                        conversation_data = {
-                            'conversation_id': str(uuid4()),
-                            'org_id': person['org_id'],
-                            'person_id': person['person_id'],
-                            'channel_type': 'slack',
-                            'external_thread_id': channel,
-                            'status': 'active',
-                            'created_at': datetime.utcnow().isoformat(),
-                            'updated_at': datetime.utcnow().isoformat()
-                        }
-                        conversation = SupabaseQuery.insert(db, 'conversations', conversation_data)
-
-                    # Save inbound message
-                    inbound_msg_data = {
-                        'message_id': str(uuid4()),
-                        'org_id': person['org_id'],
-                        'conversation_id': conversation['conversation_id'],
-                        'direction': 'inbound',
-                        'sender_person_id': person['person_id'],
-                        'content_text': clean_text,
-                        'external_message_id': event.get('ts'),
-                        'created_at': datetime.utcnow().isoformat()
-                    }
-                    inbound_msg = SupabaseQuery.insert(db, 'messages', inbound_msg_data)
-
-                    # Build context and process with orchestrator
-                    context_builder = ContextBuilder(db)
-                    context = context_builder.build_context(person['person_id'], conversation['conversation_id'])
-
-                    orchestrator = OrchestratorAgent(db)
-                    ai_response = orchestrator.process_message(
-                        user_message=clean_text,
-                        person=person,
-                        conversation=conversation,
-                        context=context
+                    return
+
+                # Person and conversation lookups are independent once the
+                # comm_identity is known, so run them concurrently.
+                # Both threads share the Supabase client singleton; this is
+                # safe because get_supabase_client() builds the PostgREST
+                # sub-client eagerly, and each .table() call returns its
+                # own request builder.
+                person_future = _lookup_executor.submit(
+                    SupabaseQuery.get_by_id,
+                    client=db,
+                    table='persons',
+                    id_column='person_id',
+                    id_value=comm_identity['person_id']
+                )
+                conversations_future = _lookup_executor.submit(
+                    SupabaseQuery.select_active,
+                    client=db,
+                    table='conversations',
+                    filters={
+                        'person_id': comm_identity['person_id'],
+                        'channel_type': 'slack',
+                        'external_thread_id': channel
+                    },
+                    limit=1
+                )
+                person = person_future.result()
+                if not person:
+                    conversations_future.cancel()
+                    logger.info(
+                        "Comm identity points at a missing or deleted person - ignoring",
+                        user_id=user_id,
+                        person_id=comm_identity['person_id'],
+                        channel=channel
                     )
+                    return
 
-                    # Save outbound message
-                    outbound_msg_data = {
-                        'message_id': str(uuid4()),
+                conversations = conversations_future.result()
+                conversation = conversations[0] if conversations else None
+
+                if conversation:
+                    logger.info("Found existing conversation",
+                               conversation_id=conversation['conversation_id'],
+                               person_id=person['person_id'])
+                else:
+                    logger.info("Creating new conversation",
+                               person_id=person['person_id'],
+                               channel=channel)
+                    conversation_data = {
+                        'conversation_id': str(uuid4()),
                         'org_id': person['org_id'],
-                        'conversation_id': conversation['conversation_id'],
-                        'direction': 'outbound',
-                        'agent_name': 'orchestrator',
-                        'content_text': ai_response,
-                        'created_at': datetime.utcnow().isoformat()
+                        'person_id': person['person_id'],
+                        'channel_type': 'slack',
+                        'external_thread_id': channel,
+                        'status': 'active',
                     }
-                    outbound_msg = SupabaseQuery.insert(db, 'messages', outbound_msg_data)
+                    conversation = SupabaseQuery.insert(db, 'conversations', conversation_data)
+
+                # Save inbound message
+                inbound_msg_data = {
+                    'org_id': person['org_id'],
+                    'conversation_id': conversation['conversation_id'],
+                    'direction': 'inbound',
+                    'sender_person_id': person['person_id'],
+                    'content_text': clean_text,
+                    'external_message_id': event.get('ts'),
+                }
+                inbound_msg = SupabaseQuery.insert(db, 'messages', inbound_msg_data)
+
+                # Build context and process with orchestrator
+                context_builder, orchestrator = _get_message_agents(db)
+                context = context_builder.build_context(person['person_id'], conversation['conversation_id'])
+
+                ai_response = orchestrator.process_message(
+                    user_message=clean_text,
+                    person=person,
+                    conversation=conversation,
+                    context=context
+                )
 
-                    # Send response AS the Athena Concierge user
-                    self._send_as_user(channel, ai_response)
+                # Save outbound message
+                outbound_msg_data = {
+                    'org_id': person['org_id'],
+                    'conversation_id': conversation['conversation_id'],
+                    'direction': 'outbound',
+                    'agent_name': 'orchestrator',
+                    'content_text': ai_response,
+                }
+                outbound_msg = SupabaseQuery.insert(db, 'messages', outbound_msg_data)
 
-                    logger.info("Sent response as Athena Concierge user",
-                               channel=channel,
-                               response_length=len(ai_response))
+                # Send response AS the Athena Concierge user
+                self._send_as_user(channel, ai_response)
+
+                logger.info("Sent response as Athena Concierge user",
+                           channel=channel,
+                           response_length=len(ai_response))
 
             except Exception as e:
                 logger.error("Error handling Slack message",
@@ -323,15 +384,19 @@ class SlackUserIntegration:
     def _send_as_user(self, channel: str, text: str, thread_ts: str = None):
         """Send a message as the Athena Concierge user"""
         try:
+            # The user token alone determines the author; the legacy
+            # as_user flag is not needed and only adds Slack-side validation
             kwargs = {
                 "channel": channel,
-                "text": text,
-                "as_user": True  # Important: Send as the authenticated user
+                "text": text
             }
             if thread_ts:
                 kwargs["thread_ts"] = thread_ts
 
             response = self.user_client.chat_postMessage(**kwargs)
+            logger.debug("Posted Slack message",
+                         channel=channel,
+                         posted_by=response.get("message", {}).get("user"))
             return response
         except Exception as e:
             logger.error("Failed to send message as user", error=str(e), exc_info=True)
@@ -369,6 +434,9 @@ class SlackUserIntegration:
         """
         Get or open a DM channel with a Slack user.
 
+        Channel IDs are cached per process, so conversations.open is called
+        once per user.
+
         Args:
             slack_user_id: Slack user ID (e.g., U1234567890)
 
@@ -378,6 +446,9 @@ class SlackUserIntegration:
         Raises:
             Exception: If DM channel cannot be opened
         """
+        if slack_user_id in _dm_channels:
+            return _dm_channels[slack_user_id]
+
         if not self.user_client:
             raise RuntimeError("Slack user client not initialized")
 
@@ -389,6 +460,7 @@ class SlackUserIntegration:
                 raise RuntimeError(f"Failed to open DM channel: {response.get('error')}")
 
             dm_channel_id = response['channel']['id']
+            _dm_channels[slack_user_id] = dm_channel_id
             logger.debug(
                 "Opened Slack DM channel",
                 slack_user_id=slack_user_id,
@@ -1,11 +1,13 @@
 """AI agent infrastructure models"""
 
 from uuid import uuid4
-from sqlalchemy import Column, String, ForeignKey, UUID, Text, JSON, Integer, DateTime
+from uuid6 import uuid7
+from sqlalchemy import Column, String, ForeignKey, UUID, Text, Integer, DateTime
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from pgvector.sqlalchemy import Vector
 from app.database import Base
-from app.models.base import TimestampMixin, SoftDeleteMixin, OrgScopedMixin
+from app.models.base import SoftDeleteMixin, OrgScopedMixin, created_at_column, updated_at_column
 
 
 class AgentRoster(Base):
@@ -19,32 +21,33 @@ class AgentRoster(Base):
     agent_kind = Column(String(50), nullable=False)  # interaction, execution
     status = Column(String(50), default="active", index=True)  # active, paused, archived
     system_prompt = Column(Text, nullable=False)
-    context_jsonb = Column(JSON, default={})  # Agent-specific configuration
+    context_jsonb = Column(JSONB, default=dict)  # Agent-specific configuration
     version = Column(Integer, default=1)
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
-    execution_logs = relationship("AgentExecutionLog", back_populates="agent")
+    execution_logs = relationship("AgentExecutionLog", back_populates="agent", lazy="raise_on_sql")
 
 
 class AgentExecutionLog(Base):
     """Complete audit trail of agent decisions"""
 
     __tablename__ = "agent_execution_logs"
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}  # Monthly, see migration 006
 
-    log_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    log_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     agent_id = Column(UUID(as_uuid=True), ForeignKey("agent_roster.agent_id"), nullable=False)
     run_id = Column(UUID(as_uuid=True), nullable=False, index=True)  # Groups related messages
     turn_index = Column(Integer, nullable=False)  # Order within conversation
     conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.conversation_id"), index=True)
     person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"))
-    payload_jsonb = Column(JSON, nullable=False)  # Full request/response
+    payload_jsonb = Column(JSONB, nullable=False)  # Full request/response
     execution_time_ms = Column(Integer)
     tokens_used = Column(Integer)
-    created_at = Column(DateTime, nullable=False, default=TimestampMixin.created_at.default.arg, index=True)
+    created_at = created_at_column(primary_key=True)
 
     # Relationships
     agent = relationship("AgentRoster", back_populates="execution_logs")
@@ -55,16 +58,15 @@ class Embedding(Base):
 
     __tablename__ = "embeddings"
 
-    embedding_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    embedding_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     entity_type = Column(String(50), nullable=False, index=True)  # person, project, message, recommendation, preference
     entity_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    # Note: embedding_vector uses pgvector extension type - will be handled by raw SQL
-    # embedding_vector = Column(Vector(1536))  # Requires pgvector extension
+    embedding_vector = Column(Vector(1536))  # pgvector, HNSW-indexed (cosine)
     content_text = Column(Text, nullable=False)
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
 
 
 class WorkingMemory(Base):
@@ -72,14 +74,14 @@ class WorkingMemory(Base):
 
     __tablename__ = "working_memory"
 
-    memory_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    memory_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.conversation_id"), nullable=False, index=True)
     memory_key = Column(String(255), nullable=False)
-    memory_value_jsonb = Column(JSON, nullable=False)
-    expires_at = Column(DateTime, nullable=False, index=True)
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    memory_value_jsonb = Column(JSONB, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
 
     # Relationships
     conversation = relationship("Conversation", back_populates="working_memories")
@@ -1,22 +1,36 @@
-"""Base model classes and mixins"""
+"""Base model classes and mixins
+
+JSONB columns are plain (not change-tracked): replace the whole value to
+update it. Only columns edited in place wrap the type in MutableDict, and
+defaults are always the dict/list factories, never a shared {} or [].
+"""
 
-from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import Column, DateTime, UUID
+from sqlalchemy import Column, DateTime, UUID, func
 from sqlalchemy.ext.declarative import declared_attr
 
 
+def created_at_column(**kwargs) -> Column:
+    """created_at stamped by the database clock (DEFAULT NOW())"""
+    return Column(DateTime(timezone=True), nullable=False, server_default=func.now(), **kwargs)
+
+
+def updated_at_column() -> Column:
+    """updated_at stamped by the database; the update_updated_at_column trigger bumps it"""
+    return Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+
 class TimestampMixin:
     """Adds created_at and updated_at timestamps"""
 
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
 
 
 class SoftDeleteMixin:
     """Adds soft delete functionality"""
 
-    deleted_at = Column(DateTime, nullable=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     @property
     def is_deleted(self):
@@ -1,16 +1,22 @@
 """Communication infrastructure models"""
 
 from uuid import uuid4
-from sqlalchemy import Column, String, Boolean, ForeignKey, UUID, DateTime, Text, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Boolean, ForeignKey, UUID, DateTime, Text, Index, text, func
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import JSONB
 from app.database import Base
-from app.models.base import TimestampMixin, SoftDeleteMixin, OrgScopedMixin
+from app.models.base import SoftDeleteMixin, OrgScopedMixin, created_at_column, updated_at_column
 
 
 class CommIdentity(Base):
     """Maps persons to communication channels"""
 
     __tablename__ = "comm_identities"
+    __table_args__ = (
+        # Slack/email sender lookup: equality only, so a hash index (see migration 019)
+        Index('idx_comm_identities_channel', 'identity_value', postgresql_using='hash',
+              postgresql_where=text('deleted_at IS NULL')),
+    )
 
     comm_identity_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
@@ -19,10 +25,10 @@ class CommIdentity(Base):
     identity_value = Column(String(500), nullable=False)
     is_primary = Column(Boolean, default=False)
     is_verified = Column(Boolean, default=False)
-    verified_at = Column(DateTime)
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    verified_at = Column(DateTime(timezone=True))
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
@@ -40,33 +46,41 @@ class CommConsent(Base):
     person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"), nullable=False, index=True)
     channel_type = Column(String(50), nullable=False)
     consent_given = Column(Boolean, nullable=False, default=True)
-    consent_date = Column(DateTime, nullable=False, default=TimestampMixin.created_at.default.arg)
-    expires_at = Column(DateTime)
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    consent_date = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    expires_at = Column(DateTime(timezone=True))
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
 
 
 class Conversation(Base):
     """Conversation threads"""
 
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Thread lookup for inbound messages: equality only, so a hash index (see migration 019)
+        Index('idx_conversations_external', 'external_thread_id', postgresql_using='hash',
+              postgresql_where=text('deleted_at IS NULL')),
+        # Recent conversations per person (see migration 015)
+        Index('idx_conversations_person', 'person_id', text('updated_at DESC'),
+              postgresql_where=text('deleted_at IS NULL')),
+    )
 
     conversation_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"), nullable=False, index=True)
+    person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"), nullable=False)
     channel_type = Column(String(50), nullable=False)
-    external_thread_id = Column(String(500), index=True)  # Slack thread_ts, email Message-ID
+    external_thread_id = Column(String(500))  # Slack thread_ts, email Message-ID
     subject = Column(String(500))
     status = Column(String(50), default="active")  # active, closed, archived
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
     person = relationship("Person", back_populates="conversations")
-    messages = relationship("Message", back_populates="conversation")
+    messages = relationship("Message", back_populates="conversation", lazy="raise_on_sql")
     working_memories = relationship("WorkingMemory", back_populates="conversation")
 
 
@@ -74,18 +88,28 @@ class Message(Base):
     """Individual messages within conversations"""
 
     __tablename__ = "messages"
-
-    message_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    __table_args__ = (
+        # Message history per conversation; message_id included for counts (see migrations 015, 021)
+        Index('idx_messages_conversation', 'conversation_id', text('created_at DESC'),
+              postgresql_include=['message_id'],
+              postgresql_where=text('deleted_at IS NULL')),
+        # Append-only, time-ordered: BRIN instead of btree (see migration 017)
+        Index('idx_messages_created_brin', 'created_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
+    )
+
+    message_id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.conversation_id"), nullable=False, index=True)
+    conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.conversation_id"), nullable=False)
     direction = Column(String(20), nullable=False)  # inbound, outbound
     sender_person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"))
     agent_name = Column(String(100))  # Which AI agent generated this
-    content_text = Column(Text, nullable=False)
-    content_html = Column(Text)
+    # Bodies can be whole emails; load them only where they are rendered
+    content_text = deferred(Column(Text, nullable=False))
+    content_html = deferred(Column(Text))
     external_message_id = Column(String(500))
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(DateTime, nullable=False, default=TimestampMixin.created_at.default.arg, index=True)
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
@@ -1,10 +1,10 @@
 """Date and reminder models"""
 
-from uuid import uuid4
-from sqlalchemy import Column, String, ForeignKey, UUID, Date, Text, JSON, Integer, DateTime
+from sqlalchemy import Column, String, ForeignKey, UUID, Date, Text, Integer, DateTime, Index, text
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
 from app.database import Base
-from app.models.base import TimestampMixin, SoftDeleteMixin, OrgScopedMixin
+from app.models.base import SoftDeleteMixin, OrgScopedMixin, created_at_column, updated_at_column
 
 
 class DateCategory(Base):
@@ -12,14 +12,14 @@ class DateCategory(Base):
 
     __tablename__ = "date_categories"
 
-    category_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    category_id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     category_name = Column(String(255), nullable=False)
     icon = Column(String(50))
     color = Column(String(50))
-    schema_jsonb = Column(JSON, default={})  # Category-specific fields
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    schema_jsonb = Column(JSONB, default=dict)  # Category-specific fields
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
@@ -30,44 +30,75 @@ class DateItem(Base):
     """Important dates"""
 
     __tablename__ = "date_items"
+    __table_args__ = (
+        # Upcoming dates per person (see migration 015)
+        Index('idx_date_items_person', 'person_id', 'next_occurrence',
+              postgresql_where=text('deleted_at IS NULL')),
+    )
 
-    date_item_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    date_item_id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"), nullable=False, index=True)
+    person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"), nullable=False)
     category_id = Column(UUID(as_uuid=True), ForeignKey("date_categories.category_id"), nullable=False)
     title = Column(String(255), nullable=False)
     date_value = Column(Date, nullable=False)
     recurrence_rule = Column(Text)  # iCal RRULE format
     next_occurrence = Column(Date, index=True)  # Computed field
     notes = Column(Text)
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
     person = relationship("Person", back_populates="date_items")
-    category = relationship("DateCategory", back_populates="date_items")
+    # Every reader of a date item shows its category name; join it in the same SELECT
+    category = relationship("DateCategory", back_populates="date_items", lazy="joined")
     reminder_rules = relationship("ReminderRule", back_populates="date_item")
     projects = relationship("Project", back_populates="source_date_item")
+    occurrences = relationship("DateItemOccurrence", back_populates="date_item", lazy="raise_on_sql")
+
+
+class DateItemOccurrence(Base):
+    """Materialized occurrences of a date item (recurrence expanded ahead of time)"""
+
+    __tablename__ = "date_item_occurrences"
+    __table_args__ = (
+        Index('idx_date_item_occurrences_org', 'org_id', 'occurs_on'),
+        Index('idx_date_item_occurrences_person', 'person_id', 'occurs_on'),
+    )
+
+    date_item_id = Column(UUID(as_uuid=True), ForeignKey("date_items.date_item_id", ondelete="CASCADE"), primary_key=True)
+    org_id = Column(UUID(as_uuid=True), nullable=False)
+    person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"), nullable=False)
+    occurs_on = Column(Date, primary_key=True)
+
+    # Relationships
+    date_item = relationship("DateItem", back_populates="occurrences")
 
 
 class ReminderRule(Base):
     """Reminder rules (when/how to notify)"""
 
     __tablename__ = "reminder_rules"
-
-    reminder_rule_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    __table_args__ = (
+        # Reminder scan: due and unsent; lead_time rules keep scheduled_datetime
+        # in step with next_occurrence (see date_occurrences.refresh_lead_time_reminders)
+        Index('idx_reminder_rules_pending', 'scheduled_datetime',
+              postgresql_where=text('sent_at IS NULL AND deleted_at IS NULL')),
+    )
+
+    reminder_rule_id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     date_item_id = Column(UUID(as_uuid=True), ForeignKey("date_items.date_item_id"), nullable=False, index=True)
     comm_identity_id = Column(UUID(as_uuid=True), ForeignKey("comm_identities.comm_identity_id"), nullable=False)
     reminder_type = Column(String(50), nullable=False)  # lead_time, scheduled
     lead_time_days = Column(Integer)  # For lead_time type
-    scheduled_datetime = Column(DateTime, index=True)  # For scheduled type
-    sent_at = Column(DateTime)  # Tracks delivery
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    scheduled_datetime = Column(DateTime(timezone=True))  # When to send (derived from next_occurrence for lead_time)
+    sent_at = Column(DateTime(timezone=True))  # Tracks delivery
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
@@ -1,10 +1,11 @@
 """Household and address models"""
 
 from uuid import uuid4
-from sqlalchemy import Column, String, Boolean, ForeignKey, UUID, Date, JSON
+from sqlalchemy import Column, String, Boolean, ForeignKey, UUID, Date, Computed
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
 from app.database import Base
-from app.models.base import TimestampMixin, SoftDeleteMixin, OrgScopedMixin
+from app.models.base import SoftDeleteMixin, OrgScopedMixin, created_at_column, updated_at_column
 
 
 class Household(Base):
@@ -16,9 +17,9 @@ class Household(Base):
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     household_name = Column(String(255), nullable=False)
     household_type = Column(String(100))  # Primary Residence, Vacation Home, etc.
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
@@ -39,8 +40,8 @@ class HouseholdMember(Base):
     is_primary = Column(Boolean, default=False)
     moved_in_date = Column(Date)
     moved_out_date = Column(Date)
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
@@ -58,10 +59,14 @@ class Address(Base):
     household_id = Column(UUID(as_uuid=True), ForeignKey("households.household_id"), index=True)
     person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"), index=True)
     label = Column(String(100))  # Primary, Billing, Shipping
-    address_jsonb = Column(JSON, nullable=False)  # {street, city, state, postal_code, country}
+    address_jsonb = Column(JSONB, nullable=False)  # {street, city, state, postal_code, country}
+    # Generated from address_jsonb so filters hit plain btrees (see migration 011)
+    city = Column(String(100), Computed("address_jsonb ->> 'city'", persisted=True), index=True)
+    state = Column(String(50), Computed("address_jsonb ->> 'state'", persisted=True), index=True)
+    postal_code = Column(String(20), Computed("address_jsonb ->> 'postal_code'", persisted=True), index=True)
     is_primary = Column(Boolean, default=False)
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
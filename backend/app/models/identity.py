@@ -1,10 +1,12 @@
 """Identity and multi-tenancy models"""
 
 from uuid import uuid4
-from sqlalchemy import Column, String, Boolean, ForeignKey, UUID, Date, JSON
+from sqlalchemy import Column, String, Boolean, ForeignKey, UUID, Date, Index, text
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableDict
 from app.database import Base
-from app.models.base import TimestampMixin, SoftDeleteMixin, OrgScopedMixin
+from app.models.base import SoftDeleteMixin, OrgScopedMixin, created_at_column, updated_at_column
 
 
 class Organization(Base):
@@ -15,14 +17,14 @@ class Organization(Base):
     org_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String(255), nullable=False)
     domain = Column(String(255))
-    settings_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    settings_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
     accounts = relationship("Account", back_populates="organization")
-    persons = relationship("Person", back_populates="organization")
+    persons = relationship("Person", back_populates="organization", lazy="raise_on_sql")
 
 
 class Account(Base):
@@ -37,9 +39,9 @@ class Account(Base):
     full_name = Column(String(255), nullable=False)
     account_type = Column(String(50), nullable=False)  # admin, concierge, analyst
     is_active = Column(Boolean, default=True)
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
@@ -52,6 +54,12 @@ class Person(Base):
     """Universal person table (clients, family members, staff)"""
 
     __tablename__ = "persons"
+    __table_args__ = (
+        # @> containment filters (see migration 009)
+        Index('idx_persons_metadata', 'metadata_jsonb', postgresql_using='gin',
+              postgresql_ops={'metadata_jsonb': 'jsonb_path_ops'},
+              postgresql_where=text('deleted_at IS NULL')),
+    )
 
     person_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     org_id = Column(UUID(as_uuid=True), ForeignKey("organizations.org_id"), nullable=False, index=True)
@@ -60,15 +68,16 @@ class Person(Base):
     preferred_name = Column(String(100))
     birthday = Column(Date)
     timezone = Column(String(50), default="America/New_York")
-    metadata_jsonb = Column(JSON, default={})  # Flexible preferences
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    # Flexible preferences; the proactive agent edits nested keys in place, so track mutations
+    metadata_jsonb = Column(MutableDict.as_mutable(JSONB), default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
     organization = relationship("Organization", back_populates="persons")
     comm_identities = relationship("CommIdentity", back_populates="person")
-    conversations = relationship("Conversation", back_populates="person")
-    date_items = relationship("DateItem", back_populates="person")
+    conversations = relationship("Conversation", back_populates="person", lazy="raise_on_sql")
+    date_items = relationship("DateItem", back_populates="person", lazy="raise_on_sql")
     projects = relationship("Project", back_populates="person")
     household_members = relationship("HouseholdMember", back_populates="person")
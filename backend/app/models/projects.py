@@ -1,20 +1,34 @@
 """Project and task models"""
 
 from uuid import uuid4
-from sqlalchemy import Column, String, ForeignKey, UUID, Date, Text, JSON, Integer, DateTime
+from sqlalchemy import Column, String, ForeignKey, UUID, Date, Text, Integer, DateTime, Index, text
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
 from app.database import Base
-from app.models.base import TimestampMixin, SoftDeleteMixin, OrgScopedMixin
+from app.models.base import SoftDeleteMixin, OrgScopedMixin, created_at_column, updated_at_column
 
 
 class Project(Base):
     """High-level concierge requests"""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        # @> containment filters (see migration 009)
+        Index('idx_projects_metadata', 'metadata_jsonb', postgresql_using='gin',
+              postgresql_ops={'metadata_jsonb': 'jsonb_path_ops'},
+              postgresql_where=text('deleted_at IS NULL')),
+        # Context/dashboard project lists (see migration 015)
+        Index('idx_projects_person', 'person_id', 'status', 'priority',
+              postgresql_where=text('deleted_at IS NULL')),
+        # Index-only dashboard project list (see migration 021)
+        Index('idx_projects_person_list', 'person_id', 'priority', text('created_at DESC'),
+              postgresql_include=['project_id', 'title', 'status', 'due_date'],
+              postgresql_where=text('deleted_at IS NULL')),
+    )
 
     project_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"), nullable=False, index=True)
+    person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"), nullable=False)
     assigned_to_account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.account_id"), index=True)
     source_date_item_id = Column(UUID(as_uuid=True), ForeignKey("date_items.date_item_id"), index=True)
     title = Column(String(500), nullable=False)
@@ -22,10 +36,10 @@ class Project(Base):
     priority = Column(Integer, default=3)  # 1=highest, 4=lowest
     status = Column(String(50), default="new", index=True)  # new, in_progress, blocked, completed, cancelled
     due_date = Column(Date)
-    completed_at = Column(DateTime)
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    completed_at = Column(DateTime(timezone=True))
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
@@ -34,7 +48,7 @@ class Project(Base):
     source_date_item = relationship("DateItem", back_populates="projects")
     details = relationship("ProjectDetail", back_populates="project")
     tasks = relationship("Task", back_populates="project")
-    recommendations = relationship("Recommendation", back_populates="project")
+    recommendations = relationship("Recommendation", back_populates="project", lazy="raise_on_sql")
 
 
 class ProjectDetail(Base):
@@ -46,9 +60,9 @@ class ProjectDetail(Base):
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.project_id"), nullable=False, index=True)
     detail_type = Column(String(100), nullable=False)
-    content_jsonb = Column(JSON, nullable=False)
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    content_jsonb = Column(JSONB, nullable=False)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
 
     # Relationships
     project = relationship("Project", back_populates="details")
@@ -58,21 +72,27 @@ class Task(Base):
     """Subtasks within projects"""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Ordered task list; status included for dashboard progress (see migration 021)
+        Index('idx_tasks_project', 'project_id', 'sort_order',
+              postgresql_include=['status'],
+              postgresql_where=text('deleted_at IS NULL')),
+    )
 
     task_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.project_id"), nullable=False, index=True)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.project_id"), nullable=False)
     parent_id = Column(UUID(as_uuid=True), ForeignKey("tasks.task_id"), index=True)
     assigned_to_account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.account_id"), index=True)
     title = Column(String(500), nullable=False)
     description = Column(Text)
     status = Column(String(50), default="todo")  # todo, doing, blocked, done, cancelled
     due_date = Column(Date)
-    completed_at = Column(DateTime)
-    sort_order = Column(Integer, default=0, index=True)
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    completed_at = Column(DateTime(timezone=True))
+    sort_order = Column(Integer, default=0)
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
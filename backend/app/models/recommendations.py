@@ -2,36 +2,65 @@
 
 from uuid import uuid4
 from decimal import Decimal
-from sqlalchemy import Column, String, ForeignKey, UUID, Text, JSON, Integer, DateTime, Numeric
+from sqlalchemy import Column, String, Boolean, ForeignKey, UUID, Text, Integer, DateTime, Numeric, Index, text, Computed, UniqueConstraint
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from app.database import Base
-from app.models.base import TimestampMixin, SoftDeleteMixin, OrgScopedMixin
+from app.models.base import SoftDeleteMixin, OrgScopedMixin, created_at_column, updated_at_column
 
 
 class Vendor(Base):
     """Vetted service providers"""
 
     __tablename__ = "vendors"
+    __table_args__ = (
+        # @> containment filters (see migration 009)
+        Index('idx_vendors_tags', 'tags_jsonb', postgresql_using='gin',
+              postgresql_ops={'tags_jsonb': 'jsonb_path_ops'},
+              postgresql_where=text('deleted_at IS NULL')),
+        # Vendor browsing by type within an org (see migration 015)
+        Index('idx_vendors_org_type', 'org_id', 'vendor_type',
+              postgresql_where=text('deleted_at IS NULL')),
+        # Full-text search on name + description (see migration 018)
+        Index('idx_vendors_search', 'search_vector', postgresql_using='gin',
+              postgresql_where=text('deleted_at IS NULL')),
+    )
 
     vendor_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    org_id = Column(UUID(as_uuid=True), nullable=False)
     name = Column(String(255), nullable=False)
     vendor_type = Column(String(100), nullable=False, index=True)  # florist, caterer, photographer
     description = Column(Text)
     rating = Column(Numeric(2, 1))  # 1.0-5.0
     price_band = Column(String(10))  # $, $$, $$$, $$$$
-    contact_info_jsonb = Column(JSON)
-    tags_jsonb = Column(JSON, default=[])
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    contact_info_jsonb = Column(JSONB)
+    tags_jsonb = Column(JSONB, default=list)
+    metadata_jsonb = Column(JSONB, default=dict)
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+        persisted=True
+    ))
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
+    # Relationships
+    tags = relationship("Tag", secondary="vendor_tags", viewonly=True, lazy="raise_on_sql")
+
 
 class Venue(Base):
     """Event spaces"""
 
     __tablename__ = "venues"
+    __table_args__ = (
+        # @> containment filters (see migration 009)
+        Index('idx_venues_tags', 'tags_jsonb', postgresql_using='gin',
+              postgresql_ops={'tags_jsonb': 'jsonb_path_ops'},
+              postgresql_where=text('deleted_at IS NULL')),
+        # Scalar ->> filters need btree expression indexes (see migration 010)
+        Index('idx_venues_neighborhood', text("(location_jsonb ->> 'neighborhood')"),
+              postgresql_where=text('deleted_at IS NULL')),
+    )
 
     venue_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
@@ -41,20 +70,40 @@ class Venue(Base):
     capacity_min = Column(Integer, index=True)
     capacity_max = Column(Integer, index=True)
     price_band = Column(String(10))
-    location_jsonb = Column(JSON)  # {neighborhood, city, state}
-    private_rooms_jsonb = Column(JSON, default=[])
-    contact_info_jsonb = Column(JSON)
-    tags_jsonb = Column(JSON, default=[])
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    location_jsonb = Column(JSONB)  # {neighborhood, city, state}
+    # Generated from location_jsonb so filters hit plain btrees (see migration 011)
+    city = Column(String(100), Computed("location_jsonb ->> 'city'", persisted=True), index=True)
+    state = Column(String(50), Computed("location_jsonb ->> 'state'", persisted=True), index=True)
+    private_rooms_jsonb = Column(JSONB, default=list)
+    # Largest private_rooms_jsonb[].capacity, for "seats N privately" filters (see migration 012)
+    max_private_room_capacity = Column(Integer, Computed("jsonb_max_room_capacity(private_rooms_jsonb)", persisted=True), index=True)
+    contact_info_jsonb = Column(JSONB)
+    tags_jsonb = Column(JSONB, default=list)
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
+    # Relationships
+    tags = relationship("Tag", secondary="venue_tags", viewonly=True, lazy="raise_on_sql")
+
 
 class Restaurant(Base):
     """Dining recommendations"""
 
     __tablename__ = "restaurants"
+    __table_args__ = (
+        # @> containment filters (see migration 009)
+        Index('idx_restaurants_tags', 'tags_jsonb', postgresql_using='gin',
+              postgresql_ops={'tags_jsonb': 'jsonb_path_ops'},
+              postgresql_where=text('deleted_at IS NULL')),
+        # "Private dining for N guests" lookups (see migration 012)
+        Index('idx_restaurants_private_dining', 'private_dining_capacity',
+              postgresql_where=text('private_dining_available AND deleted_at IS NULL')),
+        # Full-text search on name + description (see migration 018)
+        Index('idx_restaurants_search', 'search_vector', postgresql_using='gin',
+              postgresql_where=text('deleted_at IS NULL')),
+    )
 
     restaurant_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
@@ -64,19 +113,40 @@ class Restaurant(Base):
     description = Column(Text)
     rating = Column(Numeric(2, 1))
     price_band = Column(String(10))
-    private_dining_jsonb = Column(JSON)  # {available, capacity, pricing}
-    contact_info_jsonb = Column(JSON)
-    tags_jsonb = Column(JSON, default=[])
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    private_dining_jsonb = Column(JSONB)  # {available, capacity, pricing}
+    # Generated from private_dining_jsonb (see migration 012)
+    private_dining_available = Column(Boolean, Computed("(private_dining_jsonb ->> 'available')::boolean", persisted=True))
+    private_dining_capacity = Column(Integer, Computed("(private_dining_jsonb ->> 'capacity')::integer", persisted=True))
+    contact_info_jsonb = Column(JSONB)
+    tags_jsonb = Column(JSONB, default=list)
+    metadata_jsonb = Column(JSONB, default=dict)
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+        persisted=True
+    ))
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
+    # Relationships
+    tags = relationship("Tag", secondary="restaurant_tags", viewonly=True, lazy="raise_on_sql")
+
 
 class Product(Base):
     """Gift ideas and shopping recommendations"""
 
     __tablename__ = "products"
+    __table_args__ = (
+        # @> containment filters (see migration 009)
+        Index('idx_products_tags', 'tags_jsonb', postgresql_using='gin',
+              postgresql_ops={'tags_jsonb': 'jsonb_path_ops'},
+              postgresql_where=text('deleted_at IS NULL')),
+        # Budget range filters (see migration 010)
+        Index('idx_products_price', 'price', postgresql_where=text('deleted_at IS NULL')),
+        # Full-text search on name + description (see migration 018)
+        Index('idx_products_search', 'search_vector', postgresql_using='gin',
+              postgresql_where=text('deleted_at IS NULL')),
+    )
 
     product_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
@@ -88,29 +158,112 @@ class Product(Base):
     price_band = Column(String(10))
     url = Column(Text)
     image_url = Column(Text)
-    tags_jsonb = Column(JSON, default=[])
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    tags_jsonb = Column(JSONB, default=list)
+    metadata_jsonb = Column(JSONB, default=dict)
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+        persisted=True
+    ))
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
+    # Relationships
+    tags = relationship("Tag", secondary="product_tags", viewonly=True, lazy="raise_on_sql")
+
+
+class Tag(Base):
+    """Normalized tag names, maintained from tags_jsonb by a trigger (see migration 022)"""
+
+    __tablename__ = "tags"
+    __table_args__ = (
+        UniqueConstraint('org_id', 'name'),
+    )
+
+    tag_id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    org_id = Column(UUID(as_uuid=True), ForeignKey("organizations.org_id"), nullable=False)
+    name = Column(Text, nullable=False)
+    created_at = created_at_column()
+
+
+class VendorTag(Base):
+    """Vendor <-> tag link rows"""
+
+    __tablename__ = "vendor_tags"
+    __table_args__ = (
+        Index('idx_vendor_tags_tag', 'tag_id', 'vendor_id'),
+    )
+
+    vendor_id = Column(UUID(as_uuid=True), ForeignKey("vendors.vendor_id", ondelete="CASCADE"), primary_key=True)
+    tag_id = Column(UUID(as_uuid=True), ForeignKey("tags.tag_id", ondelete="CASCADE"), primary_key=True)
+
+
+class VenueTag(Base):
+    """Venue <-> tag link rows"""
+
+    __tablename__ = "venue_tags"
+    __table_args__ = (
+        Index('idx_venue_tags_tag', 'tag_id', 'venue_id'),
+    )
+
+    venue_id = Column(UUID(as_uuid=True), ForeignKey("venues.venue_id", ondelete="CASCADE"), primary_key=True)
+    tag_id = Column(UUID(as_uuid=True), ForeignKey("tags.tag_id", ondelete="CASCADE"), primary_key=True)
+
+
+class RestaurantTag(Base):
+    """Restaurant <-> tag link rows"""
+
+    __tablename__ = "restaurant_tags"
+    __table_args__ = (
+        Index('idx_restaurant_tags_tag', 'tag_id', 'restaurant_id'),
+    )
+
+    restaurant_id = Column(UUID(as_uuid=True), ForeignKey("restaurants.restaurant_id", ondelete="CASCADE"), primary_key=True)
+    tag_id = Column(UUID(as_uuid=True), ForeignKey("tags.tag_id", ondelete="CASCADE"), primary_key=True)
+
+
+class ProductTag(Base):
+    """Product <-> tag link rows"""
+
+    __tablename__ = "product_tags"
+    __table_args__ = (
+        Index('idx_product_tags_tag', 'tag_id', 'product_id'),
+    )
+
+    product_id = Column(UUID(as_uuid=True), ForeignKey("products.product_id", ondelete="CASCADE"), primary_key=True)
+    tag_id = Column(UUID(as_uuid=True), ForeignKey("tags.tag_id", ondelete="CASCADE"), primary_key=True)
+
 
 class Recommendation(Base):
     """AI-generated recommendations"""
 
     __tablename__ = "recommendations"
+    __table_args__ = (
+        # Latest recommendations per project (see migration 015)
+        Index('idx_recommendations_project', 'project_id', text('created_at DESC'),
+              postgresql_where=text('deleted_at IS NULL')),
+        # item_id is polymorphic; one partial index per item_type (see migration 020)
+        Index('idx_recommendations_vendor_item', 'item_id',
+              postgresql_where=text("item_type = 'vendor' AND deleted_at IS NULL")),
+        Index('idx_recommendations_venue_item', 'item_id',
+              postgresql_where=text("item_type = 'venue' AND deleted_at IS NULL")),
+        Index('idx_recommendations_restaurant_item', 'item_id',
+              postgresql_where=text("item_type = 'restaurant' AND deleted_at IS NULL")),
+        Index('idx_recommendations_product_item', 'item_id',
+              postgresql_where=text("item_type = 'product' AND deleted_at IS NULL")),
+    )
 
-    recommendation_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    recommendation_id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.project_id"), nullable=False, index=True)
-    item_type = Column(String(50), nullable=False, index=True)  # vendor, venue, restaurant, product
-    item_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.project_id"), nullable=False)
+    item_type = Column(String(50), nullable=False)  # vendor, venue, restaurant, product
+    item_id = Column(UUID(as_uuid=True), nullable=False)
     rationale_text = Column(Text)  # Why this was recommended
     score = Column(Numeric(3, 2))  # Relevance 0-1
-    shown_at = Column(DateTime)
-    metadata_jsonb = Column(JSON, default={})
-    created_at = Column(TimestampMixin.created_at.type, nullable=False, default=TimestampMixin.created_at.default.arg)
-    updated_at = Column(TimestampMixin.updated_at.type, nullable=False, default=TimestampMixin.updated_at.default.arg)
+    shown_at = Column(DateTime(timezone=True))
+    metadata_jsonb = Column(JSONB, default=dict)
+    created_at = created_at_column()
+    updated_at = updated_at_column()
     deleted_at = Column(SoftDeleteMixin.deleted_at.type)
 
     # Relationships
@@ -122,14 +275,19 @@ class InteractionFeedback(Base):
     """Client feedback on recommendations"""
 
     __tablename__ = "interaction_feedback"
+    __table_args__ = (
+        # Append-only, time-ordered: BRIN instead of btree (see migration 017)
+        Index('idx_interaction_feedback_created_brin', 'created_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
+    )
 
-    feedback_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    feedback_id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     org_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     recommendation_id = Column(UUID(as_uuid=True), ForeignKey("recommendations.recommendation_id"), nullable=False, index=True)
     person_id = Column(UUID(as_uuid=True), ForeignKey("persons.person_id"), nullable=False, index=True)
     feedback_type = Column(String(50), nullable=False)  # liked, disliked, used, ignored
     feedback_text = Column(Text)
-    created_at = Column(DateTime, nullable=False, default=TimestampMixin.created_at.default.arg)
+    created_at = created_at_column()
 
     # Relationships
     recommendation = relationship("Recommendation", back_populates="feedback")
@@ -1,5 +1,8 @@
 """Context builder for assembling comprehensive client context for agents"""
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import threading
 from uuid import UUID
 from supabase import Client
 from datetime import datetime, timedelta
@@ -8,12 +11,19 @@ from app.utils.supabase_helpers import SupabaseQuery
 
 logger = structlog.get_logger()
 
+# Shared pool for the per-section lookups of build_context (two builds' worth)
+_section_executor = ThreadPoolExecutor(max_workers=12, thread_name_prefix="context")
+
 
 class ContextBuilder:
     """Builds comprehensive context for AI agents"""
 
     def __init__(self, db: Client):
         self.db = db
+        # Person rows fetched during the current build_context call; the
+        # profile and preferences sections share one fetch
+        self._person_cache: dict = {}
+        self._person_lock = threading.Lock()
 
     def build_context(self, person_id: UUID, conversation_id: UUID | None = None) -> dict:
         """
@@ -27,25 +37,39 @@ class ContextBuilder:
         - Active projects
         - Past recommendations and feedback
         """
-        context = {
-            "person": self._get_person_profile(person_id),
-            "households": self._get_households(person_id),
-            "recent_conversations": self._get_recent_conversations(person_id, conversation_id),
-            "upcoming_dates": self._get_upcoming_dates(person_id),
-            "active_projects": self._get_active_projects(person_id),
-            "preferences": self._get_preferences(person_id),
+        self._person_cache = {}
+
+        # The sections are independent PostgREST round trips; run them concurrently
+        futures = {
+            "person": _section_executor.submit(self._get_person_profile, person_id),
+            "households": _section_executor.submit(self._get_households, person_id),
+            "recent_conversations": _section_executor.submit(
+                self._get_recent_conversations, person_id, conversation_id
+            ),
+            "upcoming_dates": _section_executor.submit(self._get_upcoming_dates, person_id),
+            "active_projects": _section_executor.submit(self._get_active_projects, person_id),
+            "preferences": _section_executor.submit(self._get_preferences, person_id),
         }
 
-        return context
+        return {section: future.result() for section, future in futures.items()}
+
+    def _fetch_person(self, person_id: UUID) -> dict | None:
+        """Person row, fetched at most once per build_context call"""
+        key = str(person_id)
+        with self._person_lock:
+            if key not in self._person_cache:
+                self._person_cache[key] = SupabaseQuery.get_by_id(
+                    client=self.db,
+                    table='persons',
+                    id_column='person_id',
+                    id_value=person_id,
+                    columns='person_id,full_name,preferred_name,person_type,timezone,metadata_jsonb'
+                )
+            return self._person_cache[key]
 
     def _get_person_profile(self, person_id: UUID) -> dict:
         """Get person profile with basic information"""
-        person = SupabaseQuery.get_by_id(
-            client=self.db,
-            table='persons',
-            id_column='person_id',
-            id_value=person_id
-        )
+        person = self._fetch_person(person_id)
 
         if not person:
             return {}
@@ -60,31 +84,42 @@ class ContextBuilder:
         }
 
     def _get_households(self, person_id: UUID) -> list:
-        """Get household memberships and addresses"""
+        """Get household memberships and addresses (three queries regardless of membership count)"""
         memberships = SupabaseQuery.select_active(
             client=self.db,
             table='household_members',
+            columns='household_id,relationship_to_primary',
             filters={'person_id': str(person_id)}
         )
 
-        households = []
-        for membership in memberships:
-            # Fetch household for this membership
-            household = SupabaseQuery.get_by_id(
+        if not memberships:
+            return []
+
+        household_ids = list({m['household_id'] for m in memberships})
+        households_by_id = {
+            h['household_id']: h
+            for h in SupabaseQuery.select_active(
                 client=self.db,
                 table='households',
-                id_column='household_id',
-                id_value=membership['household_id']
+                columns='household_id,household_name,household_type',
+                filters={'household_id': household_ids}
             )
+        }
 
-            if household:
-                # Fetch addresses for this household
-                addresses = SupabaseQuery.select_active(
-                    client=self.db,
-                    table='addresses',
-                    filters={'household_id': membership['household_id']}
-                )
+        addresses_by_household = defaultdict(list)
+        for addr in SupabaseQuery.select_active(
+            client=self.db,
+            table='addresses',
+            columns='household_id,label,address_jsonb',
+            filters={'household_id': household_ids}
+        ):
+            addresses_by_household[addr['household_id']].append(addr)
 
+        households = []
+        for membership in memberships:
+            household = households_by_id.get(membership['household_id'])
+
+            if household:
                 households.append({
                     "household_name": household.get('household_name'),
                     "household_type": household.get('household_type'),
@@ -94,7 +129,7 @@ class ContextBuilder:
                             "label": addr.get('label'),
                             "address": addr.get('address_jsonb')
                         }
-                        for addr in addresses
+                        for addr in addresses_by_household[membership['household_id']]
                     ]
                 })
 
@@ -103,35 +138,29 @@ class ContextBuilder:
     def _get_recent_conversations(self, person_id: UUID, current_conversation_id: UUID | None = None) -> list:
         """Get recent conversation history (sliding window)"""
         # Get last 3 conversations (excluding current)
-        # Note: Supabase doesn't support != filter, so we'll fetch and filter in Python
-        all_conversations = SupabaseQuery.select_active(
+        recent_conversations = SupabaseQuery.select_active(
             client=self.db,
             table='conversations',
+            columns='conversation_id,subject,channel_type,updated_at',
             filters={'person_id': str(person_id)},
+            exclude={'conversation_id': str(current_conversation_id)} if current_conversation_id else None,
             order_by='updated_at.desc',
-            limit=10  # Fetch a few extra to account for filtering
+            limit=3
         )
 
-        # Filter out current conversation if needed
-        if current_conversation_id:
-            recent_conversations = [
-                conv for conv in all_conversations
-                if conv['conversation_id'] != str(current_conversation_id)
-            ][:3]
-        else:
-            recent_conversations = all_conversations[:3]
+        # Last 5 messages of every recent conversation in one call
+        # (window function, see migrations 023/025); rows arrive oldest first
+        messages_by_conversation = defaultdict(list)
+        if recent_conversations:
+            for msg in self.db.rpc('recent_conversation_messages', {
+                'p_conversation_ids': [conv['conversation_id'] for conv in recent_conversations],
+                'p_per_conversation': 5
+            }).execute().data or []:
+                messages_by_conversation[msg['conversation_id']].append(msg)
 
         conversations = []
         for conv in recent_conversations:
-            # Get last 5 messages from each conversation
-            # Note: We need to order desc and then reverse
-            messages = SupabaseQuery.select_active(
-                client=self.db,
-                table='messages',
-                filters={'conversation_id': conv['conversation_id']},
-                order_by='created_at.desc',
-                limit=5
-            )
+            messages = messages_by_conversation[conv['conversation_id']]
 
             conversations.append({
                 "conversation_id": str(conv['conversation_id']),
@@ -144,7 +173,7 @@ class ContextBuilder:
                         "content": msg.get('content_text'),
                         "created_at": msg.get('created_at')
                     }
-                    for msg in reversed(messages)
+                    for msg in messages
                 ]
             })
 
@@ -153,6 +182,7 @@ class ContextBuilder:
             current_messages = SupabaseQuery.select_active(
                 client=self.db,
                 table='messages',
+                columns='direction,content_text,created_at',
                 filters={'conversation_id': str(current_conversation_id)},
                 order_by='created_at.asc'
             )
@@ -176,55 +206,51 @@ class ContextBuilder:
 
     def _get_upcoming_dates(self, person_id: UUID, days_ahead: int = 90) -> list:
         """Get upcoming important dates"""
-        cutoff_date = (datetime.now().date() + timedelta(days=days_ahead)).isoformat()
-
-        # Note: Complex filtering (<=) needs to be done via Supabase query builder
-        # For now, fetch all date items and filter in Python
-        date_items = SupabaseQuery.select_active(
-            client=self.db,
-            table='date_items',
-            filters={'person_id': str(person_id)},
-            order_by='next_occurrence.asc'
-        )
-
-        # Filter by cutoff date and fetch categories
-        result = []
-        for item in date_items:
-            next_occ = item.get('next_occurrence')
-            if next_occ and next_occ <= cutoff_date:
-                # Fetch category if present
-                category_name = None
-                if item.get('date_category_id'):
-                    category = SupabaseQuery.get_by_id(
-                        client=self.db,
-                        table='date_categories',
-                        id_column='date_category_id',
-                        id_value=item['date_category_id']
-                    )
-                    category_name = category.get('category_name') if category else None
-
-                result.append({
-                    "title": item.get('title'),
-                    "date": next_occ if next_occ else item.get('date_value'),
-                    "category": category_name,
-                    "notes": item.get('notes')
-                })
+        today = datetime.now().date()
+        cutoff_date = (today + timedelta(days=days_ahead)).isoformat()
+
+        # Each item's first occurrence in the window, soonest first
+        # (date_item_occurrences, see migration 028)
+        upcoming = self.db.rpc('upcoming_date_occurrences', {
+            'p_person_id': str(person_id),
+            'p_from': today.isoformat(),
+            'p_to': cutoff_date
+        }).execute().data or []
+
+        # Resolve category names with one IN query
+        category_ids = list({item['category_id'] for item in upcoming if item.get('category_id')})
+        category_names = {}
+        if category_ids:
+            category_names = {
+                c['category_id']: c.get('category_name')
+                for c in SupabaseQuery.select_active(
+                    client=self.db,
+                    table='date_categories',
+                    columns='category_id,category_name',
+                    filters={'category_id': category_ids}
+                )
+            }
 
-        return result
+        return [
+            {
+                "title": item.get('title'),
+                "date": item['occurs_on'],
+                "category": category_names.get(item.get('category_id')),
+                "notes": item.get('notes')
+            }
+            for item in upcoming
+        ]
 
     def _get_active_projects(self, person_id: UUID) -> list:
         """Get active projects"""
-        # Note: Supabase .in_() filter needs to be done via query builder or fetch & filter
-        # Fetch all projects for person and filter in Python
         projects = SupabaseQuery.select_active(
             client=self.db,
             table='projects',
-            filters={'person_id': str(person_id)},
+            columns='project_id,title,description,status,priority,due_date',
+            filters={'person_id': str(person_id), 'status': ["new", "in_progress", "blocked"]},
             order_by='priority.asc'
         )
 
-        # Filter by status and format
-        active_statuses = ["new", "in_progress", "blocked"]
         return [
             {
                 "project_id": str(proj['project_id']),
@@ -235,17 +261,11 @@ class ContextBuilder:
                 "due_date": proj.get('due_date')
             }
             for proj in projects
-            if proj.get('status') in active_statuses
         ]
 
     def _get_preferences(self, person_id: UUID) -> dict:
         """Extract preferences from metadata and past interactions"""
-        person = SupabaseQuery.get_by_id(
-            client=self.db,
-            table='persons',
-            id_column='person_id',
-            id_value=person_id
-        )
+        person = self._fetch_person(person_id)
 
         if not person or not person.get('metadata_jsonb'):
             return {}
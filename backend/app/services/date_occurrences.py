@@ -0,0 +1,152 @@
+"""Date Occurrences Service - Materializes recurring date items into date_item_occurrences"""
+
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+from dateutil.rrule import rrulestr
+from supabase import Client
+import structlog
+
+logger = structlog.get_logger()
+
+# How far ahead recurring dates are expanded
+OCCURRENCE_HORIZON_DAYS = 730
+
+
+def expand_occurrences(
+    date_value: date,
+    recurrence_rule: Optional[str] = None,
+    start: Optional[date] = None,
+    horizon_days: int = OCCURRENCE_HORIZON_DAYS
+) -> List[date]:
+    """
+    Expand a date item into its concrete occurrence dates
+
+    Args:
+        date_value: First occurrence of the date item
+        recurrence_rule: iCal RRULE (e.g. "FREQ=YEARLY"), None for one-off dates
+        start: Earliest occurrence to return (default: today)
+        horizon_days: How many days past start (or date_value, if later) to expand
+
+    Returns:
+        Sorted occurrence dates. One-off dates are returned as-is, even if past.
+
+    Raises:
+        ValueError: If recurrence_rule is not a valid RRULE
+    """
+    if not recurrence_rule:
+        return [date_value]
+
+    start = start or date.today()
+    rule = rrulestr(recurrence_rule, dtstart=datetime.combine(date_value, datetime.min.time()))
+    # Items starting in the future get a full horizon from their first date
+    window_start = datetime.combine(max(start, date_value), datetime.min.time())
+    window_end = window_start + timedelta(days=horizon_days)
+    return [occurrence.date() for occurrence in rule.between(window_start, window_end, inc=True)]
+
+
+def lead_time_trigger(occurs_on: str, lead_time_days: int) -> str:
+    """scheduled_datetime for a lead_time reminder: lead_time_days before occurs_on"""
+    return (datetime.fromisoformat(occurs_on) - timedelta(days=lead_time_days)).isoformat()
+
+
+def replace_occurrences(db: Client, date_item_id: str, occurrences: List[date]) -> Optional[str]:
+    """
+    Replace the stored occurrences of a date item and its next_occurrence
+
+    Both are written in one transaction by replace_date_item_occurrences
+    (migration 028).
+
+    Args:
+        db: Supabase client
+        date_item_id: Date item ID
+        occurrences: Dates from expand_occurrences()
+
+    Returns:
+        The new next_occurrence (first occurrence) as an ISO date, or None if
+        the rule has no occurrences left
+    """
+    next_occurrence = occurrences[0].isoformat() if occurrences else None
+    db.rpc('replace_date_item_occurrences', {
+        'p_date_item_id': str(date_item_id),
+        'p_occurs_on': [occurrence.isoformat() for occurrence in occurrences],
+        'p_next_occurrence': next_occurrence
+    }).execute()
+
+    logger.debug(
+        "Refreshed date item occurrences",
+        date_item_id=str(date_item_id),
+        count=len(occurrences)
+    )
+    return next_occurrence
+
+
+def roll_occurrences(db: Client, today: Optional[date] = None, batch_size: int = 100) -> int:
+    """
+    Re-expand recurring date items whose next_occurrence has passed
+
+    Moves next_occurrence on to the next upcoming date and extends the
+    expansion horizon from today. Also picks up recurring items that were
+    created before occurrences were materialized.
+
+    Args:
+        db: Supabase client
+        today: Expansion start (default: today)
+        batch_size: Max items re-expanded per call
+
+    Returns:
+        Number of date items re-expanded
+    """
+    today = today or date.today()
+    due = db.rpc('date_items_due_for_expansion', {
+        'p_today': today.isoformat(),
+        'p_limit': batch_size
+    }).execute().data or []
+
+    rolled = 0
+    for date_item in due:
+        try:
+            occurrences = expand_occurrences(
+                date.fromisoformat(date_item['date_value']), date_item['recurrence_rule'], start=today
+            )
+        except ValueError as e:
+            logger.warning(
+                "Skipping date item with invalid recurrence rule",
+                date_item_id=str(date_item['date_item_id']),
+                error=str(e)
+            )
+            continue
+
+        date_item['next_occurrence'] = replace_occurrences(db, date_item['date_item_id'], occurrences)
+        refresh_lead_time_reminders(db, date_item)
+        rolled += 1
+
+    if rolled:
+        logger.info("Rolled date item occurrences forward", count=rolled)
+    return rolled
+
+
+def refresh_lead_time_reminders(db: Client, date_item: dict) -> None:
+    """
+    Re-derive scheduled_datetime for a date item's unsent lead_time reminders
+
+    scheduled_datetime is what the reminder scan polls on, so it has to
+    follow next_occurrence when the date item is rescheduled. Issues one
+    update per distinct lead_time_days.
+
+    Args:
+        db: Supabase client
+        date_item: Date item record (needs date_item_id, next_occurrence)
+    """
+    if not date_item.get('next_occurrence'):
+        return
+
+    pending = db.table('reminder_rules').select('lead_time_days').eq(
+        'date_item_id', str(date_item['date_item_id'])
+    ).eq('reminder_type', 'lead_time').is_('sent_at', 'null').is_('deleted_at', 'null').execute().data
+
+    for lead_time_days in {r['lead_time_days'] for r in pending if r.get('lead_time_days')}:
+        db.table('reminder_rules').update({
+            'scheduled_datetime': lead_time_trigger(date_item['next_occurrence'], lead_time_days)
+        }).eq('date_item_id', str(date_item['date_item_id'])).eq(
+            'reminder_type', 'lead_time'
+        ).eq('lead_time_days', lead_time_days).is_('sent_at', 'null').is_('deleted_at', 'null').execute()
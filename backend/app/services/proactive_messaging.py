@@ -1,10 +1,10 @@
 """Proactive Messaging Service - Centralized service for sending proactive messages"""
 
-from uuid import uuid4, UUID
-from datetime import datetime
+from uuid import UUID
 from supabase import Client
 import structlog
 
+from app.integrations.ses import ses_integration
 from app.utils.supabase_helpers import SupabaseQuery
 
 logger = structlog.get_logger()
@@ -18,6 +18,12 @@ class ProactiveMessagingService:
 
     def __init__(self, db: Client):
         self.db = db
+        # channel_type -> sender; every sender takes the same keyword arguments
+        self._senders = {
+            'slack': self._send_via_slack,
+            'email': self._send_via_email,
+            'sms': self._send_via_sms,
+        }
 
     def send_to_person(
         self,
@@ -25,7 +31,9 @@ class ProactiveMessagingService:
         message_text: str,
         agent_name: str = "system",
         channel_type: str = "slack",
-        subject: str = None
+        subject: str = None,
+        person: dict | None = None,
+        comm_identity: dict | None = None
     ) -> dict:
         """
         Send a proactive message to a person via their preferred channel.
@@ -36,6 +44,9 @@ class ProactiveMessagingService:
             agent_name: Name of the agent sending the message
             channel_type: Channel type (slack, email, sms)
             subject: Optional subject/conversation label
+            person: Person record if the caller already has it (skips the lookup)
+            comm_identity: Identity to deliver to, if the caller already
+                resolved it (default: the person's first identity on channel_type)
 
         Returns:
             dict: Message record that was created
@@ -52,33 +63,35 @@ class ProactiveMessagingService:
         )
 
         # Get person
-        person = SupabaseQuery.get_by_id(
-            client=self.db,
-            table='persons',
-            id_column='person_id',
-            id_value=person_id_str
-        )
+        if person is None:
+            person = SupabaseQuery.get_by_id(
+                client=self.db,
+                table='persons',
+                id_column='person_id',
+                id_value=person_id_str
+            )
 
         if not person:
             raise ValueError(f"Person not found: {person_id_str}")
 
         # Get person's comm identity for the specified channel
-        comm_identities = SupabaseQuery.select_active(
-            client=self.db,
-            table='comm_identities',
-            filters={
-                'person_id': person_id_str,
-                'channel_type': channel_type
-            },
-            limit=1
-        )
-
-        if not comm_identities:
-            raise ValueError(
-                f"No {channel_type} identity found for person {person_id_str}"
+        if comm_identity is None:
+            comm_identities = SupabaseQuery.select_active(
+                client=self.db,
+                table='comm_identities',
+                filters={
+                    'person_id': person_id_str,
+                    'channel_type': channel_type
+                },
+                limit=1
             )
 
-        comm_identity = comm_identities[0]
+            if not comm_identities:
+                raise ValueError(
+                    f"No {channel_type} identity found for person {person_id_str}"
+                )
+
+            comm_identity = comm_identities[0]
 
         # Get or create conversation for proactive messages
         conversation = self._get_or_create_conversation(
@@ -90,33 +103,22 @@ class ProactiveMessagingService:
 
         # Save message to database
         message_data = {
-            'message_id': str(uuid4()),
             'org_id': person['org_id'],
             'conversation_id': conversation['conversation_id'],
             'direction': 'outbound',
             'agent_name': agent_name,
             'content_text': message_text,
-            'created_at': datetime.utcnow().isoformat()
         }
         message = SupabaseQuery.insert(self.db, 'messages', message_data)
 
         # Send via appropriate channel
-        if channel_type == 'slack':
-            self._send_via_slack(
+        sender = self._senders.get(channel_type)
+        if sender:
+            sender(
                 identity_value=comm_identity['identity_value'],
                 conversation=conversation,
-                message_text=message_text
-            )
-        elif channel_type == 'email':
-            self._send_via_email(
-                identity_value=comm_identity['identity_value'],
                 message_text=message_text,
-                subject=subject or "Message from Athena Concierge"
-            )
-        elif channel_type == 'sms':
-            self._send_via_sms(
-                identity_value=comm_identity['identity_value'],
-                message_text=message_text
+                subject=subject
             )
         else:
             logger.warning(
@@ -139,60 +141,29 @@ class ProactiveMessagingService:
         identity_value: str,
         subject: str = None
     ) -> dict:
-        """Get existing conversation or create new one for proactive messages"""
-
-        # For Slack, look up conversation by external_thread_id (the DM channel)
-        # For other channels, look up by person_id and channel_type
-        if channel_type == 'slack':
-            # Get Slack DM channel ID
-            dm_channel = self._get_slack_dm_channel(identity_value)
-
-            # Find conversation by DM channel
-            conversations = SupabaseQuery.select_active(
-                client=self.db,
-                table='conversations',
-                filters={
-                    'person_id': person['person_id'],
-                    'channel_type': channel_type,
-                    'external_thread_id': dm_channel
-                },
-                limit=1
-            )
-        else:
-            # For email/sms, find by person and channel type
-            conversations = SupabaseQuery.select_active(
-                client=self.db,
-                table='conversations',
-                filters={
-                    'person_id': person['person_id'],
-                    'channel_type': channel_type
-                },
-                limit=1
-            )
-
-        if conversations:
-            logger.debug(
-                "Found existing conversation",
-                conversation_id=conversations[0]['conversation_id']
-            )
-            return conversations[0]
+        """
+        Get existing conversation or create new one for proactive messages
 
-        # Create new conversation
-        conversation_data = {
-            'conversation_id': str(uuid4()),
-            'org_id': person['org_id'],
-            'person_id': person['person_id'],
-            'channel_type': channel_type,
-            'external_thread_id': dm_channel if channel_type == 'slack' else None,
-            'subject': subject or 'Athena Concierge',
-            'status': 'active',
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat()
-        }
-        conversation = SupabaseQuery.insert(self.db, 'conversations', conversation_data)
+        Slack conversations are keyed by the DM channel (external_thread_id);
+        email/sms reuse any live conversation on that channel. Lookup and
+        insert happen in one RPC that serializes concurrent callers
+        (see migration 024).
+        """
+        external_thread_id = (
+            self._get_slack_dm_channel(identity_value) if channel_type == 'slack' else None
+        )
 
-        logger.info(
-            "Created new conversation for proactive messaging",
+        rows = self.db.rpc('get_or_create_conversation', {
+            'p_org_id': str(person['org_id']),
+            'p_person_id': str(person['person_id']),
+            'p_channel_type': channel_type,
+            'p_external_thread_id': external_thread_id,
+            'p_subject': subject or 'Athena Concierge'
+        }).execute().data
+        conversation = rows[0]
+
+        logger.debug(
+            "Resolved conversation for proactive messaging",
             conversation_id=conversation['conversation_id'],
             person_id=person['person_id']
         )
@@ -210,7 +181,8 @@ class ProactiveMessagingService:
             str: DM channel ID (e.g., D1234567890)
         """
         try:
-            # Import here to avoid circular dependency
+            # Deferred: importing slack_user constructs the integration,
+            # which calls auth.test against Slack
             from app.integrations.slack_user import slack_user_integration
 
             return slack_user_integration.get_dm_channel(slack_user_id)
@@ -228,11 +200,12 @@ class ProactiveMessagingService:
         self,
         identity_value: str,
         conversation: dict,
-        message_text: str
+        message_text: str,
+        subject: str = None
     ):
         """Send message via Slack"""
         try:
-            # Import here to avoid circular dependency
+            # Deferred for the same reason as in _get_slack_dm_channel
             from app.integrations.slack_user import slack_user_integration
 
             # Get DM channel (should be in conversation's external_thread_id)
@@ -262,15 +235,19 @@ class ProactiveMessagingService:
             )
             raise
 
-    def _send_via_email(self, identity_value: str, message_text: str, subject: str):
+    def _send_via_email(
+        self,
+        identity_value: str,
+        conversation: dict,
+        message_text: str,
+        subject: str = None
+    ):
         """Send message via email (SES)"""
         try:
-            from app.integrations.ses import send_email
-
-            send_email(
-                to_email=identity_value,
-                subject=subject,
-                body=message_text
+            ses_integration.send_email(
+                to_address=identity_value,
+                subject=subject or "Message from Athena Concierge",
+                body_text=message_text
             )
 
             logger.debug("Sent email message", to_email=identity_value)
@@ -284,7 +261,13 @@ class ProactiveMessagingService:
             )
             raise
 
-    def _send_via_sms(self, identity_value: str, message_text: str):
+    def _send_via_sms(
+        self,
+        identity_value: str,
+        conversation: dict,
+        message_text: str,
+        subject: str = None
+    ):
         """Send message via SMS (future implementation)"""
         logger.warning(
             "SMS sending not yet implemented",
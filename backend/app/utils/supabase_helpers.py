@@ -1,10 +1,55 @@
 """Supabase query helper functions"""
 
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from functools import lru_cache, wraps
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from datetime import datetime, timezone
 from uuid import UUID
+import threading
+import time
+from fastapi import HTTPException, status
+from postgrest.exceptions import APIError
 from supabase import Client
 
+# Comparison operators accepted by SupabaseQuery.select_active(range_filters=...)
+_RANGE_OPS = frozenset({'lt', 'lte', 'gt', 'gte'})
+
+# Near-static lookup tables whose get_by_id results are cached in-process
+# (table -> TTL seconds). update()/soft_delete() through SupabaseQuery evict
+# immediately; other processes see changes within the TTL.
+_CACHED_TABLE_TTLS = {
+    'date_categories': 300,
+    'organizations': 300,
+}
+_row_cache: Dict[Tuple[str, str, str, str], Tuple[float, Dict]] = {}
+_row_cache_lock = threading.Lock()
+
+
+def _utcnow_iso() -> str:
+    """Current time as an offset-aware UTC ISO 8601 string"""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _as_id(value: Union[str, UUID]) -> str:
+    """ID value as the string PostgREST filters take; str IDs pass through"""
+    return value if value.__class__ is str else str(value)
+
+
+@lru_cache(maxsize=256)
+def _order_spec(order_by: str) -> Tuple[str, bool]:
+    """Parse "column" / "column.asc" / "column.desc" into (column, desc)"""
+    parts = order_by.split('.')
+    return parts[0], len(parts) > 1 and parts[1] == 'desc'
+
+
+def _evict_cached_row(table: str, id_column: str, id_value: Any) -> None:
+    """Drop every cached projection of one row"""
+    if table not in _CACHED_TABLE_TTLS:
+        return
+    row_key = (table, id_column, _as_id(id_value))
+    with _row_cache_lock:
+        for key in [k for k in _row_cache if k[:3] == row_key]:
+            del _row_cache[key]
+
 
 def to_dict(data: Any) -> Dict:
     """Convert Supabase response data to dict"""
@@ -13,33 +58,44 @@ def to_dict(data: Any) -> Dict:
     return data
 
 
+def _clean_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert UUIDs to strings and drop None values"""
+    return {
+        key: str(value) if type(value) is UUID else value
+        for key, value in data.items()
+        if value is not None
+    }
+
+
 def handle_supabase_error(func):
     """Decorator to handle Supabase API errors"""
-    from functools import wraps
-    from fastapi import HTTPException, status
-
     @wraps(func)
     async def wrapper(*args, **kwargs):
         try:
             return await func(*args, **kwargs)
-        except Exception as e:
-            # Parse Supabase error
-            error_msg = str(e)
-            if 'PGRST116' in error_msg or 'not found' in error_msg.lower():
+        except APIError as e:
+            # PostgREST errors carry their PGRST code; Postgres errors (e.g.
+            # constraint violations) carry a SQLSTATE and fall through to 500
+            code = e.code or ''
+            if code == 'PGRST116':
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Resource not found"
                 )
-            elif 'PGRST' in error_msg:
+            if code.startswith('PGRST'):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Database error: {error_msg}"
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Internal server error: {error_msg}"
+                    detail=f"Database error: {e.message}"
                 )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Internal server error: {e.message}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Internal server error: {e}"
+            )
     return wrapper
 
 
@@ -54,7 +110,9 @@ class SupabaseQuery:
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        exclude: Optional[Dict[str, Any]] = None,
+        range_filters: Optional[List[Tuple[str, str, Any]]] = None
     ) -> List[Dict]:
         """
         Select records excluding soft-deleted items
@@ -63,7 +121,11 @@ class SupabaseQuery:
             client: Supabase client
             table: Table name
             columns: Columns to select (default: *)
-            filters: Dict of column: value filters
+            filters: Dict of column: value filters (list/tuple/set values
+                filter with IN)
+            exclude: Dict of column: value pairs that must not match (!=)
+            range_filters: (column, op, value) comparisons, op one of
+                lt, lte, gt, gte
             order_by: Column to order by
             limit: Max records to return
             offset: Number of records to skip
@@ -75,15 +137,25 @@ class SupabaseQuery:
 
         if filters:
             for key, value in filters.items():
+                if isinstance(value, (list, tuple, set)):
+                    query = query.in_(key, [str(v) if isinstance(v, UUID) else v for v in value])
+                    continue
                 if isinstance(value, UUID):
                     value = str(value)
                 query = query.eq(key, value)
 
+        if exclude:
+            for key, value in exclude.items():
+                query = query.neq(key, str(value) if isinstance(value, UUID) else value)
+
+        if range_filters:
+            for key, op, value in range_filters:
+                if op not in _RANGE_OPS:
+                    raise ValueError(f"Unsupported range filter operator: {op}")
+                query = getattr(query, op)(key, value)
+
         if order_by:
-            # Parse order_by string (e.g., "column.desc" or "column.asc")
-            parts = order_by.split('.')
-            column = parts[0]
-            desc = len(parts) > 1 and parts[1] == 'desc'
+            column, desc = _order_spec(order_by)
             query = query.order(column, desc=desc)
 
         if limit:
@@ -92,20 +164,62 @@ class SupabaseQuery:
         if offset:
             query = query.range(offset, offset + limit - 1) if limit else query.offset(offset)
 
-        response = query.execute()
-        return response.data if response.data else []
+        return query.execute().data or []
+
+    @staticmethod
+    def select_active_iter(
+        client: Client,
+        table: str,
+        order_by: str,
+        columns: str = "*",
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = 500
+    ) -> Iterator[Dict]:
+        """
+        Yield active records page by page instead of loading them all
+
+        Args:
+            client: Supabase client
+            table: Table name
+            order_by: Column to page by; must give a stable order (e.g. the
+                primary key)
+            columns: Columns to select (default: *)
+            filters: Same as select_active()
+            page_size: Rows per PostgREST request
+
+        Yields:
+            Records, one page in memory at a time
+        """
+        offset = 0
+        while True:
+            page = SupabaseQuery.select_active(
+                client=client,
+                table=table,
+                columns=columns,
+                filters=filters,
+                order_by=order_by,
+                limit=page_size,
+                offset=offset
+            )
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
 
     @staticmethod
     def get_by_id(
         client: Client,
         table: str,
-        id_value: UUID,
+        id_value: Union[str, UUID],
         id_column: str = 'id',
         columns: str = "*"
     ) -> Optional[Dict]:
         """
         Get single record by ID (excluding soft-deleted)
 
+        Rows of the tables in _CACHED_TABLE_TTLS are served from an
+        in-process cache for their TTL.
+
         Args:
             client: Supabase client
             table: Table name
@@ -116,11 +230,26 @@ class SupabaseQuery:
         Returns:
             Record dict or None
         """
+        id_value = _as_id(id_value)
+        ttl = _CACHED_TABLE_TTLS.get(table)
+        cache_key = (table, id_column, id_value, columns)
+        if ttl:
+            with _row_cache_lock:
+                cached = _row_cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return dict(cached[1])
+
         response = client.table(table).select(columns).eq(
-            id_column, str(id_value)
+            id_column, id_value
         ).is_('deleted_at', 'null').execute()
 
-        return response.data[0] if response.data else None
+        data = response.data
+        row = data[0] if data else None
+        # Misses are not cached: the row may be created moments later
+        if ttl and row:
+            with _row_cache_lock:
+                _row_cache[cache_key] = (time.monotonic() + ttl, dict(row))
+        return row
 
     @staticmethod
     def insert(
@@ -139,24 +268,49 @@ class SupabaseQuery:
         Returns:
             Inserted record
         """
-        # Convert UUIDs to strings
-        clean_data = {}
-        for key, value in data.items():
-            if isinstance(value, UUID):
-                clean_data[key] = str(value)
-            elif value is None:
-                continue  # Skip None values
-            else:
-                clean_data[key] = value
+        clean_data = _clean_row(data)
 
         response = client.table(table).insert(clean_data).execute()
-        return response.data[0] if response.data else {}
+        data = response.data
+        return data[0] if data else {}
+
+    @staticmethod
+    def bulk_insert(
+        client: Client,
+        table: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int = 1000
+    ) -> List[Dict]:
+        """
+        Insert many records with one request per batch
+
+        Args:
+            client: Supabase client
+            table: Table name
+            rows: Record data, cleaned the same way as insert()
+            batch_size: Max rows per PostgREST request
+
+        Returns:
+            Inserted records
+        """
+        clean_rows = [_clean_row(row) for row in rows]
+
+        inserted = []
+        for start in range(0, len(clean_rows), batch_size):
+            # Rows may omit different None-valued keys; missing columns take
+            # their DB default rather than NULL
+            response = client.table(table).insert(
+                clean_rows[start:start + batch_size],
+                default_to_null=False
+            ).execute()
+            inserted.extend(response.data or [])
+        return inserted
 
     @staticmethod
     def update(
         client: Client,
         table: str,
-        id_value: UUID,
+        id_value: Union[str, UUID],
         data: Dict[str, Any],
         id_column: str = 'id'
     ) -> Optional[Dict]:
@@ -173,28 +327,23 @@ class SupabaseQuery:
         Returns:
             Updated record or None
         """
-        # Convert UUIDs to strings
-        clean_data = {}
-        for key, value in data.items():
-            if isinstance(value, UUID):
-                clean_data[key] = str(value)
-            elif value is not None:
-                clean_data[key] = value
-
-        # Add updated_at timestamp
-        clean_data['updated_at'] = datetime.utcnow().isoformat()
+        id_value = _as_id(id_value)
+        clean_data = _clean_row(data)
 
+        # updated_at is stamped by the update_updated_at_column trigger
         response = client.table(table).update(clean_data).eq(
-            id_column, str(id_value)
+            id_column, id_value
         ).is_('deleted_at', 'null').execute()
+        _evict_cached_row(table, id_column, id_value)
 
-        return response.data[0] if response.data else None
+        data = response.data
+        return data[0] if data else None
 
     @staticmethod
     def soft_delete(
         client: Client,
         table: str,
-        id_value: UUID,
+        id_value: Union[str, UUID],
         id_column: str = 'id'
     ) -> bool:
         """
@@ -209,8 +358,10 @@ class SupabaseQuery:
         Returns:
             True if deleted, False otherwise
         """
+        id_value = _as_id(id_value)
         response = client.table(table).update({
-            'deleted_at': datetime.utcnow().isoformat()
-        }).eq(id_column, str(id_value)).is_('deleted_at', 'null').execute()
+            'deleted_at': _utcnow_iso()
+        }).eq(id_column, id_value).is_('deleted_at', 'null').execute()
+        _evict_cached_row(table, id_column, id_value)
 
-        return len(response.data) > 0 if response.data else False
+        return bool(response.data)
@@ -2,7 +2,7 @@
 
 import time
 import structlog
-from datetime import datetime
+from datetime import datetime, timezone
 from app.database import get_db_context
 from app.agents.proactive import ProactiveAgent
 from app.config import get_settings
@@ -19,9 +19,13 @@ def run_proactive_worker():
     check_interval = settings.proactive_check_interval
     logger.info("Proactive worker started", interval_seconds=check_interval)
 
+    # Scans run on a fixed grid of deadlines so the scan's own duration
+    # doesn't push every later run back
+    next_run = time.monotonic()
     while True:
+        next_run += check_interval
         try:
-            logger.info("Running proactive message scan", time=datetime.utcnow().isoformat())
+            logger.info("Running proactive message scan", time=datetime.now(timezone.utc).isoformat())
 
             with get_db_context() as db:
                 proactive_agent = ProactiveAgent(db)
@@ -32,13 +36,19 @@ def run_proactive_worker():
         except Exception as e:
             logger.error("Proactive worker error", error=str(e), exc_info=True)
 
-        # Wait before next check
+        # Wait out the rest of the interval
+        sleep_for = next_run - time.monotonic()
+        if sleep_for <= 0:
+            logger.warning("Proactive scan overran its interval", overrun_seconds=-sleep_for)
+            # Start the next run now rather than firing once per missed interval
+            next_run = time.monotonic()
+            continue
+
         logger.info(
             "Proactive worker sleeping",
-            next_run_in_seconds=check_interval
+            next_run_in_seconds=sleep_for
         )
-        time.sleep(check_interval)
-
+        time.sleep(sleep_for)
 
 if __name__ == "__main__":
     run_proactive_worker()
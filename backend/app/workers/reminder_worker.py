@@ -1,39 +1,100 @@
 """Scheduled worker for sending reminders"""
 
+import threading
 import time
 import structlog
-from datetime import datetime
+from datetime import datetime, timezone
 from app.database import get_db_context
 from app.agents.reminder import ReminderAgent
+from app.services.date_occurrences import roll_occurrences
 from app.config import get_settings
 
 logger = structlog.get_logger()
 settings = get_settings()
 
+# Set whenever a reminder is scheduled or rescheduled so the worker re-plans
+# its sleep instead of waiting out the full interval
+wakeup = threading.Event()
+
+
+def seconds_until_next_reminder(db) -> float | None:
+    """
+    Seconds until the earliest unsent reminder that is not yet due
+
+    Reminders already past due were just attempted by the scan; ones that
+    failed are retried on the regular interval rather than immediately.
+
+    Returns:
+        Seconds to wait, or None if nothing is scheduled
+    """
+    now = datetime.now(timezone.utc)
+    rows = db.table('reminder_rules').select('scheduled_datetime').is_(
+        'deleted_at', 'null'
+    ).is_('sent_at', 'null').gt('scheduled_datetime', now.isoformat()).order(
+        'scheduled_datetime'
+    ).limit(1).execute().data
+
+    if not rows:
+        return None
+
+    due = datetime.fromisoformat(rows[0]['scheduled_datetime'].replace('Z', '+00:00'))
+    if due.tzinfo is None:
+        due = due.replace(tzinfo=timezone.utc)
+    return max((due - now).total_seconds(), 0.0)
+
 
 def run_reminder_worker():
     """
-    Background worker that periodically scans for pending reminders
-    and sends them via appropriate channels.
+    Background worker that scans for pending reminders and sends them via
+    appropriate channels. Sleeps until the next reminder is due (at most
+    reminder_check_interval), or until woken by `wakeup`.
     """
+    # Settings are fixed for the life of the process; read them once
     check_interval = settings.reminder_check_interval
-    logger.info("Reminder worker started", interval_seconds=check_interval)
+    shard = settings.reminder_worker_shard
+    shard_count = settings.reminder_worker_shard_count
+    logger.info(
+        "Reminder worker started",
+        interval_seconds=check_interval,
+        shard=shard,
+        shard_count=shard_count
+    )
 
     while True:
+        # The interval counts from the start of the scan, so slow scans
+        # don't stretch the cadence
+        next_run = time.monotonic() + check_interval
+        next_due = None
         try:
-            logger.info("Running reminder scan", time=datetime.utcnow().isoformat())
+            logger.info("Running reminder scan", time=datetime.now(timezone.utc).isoformat())
 
             with get_db_context() as db:
-                reminder_agent = ReminderAgent(db)
+                reminder_agent = ReminderAgent(db, shard=shard, shard_count=shard_count)
                 reminder_agent.scan_and_send_reminders()
 
+                # Move recurring dates past their last occurrence forward;
+                # this can reschedule lead_time reminders, so it runs before
+                # planning the sleep. One shard is enough.
+                if shard == 0:
+                    roll_occurrences(db)
+
+                next_due = seconds_until_next_reminder(db)
+
             logger.info("Reminder scan completed successfully")
 
         except Exception as e:
             logger.error("Reminder worker error", error=str(e), exc_info=True)
 
-        # Wait before next check
-        time.sleep(check_interval)
+        sleep_for = next_run - time.monotonic()
+        if sleep_for <= 0:
+            logger.warning("Reminder scan overran its interval", overrun_seconds=-sleep_for)
+            sleep_for = 0
+        if next_due is not None:
+            sleep_for = min(sleep_for, next_due)
+
+        # Wait for the next due reminder or a newly scheduled one
+        wakeup.wait(timeout=sleep_for)
+        wakeup.clear()
 
 
 if __name__ == "__main__":
@@ -2,10 +2,29 @@
 
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from app.database import get_db_context
 from app.utils.supabase_helpers import SupabaseQuery
 
 BASE_URL = "http://localhost:8000"
+REQUEST_TIMEOUT = (1, 5)  # (connect, read) seconds
+
+# (label, table, row limit, row formatter or None to print only the count)
+AUDIT_TABLES = [
+    ("Organizations", 'organizations', 5,
+     lambda org: f"{org.get('org_name')} ({org.get('org_id')})"),
+    ("Persons", 'persons', 5,
+     lambda person: f"{person.get('full_name')} ({person.get('person_type')}) - {person.get('person_id')}"),
+    ("Projects", 'projects', 5,
+     lambda project: f"{project.get('title')} - {project.get('status')}"),
+    ("Conversations", 'conversations', 5, None),
+    ("Date Items", 'date_items', 5,
+     lambda item: f"{item.get('title')} - {item.get('date_value')}"),
+    ("Reminder Rules", 'reminder_rules', 5, None),
+    ("Date Categories", 'date_categories', 10,
+     lambda cat: f"{cat.get('category_name')} {cat.get('icon', '')}"),
+]
+
 
 def audit_database():
     """Check what data exists in the database"""
@@ -14,69 +33,22 @@ def audit_database():
     print("=" * 60)
 
     with get_db_context() as db:
-        # Check organizations
-        try:
-            orgs = SupabaseQuery.select_active(db, 'organizations', limit=5)
-            print(f"\n✓ Organizations: {len(orgs)} found")
-            if orgs:
-                for org in orgs:
-                    print(f"  - {org.get('org_name')} ({org.get('org_id')})")
-        except Exception as e:
-            print(f"\n✗ Organizations: Error - {e}")
-
-        # Check persons
-        try:
-            persons = SupabaseQuery.select_active(db, 'persons', limit=5)
-            print(f"\n✓ Persons: {len(persons)} found")
-            if persons:
-                for person in persons:
-                    print(f"  - {person.get('full_name')} ({person.get('person_type')}) - {person.get('person_id')}")
-        except Exception as e:
-            print(f"\n✗ Persons: Error - {e}")
-
-        # Check projects
-        try:
-            projects = SupabaseQuery.select_active(db, 'projects', limit=5)
-            print(f"\n✓ Projects: {len(projects)} found")
-            if projects:
-                for project in projects:
-                    print(f"  - {project.get('title')} - {project.get('status')}")
-        except Exception as e:
-            print(f"\n✗ Projects: Error - {e}")
-
-        # Check conversations
-        try:
-            conversations = SupabaseQuery.select_active(db, 'conversations', limit=5)
-            print(f"\n✓ Conversations: {len(conversations)} found")
-        except Exception as e:
-            print(f"\n✗ Conversations: Error - {e}")
-
-        # Check date_items
-        try:
-            date_items = SupabaseQuery.select_active(db, 'date_items', limit=5)
-            print(f"\n✓ Date Items: {len(date_items)} found")
-            if date_items:
-                for item in date_items:
-                    print(f"  - {item.get('title')} - {item.get('date_value')}")
-        except Exception as e:
-            print(f"\n✗ Date Items: Error - {e}")
-
-        # Check reminder_rules
-        try:
-            reminders = SupabaseQuery.select_active(db, 'reminder_rules', limit=5)
-            print(f"\n✓ Reminder Rules: {len(reminders)} found")
-        except Exception as e:
-            print(f"\n✗ Reminder Rules: Error - {e}")
-
-        # Check date_categories
-        try:
-            categories = SupabaseQuery.select_active(db, 'date_categories', limit=10)
-            print(f"\n✓ Date Categories: {len(categories)} found")
-            if categories:
-                for cat in categories:
-                    print(f"  - {cat.get('category_name')} {cat.get('icon', '')}")
-        except Exception as e:
-            print(f"\n✗ Date Categories: Error - {e}")
+        # The reads are independent and I/O-bound; issue them all at once
+        with ThreadPoolExecutor(max_workers=len(AUDIT_TABLES)) as executor:
+            futures = [
+                executor.submit(SupabaseQuery.select_active, db, table, limit=limit)
+                for _, table, limit, _ in AUDIT_TABLES
+            ]
+
+        for (label, _, _, formatter), future in zip(AUDIT_TABLES, futures):
+            try:
+                rows = future.result()
+                print(f"\n✓ {label}: {len(rows)} found")
+                if formatter:
+                    for row in rows:
+                        print(f"  - {formatter(row)}")
+            except Exception as e:
+                print(f"\n✗ {label}: Error - {e}")
 
 def test_api_endpoints():
     """Test existing API endpoints"""
@@ -84,54 +56,57 @@ def test_api_endpoints():
     print("API ENDPOINTS TEST")
     print("=" * 60)
 
-    # Test health endpoint
-    try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
-        print(f"\n✓ GET /health - {response.status_code}")
-        print(f"  Response: {response.json()}")
-    except Exception as e:
-        print(f"\n✗ GET /health - Error: {e}")
-
-    # Test persons API (needs org_id - will use first org from DB)
-    with get_db_context() as db:
+    # One keep-alive connection for every endpoint check
+    with requests.Session() as session:
+        # Test health endpoint
         try:
-            orgs = SupabaseQuery.select_active(db, 'organizations', limit=1)
-            if orgs:
-                org_id = orgs[0]['org_id']
-                print(f"\n Testing with org_id: {org_id}")
-
-                # Test list persons
-                response = requests.get(
-                    f"{BASE_URL}/api/v1/persons",
-                    params={'org_id': org_id},
-                    timeout=5
-                )
-                print(f"\n✓ GET /api/v1/persons - {response.status_code}")
-                persons = response.json()
-                print(f"  Found {len(persons)} persons")
-
-                # Test list projects
-                response = requests.get(
-                    f"{BASE_URL}/api/v1/projects",
-                    params={'org_id': org_id},
-                    timeout=5
-                )
-                print(f"\n✓ GET /api/v1/projects - {response.status_code}")
-                projects = response.json()
-                print(f"  Found {len(projects)} projects")
-
-                # Test list conversations
-                response = requests.get(
-                    f"{BASE_URL}/api/v1/conversations",
-                    params={'org_id': org_id},
-                    timeout=5
-                )
-                print(f"\n✓ GET /api/v1/conversations - {response.status_code}")
-                conversations = response.json()
-                print(f"  Found {len(conversations)} conversations")
-
+            response = session.get(f"{BASE_URL}/health", timeout=REQUEST_TIMEOUT)
+            print(f"\n✓ GET /health - {response.status_code}")
+            print(f"  Response: {response.json()}")
         except Exception as e:
-            print(f"\n✗ API Tests: Error - {e}")
+            print(f"\n✗ GET /health - Error: {e}")
+
+        # Test persons API (needs org_id - will use first org from DB)
+        with get_db_context() as db:
+            try:
+                orgs = SupabaseQuery.select_active(db, 'organizations', limit=1)
+                if orgs:
+                    org_id = orgs[0]['org_id']
+                    print(f"\n Testing with org_id: {org_id}")
+
+                    # Test list persons
+                    response = session.get(
+                        f"{BASE_URL}/api/v1/persons",
+                        params={'org_id': org_id},
+                        timeout=REQUEST_TIMEOUT
+                    )
+                    print(f"\n✓ GET /api/v1/persons - {response.status_code}")
+                    persons = response.json()
+                    print(f"  Found {len(persons)} persons")
+
+                    # Test list projects
+                    response = session.get(
+                        f"{BASE_URL}/api/v1/projects",
+                        params={'org_id': org_id},
+                        timeout=REQUEST_TIMEOUT
+                    )
+                    print(f"\n✓ GET /api/v1/projects - {response.status_code}")
+                    projects = response.json()
+                    print(f"  Found {len(projects)} projects")
+
+                    # Test list conversations
+                    response = session.get(
+                        f"{BASE_URL}/api/v1/conversations",
+                        params={'org_id': org_id},
+                        timeout=REQUEST_TIMEOUT
+                    )
+                    print(f"\n✓ GET /api/v1/conversations - {response.status_code}")
+                    conversations = response.json()
+                    print(f"  Found {len(conversations)} conversations")
+
+            except Exception as e:
+                print(f"\n✗ API Tests: Error - {e}")
+
 
 def document_missing_apis():
     """Document what API endpoints are missing"""
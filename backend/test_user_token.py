@@ -1,5 +1,6 @@
 """Test Slack user token authentication"""
 
+from concurrent.futures import ThreadPoolExecutor
 from slack_sdk import WebClient
 from app.config import get_settings
 import sys
@@ -16,9 +17,16 @@ if not settings.slack_user_token:
 
 print(f"\n✓ User Token: {settings.slack_user_token[:20]}...")
 
+executor = ThreadPoolExecutor(max_workers=2)
+
 try:
     client = WebClient(token=settings.slack_user_token)
+    # conversations_list doesn't depend on auth_test; start it alongside
+    channels_future = executor.submit(
+        client.conversations_list, types="public_channel,private_channel", limit=5
+    )
     auth_response = client.auth_test()
+    user_info_future = executor.submit(client.users_info, user=auth_response['user_id'])
 
     print("\n" + "=" * 60)
     print("✅ USER TOKEN AUTHENTICATION SUCCESSFUL")
@@ -35,7 +43,7 @@ try:
 
     # List channels the user has access to
     try:
-        channels = client.conversations_list(types="public_channel,private_channel", limit=5)
+        channels = channels_future.result()
         print(f"\n✓ Can list conversations: YES")
         print(f"  Found {len(channels['channels'])} channels")
         for ch in channels['channels'][:3]:
@@ -45,7 +53,7 @@ try:
 
     # Check user info access
     try:
-        user_info = client.users_info(user=auth_response['user_id'])
+        user_info = user_info_future.result()
         print(f"\n✓ Can read user info: YES")
         print(f"  Real name: {user_info['user'].get('real_name')}")
         print(f"  Email: {user_info['user'].get('profile', {}).get('email', 'N/A')}")
@@ -71,3 +79,5 @@ except Exception as e:
     import traceback
     traceback.print_exc()
     sys.exit(1)
+finally:
+    executor.shutdown(wait=False, cancel_futures=True)
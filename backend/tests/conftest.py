@@ -2,9 +2,10 @@
 
 import os
 import pytest
+from types import SimpleNamespace
 from typing import AsyncGenerator, Generator
 from unittest.mock import Mock, MagicMock, patch
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from fastapi.testclient import TestClient
 
 # Set test environment before importing app
@@ -23,71 +24,70 @@ def mock_supabase_client():
     return client
 
 
-@pytest.fixture(scope="function")
-def client() -> Generator[TestClient, None, None]:
+def _test_settings() -> MagicMock:
+    """Settings stand-in shared by the app client fixtures"""
+    settings = MagicMock()
+    settings.app_name = "AI Concierge Test"
+    settings.app_version = "1.0.0-test"
+    settings.debug = True
+    settings.frontend_url = "http://localhost:3000"
+    settings.supabase_url = "http://localhost:54321"
+    settings.supabase_service_key = "test-key"
+    settings.anthropic_api_key = "test-anthropic-key"
+    settings.slack_bot_token = None  # Disable Slack in tests
+    settings.slack_user_token = None
+    settings.slack_app_token = None
+    return settings
+
+
+@pytest.fixture(scope="session")
+def app_mocks() -> Generator[SimpleNamespace, None, None]:
     """
-    Create a FastAPI test client with minimal mocking.
-    Individual tests should add specific mocks as needed.
+    Patch settings and the Supabase client, then import the app, once per
+    session. The patches stay active until the session ends.
     """
-    # Mock database and settings at import time
     with patch("app.database.get_supabase_client") as mock_db, \
          patch("app.config.get_settings") as mock_settings:
-
-        # Configure mock settings
-        settings = MagicMock()
-        settings.app_name = "AI Concierge Test"
-        settings.app_version = "1.0.0-test"
-        settings.debug = True
-        settings.frontend_url = "http://localhost:3000"
-        settings.supabase_url = "http://localhost:54321"
-        settings.supabase_service_key = "test-key"
-        settings.anthropic_api_key = "test-anthropic-key"
-        settings.slack_bot_token = None  # Disable Slack in tests
-        settings.slack_user_token = None
-        settings.slack_app_token = None
-        mock_settings.return_value = settings
-
-        # Configure mock database
+        mock_settings.return_value = _test_settings()
         mock_db.return_value = MagicMock()
 
         # Import app after mocks are set up
         from app.main import app
 
-        # Use TestClient with raise_server_exceptions=False for cleaner test output
-        with TestClient(app, raise_server_exceptions=False) as test_client:
-            yield test_client
+        yield SimpleNamespace(app=app, db=mock_db.return_value, settings=mock_settings.return_value)
 
 
-@pytest.fixture(scope="function")
-async def async_client() -> AsyncGenerator[AsyncClient, None]:
+@pytest.fixture
+def reset_mocks(app_mocks) -> SimpleNamespace:
+    """Clear return values and calls configured on the shared mocks by earlier tests"""
+    app_mocks.db.reset_mock(return_value=True, side_effect=True)
+    return app_mocks
+
+
+@pytest.fixture(scope="session")
+def _session_client(app_mocks) -> Generator[TestClient, None, None]:
+    # Use TestClient with raise_server_exceptions=False for cleaner test output
+    with TestClient(app_mocks.app, raise_server_exceptions=False) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client(_session_client, reset_mocks) -> TestClient:
     """
-    Create an async FastAPI test client with minimal mocking.
-    Use this for testing async endpoints.
+    FastAPI test client with minimal mocking, shared across the session.
+    Individual tests should add specific mocks as needed (reset_mocks.db).
     """
-    with patch("app.database.get_supabase_client") as mock_db, \
-         patch("app.config.get_settings") as mock_settings:
+    return _session_client
 
-        # Configure mock settings
-        settings = MagicMock()
-        settings.app_name = "AI Concierge Test"
-        settings.app_version = "1.0.0-test"
-        settings.debug = True
-        settings.frontend_url = "http://localhost:3000"
-        settings.supabase_url = "http://localhost:54321"
-        settings.supabase_service_key = "test-key"
-        settings.anthropic_api_key = "test-anthropic-key"
-        settings.slack_bot_token = None
-        settings.slack_user_token = None
-        settings.slack_app_token = None
-        mock_settings.return_value = settings
-
-        # Configure mock database
-        mock_db.return_value = MagicMock()
-
-        from app.main import app
 
-        async with AsyncClient(app=app, base_url="http://test") as ac:
-            yield ac
+@pytest.fixture
+async def async_client(reset_mocks) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Async FastAPI test client on the session's app and mocks.
+    Use this for testing async endpoints.
+    """
+    async with AsyncClient(transport=ASGITransport(app=reset_mocks.app), base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture
@@ -0,0 +1,131 @@
+"""Unit tests for the agent context builder"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.context_builder import ContextBuilder
+
+
+PERSON_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+@pytest.fixture
+def query():
+    with patch("app.services.context_builder.SupabaseQuery") as query:
+        yield query
+
+
+@pytest.mark.unit
+def test_households_load_in_three_queries(query):
+    """Households and addresses are fetched with one IN query each, not per membership"""
+    rows = {
+        "household_members": [
+            {"household_id": "h1", "relationship_to_primary": "self"},
+            {"household_id": "h2", "relationship_to_primary": "child"},
+        ],
+        "households": [
+            {"household_id": "h1", "household_name": "Main"},
+            {"household_id": "h2", "household_name": "Lake"},
+        ],
+        "addresses": [
+            {"household_id": "h1", "label": "home", "address_jsonb": {"city": "NYC"}},
+            {"household_id": "h2", "label": "cabin", "address_jsonb": {"city": "Tahoe"}},
+        ],
+    }
+    query.select_active.side_effect = lambda client, table, **kwargs: rows[table]
+
+    households = ContextBuilder(MagicMock())._get_households(PERSON_ID)
+
+    assert query.select_active.call_count == 3
+    query.get_by_id.assert_not_called()
+    address_filter = query.select_active.call_args_list[2].kwargs["filters"]["household_id"]
+    assert sorted(address_filter) == ["h1", "h2"]
+    assert [h["household_name"] for h in households] == ["Main", "Lake"]
+    assert households[1]["addresses"] == [{"label": "cabin", "address": {"city": "Tahoe"}}]
+
+
+@pytest.mark.unit
+def test_recent_conversation_messages_fetched_in_one_rpc(query):
+    """Messages for all recent conversations come from a single RPC, oldest first per conversation"""
+    db = MagicMock()
+    query.select_active.return_value = [
+        {"conversation_id": "c1", "subject": "Dinner"},
+        {"conversation_id": "c2", "subject": "Travel"},
+    ]
+    db.rpc.return_value.execute.return_value.data = [
+        {"conversation_id": "c1", "direction": "inbound", "content_text": "Book it", "created_at": "1"},
+        {"conversation_id": "c1", "direction": "outbound", "content_text": "Booked", "created_at": "2"},
+    ]
+
+    conversations = ContextBuilder(db)._get_recent_conversations(PERSON_ID)
+
+    db.rpc.assert_called_once_with("recent_conversation_messages", {
+        "p_conversation_ids": ["c1", "c2"], "p_per_conversation": 5
+    })
+    assert [m["content"] for m in conversations[0]["messages"]] == ["Book it", "Booked"]
+    assert conversations[1]["messages"] == []
+
+
+@pytest.mark.unit
+def test_build_context_runs_sections_concurrently():
+    """All six sections are in flight at once rather than one after another"""
+    builder = ContextBuilder(MagicMock())
+    barrier = threading.Barrier(6, timeout=5)
+
+    def section(name):
+        def fetch(*args):
+            barrier.wait()
+            return name
+        return fetch
+
+    for method in ("_get_person_profile", "_get_households", "_get_recent_conversations",
+                   "_get_upcoming_dates", "_get_active_projects", "_get_preferences"):
+        setattr(builder, method, section(method))
+
+    context = builder.build_context(PERSON_ID)
+
+    assert context["households"] == "_get_households"
+    assert list(context) == [
+        "person", "households", "recent_conversations", "upcoming_dates", "active_projects", "preferences"
+    ]
+
+
+@pytest.mark.unit
+def test_upcoming_dates_read_from_occurrences(query):
+    """Dates come from the occurrences RPC; category names from a single IN query"""
+    db = MagicMock()
+    db.rpc.return_value.execute.return_value.data = [
+        {"title": "Anniversary", "occurs_on": "2026-10-20", "category_id": "cat1"},
+        {"title": "Birthday", "occurs_on": "2026-10-25", "category_id": "cat1"},
+        {"title": "Checkup", "occurs_on": "2026-10-30", "category_id": None},
+    ]
+    query.select_active.return_value = [{"category_id": "cat1", "category_name": "Family"}]
+
+    dates = ContextBuilder(db)._get_upcoming_dates(PERSON_ID, days_ahead=90)
+
+    name, params = db.rpc.call_args.args
+    assert name == "upcoming_date_occurrences"
+    assert params["p_person_id"] == str(PERSON_ID)
+    query.get_by_id.assert_not_called()
+    assert query.select_active.call_args.kwargs["filters"] == {"category_id": ["cat1"]}
+    assert [d["date"] for d in dates] == ["2026-10-20", "2026-10-25", "2026-10-30"]
+    assert [d["category"] for d in dates] == ["Family", "Family", None]
+
+
+@pytest.mark.unit
+def test_person_row_fetched_once_per_build(query):
+    """Profile and preferences share a single persons lookup"""
+    query.get_by_id.return_value = {
+        "person_id": PERSON_ID, "full_name": "Ada", "metadata_jsonb": {"preferences": {"cuisine": "thai"}}
+    }
+    query.select_active.return_value = []
+    builder = ContextBuilder(MagicMock())
+
+    context = builder.build_context(PERSON_ID)
+    builder.build_context(PERSON_ID)
+
+    person_lookups = [c for c in query.get_by_id.call_args_list if c.kwargs["table"] == "persons"]
+    assert len(person_lookups) == 2
+    assert context["person"]["full_name"] == "Ada"
@@ -0,0 +1,98 @@
+"""Unit tests for date item occurrence expansion"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.date_occurrences import (
+    expand_occurrences, lead_time_trigger, refresh_lead_time_reminders, replace_occurrences,
+    roll_occurrences
+)
+
+
+@pytest.mark.unit
+def test_one_off_date_is_single_occurrence():
+    """Dates without a rule expand to themselves, even in the past"""
+    assert expand_occurrences(date(2020, 5, 1), None, start=date(2026, 1, 1)) == [date(2020, 5, 1)]
+
+
+@pytest.mark.unit
+def test_yearly_rule_expands_from_start_within_horizon():
+    """Past occurrences are skipped and expansion stops at the horizon"""
+    occurrences = expand_occurrences(
+        date(1990, 3, 15), "FREQ=YEARLY", start=date(2026, 1, 1), horizon_days=730
+    )
+    assert occurrences == [date(2026, 3, 15), date(2027, 3, 15)]
+
+
+@pytest.mark.unit
+def test_invalid_rule_raises_value_error():
+    """Malformed RRULEs surface as ValueError for the API to turn into a 400"""
+    with pytest.raises(ValueError):
+        expand_occurrences(date(2026, 1, 1), "FREQ=SOMETIMES")
+
+
+@pytest.mark.unit
+def test_replace_occurrences_is_one_rpc():
+    """Occurrences and next_occurrence are swapped in a single transactional RPC"""
+    db = MagicMock()
+
+    next_occurrence = replace_occurrences(db, "d1", [date(2026, 3, 15), date(2027, 3, 15)])
+
+    assert next_occurrence == "2026-03-15"
+    db.rpc.assert_called_once_with("replace_date_item_occurrences", {
+        "p_date_item_id": "d1",
+        "p_occurs_on": ["2026-03-15", "2027-03-15"],
+        "p_next_occurrence": "2026-03-15",
+    })
+    db.table.assert_not_called()
+
+
+@pytest.mark.unit
+def test_future_start_gets_a_full_horizon():
+    """An item first occurring beyond the horizon still expands from its first date"""
+    occurrences = expand_occurrences(
+        date(2030, 6, 1), "FREQ=YEARLY", start=date(2026, 1, 1), horizon_days=400
+    )
+    assert occurrences == [date(2030, 6, 1), date(2031, 6, 1)]
+
+
+@pytest.mark.unit
+def test_roll_reexpands_passed_items_from_today():
+    """Items whose next_occurrence passed are re-expanded and their reminders follow"""
+    db = MagicMock()
+    db.rpc.return_value.execute.return_value.data = [
+        {"date_item_id": "d1", "date_value": "1990-03-15", "recurrence_rule": "FREQ=YEARLY",
+         "next_occurrence": "2026-03-15"},
+        {"date_item_id": "d2", "date_value": "2026-01-01", "recurrence_rule": "FREQ=SOMETIMES",
+         "next_occurrence": "2026-01-01"},
+    ]
+
+    with patch("app.services.date_occurrences.refresh_lead_time_reminders") as refresh:
+        rolled = roll_occurrences(db, today=date(2026, 3, 16))
+
+    assert rolled == 1
+    replace_call = db.rpc.call_args_list[1]
+    assert replace_call.args[1]["p_next_occurrence"] == "2027-03-15"
+    assert refresh.call_args.args[1]["next_occurrence"] == "2027-03-15"
+
+
+@pytest.mark.unit
+def test_lead_time_trigger_counts_back_from_occurrence():
+    """lead_time reminders fire lead_time_days before the occurrence"""
+    assert lead_time_trigger("2026-03-15", 7) == "2026-03-08T00:00:00"
+
+
+@pytest.mark.unit
+def test_refresh_lead_time_reminders_updates_once_per_lead_time():
+    """Unsent lead_time reminders are rescheduled with one update per distinct lead time"""
+    db = MagicMock()
+    table = db.table.return_value
+    table.select.return_value.eq.return_value.eq.return_value.is_.return_value.is_.return_value \
+        .execute.return_value.data = [{"lead_time_days": 7}, {"lead_time_days": 7}, {"lead_time_days": 1}]
+
+    refresh_lead_time_reminders(db, {"date_item_id": "d1", "next_occurrence": "2026-03-15"})
+
+    payloads = sorted(c.args[0]["scheduled_datetime"] for c in table.update.call_args_list)
+    assert payloads == ["2026-03-08T00:00:00", "2026-03-14T00:00:00"]
@@ -0,0 +1,27 @@
+"""Static checks on model declarations"""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+MODELS_DIR = Path(__file__).resolve().parents[2] / "app" / "models"
+
+
+def _column_calls(tree):
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "Column":
+            yield node
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", sorted(MODELS_DIR.glob("*.py")), ids=lambda p: p.name)
+def test_columns_have_no_shared_mutable_defaults(path):
+    """default={} / default=[] is shared across rows; use default=dict / default=list"""
+    offenders = [
+        f"{path.name}:{call.lineno}"
+        for call in _column_calls(ast.parse(path.read_text()))
+        for keyword in call.keywords
+        if keyword.arg == "default" and isinstance(keyword.value, (ast.Dict, ast.List, ast.Set))
+    ]
+    assert not offenders, f"Mutable literal Column default at {', '.join(offenders)}"
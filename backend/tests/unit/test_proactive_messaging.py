@@ -0,0 +1,57 @@
+"""Unit tests for the proactive messaging service"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.proactive_messaging import ProactiveMessagingService
+
+
+PERSON = {"person_id": "123e4567-e89b-12d3-a456-426614174000", "org_id": "00000000-0000-0000-0000-000000000001"}
+
+
+@pytest.mark.unit
+def test_conversation_resolved_in_one_rpc():
+    """Lookup and insert go through get_or_create_conversation, keyed on the DM channel"""
+    db = MagicMock()
+    db.rpc.return_value.execute.return_value.data = [{"conversation_id": "c1"}]
+    service = ProactiveMessagingService(db)
+
+    with patch.object(service, "_get_slack_dm_channel", return_value="D123"), \
+         patch("app.services.proactive_messaging.SupabaseQuery") as query:
+        conversation = service._get_or_create_conversation(PERSON, "slack", "UCLIENT")
+
+    assert conversation == {"conversation_id": "c1"}
+    db.rpc.assert_called_once_with("get_or_create_conversation", {
+        "p_org_id": PERSON["org_id"],
+        "p_person_id": PERSON["person_id"],
+        "p_channel_type": "slack",
+        "p_external_thread_id": "D123",
+        "p_subject": "Athena Concierge",
+    })
+    query.select_active.assert_not_called()
+    query.insert.assert_not_called()
+
+
+@pytest.mark.unit
+def test_send_dispatches_on_channel_type():
+    """send_to_person looks the sender up by channel_type and passes uniform arguments"""
+    db = MagicMock()
+    db.rpc.return_value.execute.return_value.data = [{"conversation_id": "c1"}]
+    service = ProactiveMessagingService(db)
+    email_sender = MagicMock()
+    service._senders["email"] = email_sender
+
+    with patch("app.services.proactive_messaging.SupabaseQuery") as query:
+        query.insert.return_value = {"message_id": "m1"}
+        service.send_to_person(
+            PERSON["person_id"], "Hello", channel_type="email", person=PERSON,
+            comm_identity={"identity_value": "ada@example.com"}
+        )
+
+    email_sender.assert_called_once_with(
+        identity_value="ada@example.com",
+        conversation={"conversation_id": "c1"},
+        message_text="Hello",
+        subject=None
+    )
@@ -0,0 +1,28 @@
+"""Unit tests for the proactive worker's scheduling"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.workers import proactive_worker
+
+
+class _Stop(Exception):
+    pass
+
+
+@pytest.mark.unit
+def test_scan_time_is_taken_out_of_the_sleep():
+    """A 10s scan on a 300s interval sleeps 290s, keeping the runs on a fixed cadence"""
+    clock = iter([1000.0, 1010.0])
+    settings = MagicMock(proactive_check_interval=300)
+
+    with patch.object(proactive_worker, "settings", settings), \
+         patch.object(proactive_worker, "get_db_context"), \
+         patch.object(proactive_worker, "ProactiveAgent"), \
+         patch.object(proactive_worker.time, "monotonic", side_effect=lambda: next(clock)), \
+         patch.object(proactive_worker.time, "sleep", side_effect=_Stop) as sleep:
+        with pytest.raises(_Stop):
+            proactive_worker.run_proactive_worker()
+
+    sleep.assert_called_once_with(290.0)
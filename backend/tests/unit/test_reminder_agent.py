@@ -0,0 +1,71 @@
+"""Unit tests for the reminder agent scan"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.agents.reminder import ReminderAgent
+
+
+@pytest.mark.unit
+def test_scan_resolves_related_rows_in_one_query_per_table():
+    """Date items, categories, identities and persons are loaded once for the whole batch"""
+    db = MagicMock()
+    db.table.return_value.select.return_value.is_.return_value.is_.return_value.lte.return_value \
+        .order.return_value.execute.return_value.data = [
+            {"reminder_rule_id": "r1", "date_item_id": "d1", "comm_identity_id": "ci1"},
+            {"reminder_rule_id": "r2", "date_item_id": None, "comm_identity_id": "ci2"},
+            {"reminder_rule_id": "r3", "date_item_id": None, "comm_identity_id": "gone"},
+        ]
+    rows = {
+        "date_items": [{"date_item_id": "d1", "category_id": "cat1"}],
+        "date_categories": [{"category_id": "cat1", "category_name": "Family"}],
+        "comm_identities": [
+            {"comm_identity_id": "ci1", "person_id": "p1"},
+            {"comm_identity_id": "ci2", "person_id": "p1"},
+        ],
+        "persons": [{"person_id": "p1"}],
+    }
+    agent = ReminderAgent(db)
+
+    with patch("app.agents.reminder.SupabaseQuery") as query, \
+         patch.object(agent, "_send_reminder") as send:
+        query.select_active.side_effect = lambda client, table, **kwargs: rows[table]
+        agent.scan_and_send_reminders()
+
+    assert [c.kwargs["table"] for c in query.select_active.call_args_list] == [
+        "date_items", "date_categories", "comm_identities", "persons"
+    ]
+    query.get_by_id.assert_not_called()
+    assert [c.args[0]["reminder_rule_id"] for c in send.call_args_list] == ["r1", "r2"]
+    assert send.call_args_list[0].kwargs["category"] == {"category_id": "cat1", "category_name": "Family"}
+    assert send.call_args_list[1].kwargs["date_item"] is None
+
+
+@pytest.mark.unit
+def test_sharded_scan_reads_its_partition_through_rpc():
+    """With several shards the scan asks due_reminders for this worker's slice only"""
+    db = MagicMock()
+    db.rpc.return_value.execute.return_value.data = []
+    agent = ReminderAgent(db, shard=2, shard_count=4)
+
+    with patch("app.agents.reminder.SupabaseQuery"):
+        agent.scan_and_send_reminders()
+
+    name, params = db.rpc.call_args.args
+    assert name == "due_reminders"
+    assert (params["p_shard"], params["p_shard_count"]) == (2, 4)
+    db.table.assert_not_called()
+
+
+@pytest.mark.unit
+def test_shard_out_of_range_rejected():
+    """A shard index must be below the shard count"""
+    with pytest.raises(ValueError):
+        ReminderAgent(MagicMock(), shard=4, shard_count=4)
+
+
+@pytest.mark.unit
+def test_agents_share_one_anthropic_client():
+    """Agent construction reuses the process-wide client instead of building a new pool"""
+    assert ReminderAgent(MagicMock()).client is ReminderAgent(MagicMock()).client
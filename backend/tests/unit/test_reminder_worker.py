@@ -0,0 +1,31 @@
+"""Unit tests for the reminder worker's sleep planning"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.workers.reminder_worker import seconds_until_next_reminder
+
+
+def _db_returning(rows):
+    db = MagicMock()
+    db.table.return_value.select.return_value.is_.return_value.is_.return_value.gt.return_value \
+        .order.return_value.limit.return_value.execute.return_value.data = rows
+    return db
+
+
+@pytest.mark.unit
+def test_sleeps_until_next_scheduled_reminder():
+    """The wait is the time left until the earliest future reminder"""
+    due = (datetime.now(timezone.utc) + timedelta(seconds=90)).isoformat()
+
+    seconds = seconds_until_next_reminder(_db_returning([{"scheduled_datetime": due}]))
+
+    assert 80 < seconds <= 90
+
+
+@pytest.mark.unit
+def test_nothing_scheduled_returns_none():
+    """With no future reminders the worker falls back to its check interval"""
+    assert seconds_until_next_reminder(_db_returning([])) is None
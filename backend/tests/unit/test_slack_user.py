@@ -0,0 +1,166 @@
+"""Unit tests for the Slack user integration message handler"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.integrations.slack_user import SlackUserIntegration
+
+
+PERSON_ID = "123e4567-e89b-12d3-a456-426614174000"
+ORG_ID = "00000000-0000-0000-0000-000000000001"
+CONVERSATION_ID = "323e4567-e89b-12d3-a456-426614174000"
+
+
+def _build_handler():
+    """Register handlers on a bare integration and return the message handler"""
+    integration = SlackUserIntegration.__new__(SlackUserIntegration)
+    integration.user_id = "UATHENA"
+    integration.user_client = MagicMock()
+
+    handlers = {}
+
+    def event(name):
+        def decorator(func):
+            handlers[name] = func
+            return func
+        return decorator
+
+    integration.app = MagicMock()
+    integration.app.event.side_effect = event
+    integration._register_handlers()
+    return integration, handlers["message"]
+
+
+def _dm_event(text="Hello Athena"):
+    return {"user": "UCLIENT", "text": text, "channel": "D123", "ts": "1700000000.000100"}
+
+
+@pytest.fixture
+def mock_db():
+    db = MagicMock()
+    with patch("app.integrations.slack_user.get_supabase_client", return_value=db):
+        yield db
+
+
+@pytest.mark.unit
+def test_existing_user_lookups_use_comm_identity_person(mock_db):
+    """Person and conversation lookups both key on comm_identity['person_id']"""
+    integration, handle_message = _build_handler()
+    person = {"person_id": PERSON_ID, "org_id": ORG_ID}
+    conversation = {"conversation_id": CONVERSATION_ID}
+
+    def select_active(client, table, **kwargs):
+        if table == "comm_identities":
+            return [{"person_id": PERSON_ID}]
+        if table == "conversations":
+            return [conversation]
+        return []
+
+    with patch("app.integrations.slack_user.SupabaseQuery") as query, \
+         patch("app.integrations.slack_user.ContextBuilder") as context_builder, \
+         patch("app.integrations.slack_user.OrchestratorAgent") as orchestrator:
+        query.select_active.side_effect = select_active
+        query.get_by_id.return_value = person
+        query.insert.side_effect = lambda client, table, data: data
+        orchestrator.return_value.process_message.return_value = "Hi there"
+
+        handle_message(event=_dm_event(), say=MagicMock(), client=MagicMock())
+
+    query.get_by_id.assert_called_once_with(
+        client=mock_db, table="persons", id_column="person_id", id_value=PERSON_ID
+    )
+    conversation_call = [
+        c for c in query.select_active.call_args_list if c.kwargs["table"] == "conversations"
+    ][0]
+    assert conversation_call.kwargs["filters"]["person_id"] == PERSON_ID
+
+    inserted = [c.args[2] for c in query.insert.call_args_list]
+    assert [m["direction"] for m in inserted] == ["inbound", "outbound"]
+    assert all(m["conversation_id"] == CONVERSATION_ID for m in inserted)
+    assert all(m["org_id"] == ORG_ID for m in inserted)
+
+    context_builder.return_value.build_context.assert_called_once_with(PERSON_ID, CONVERSATION_ID)
+    process_kwargs = orchestrator.return_value.process_message.call_args.kwargs
+    assert process_kwargs["person"] is person
+    assert process_kwargs["conversation"] is conversation
+    integration.user_client.chat_postMessage.assert_called_once()
+
+
+@pytest.mark.unit
+def test_deleted_person_is_ignored(mock_db):
+    """A comm_identity whose person was soft-deleted is dropped without replying"""
+    integration, handle_message = _build_handler()
+
+    with patch("app.integrations.slack_user.SupabaseQuery") as query, \
+         patch("app.integrations.slack_user.OrchestratorAgent") as orchestrator:
+        query.select_active.side_effect = lambda client, table, **kwargs: (
+            [{"person_id": PERSON_ID}] if table == "comm_identities" else []
+        )
+        query.get_by_id.return_value = None
+
+        handle_message(event=_dm_event(), say=MagicMock(), client=MagicMock())
+
+    query.insert.assert_not_called()
+    orchestrator.assert_not_called()
+    integration.user_client.chat_postMessage.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("event", [
+    {"subtype": "message_changed", "channel": "D123"},
+    {"subtype": "channel_join", "user": "UCLIENT", "channel": "C123"},
+    {"user": "UATHENA", "thread_ts": "1700000000.000100", "channel": "D123", "text": "hi"},
+])
+def test_ignored_events_skip_database(mock_db, event):
+    """System subtypes and our own thread replies never reach the database"""
+    integration, handle_message = _build_handler()
+
+    with patch("app.integrations.slack_user.SupabaseQuery") as query:
+        handle_message(event=event, say=MagicMock(), client=MagicMock())
+
+    query.select_active.assert_not_called()
+    integration.user_client.chat_postMessage.assert_not_called()
+
+
+@pytest.mark.unit
+def test_message_agents_reused_per_thread():
+    """ContextBuilder/OrchestratorAgent are built once per thread and db"""
+    from app.integrations.slack_user import _get_message_agents
+
+    db = MagicMock()
+    with patch("app.integrations.slack_user.ContextBuilder") as context_builder, \
+         patch("app.integrations.slack_user.OrchestratorAgent") as orchestrator:
+        first = _get_message_agents(db)
+        second = _get_message_agents(db)
+        _get_message_agents(MagicMock())
+
+    assert first == second
+    assert context_builder.call_count == 2
+    assert orchestrator.call_count == 2
+
+
+@pytest.mark.unit
+def test_send_as_user_omits_legacy_as_user_flag():
+    """Messages are attributed by the user token, not the as_user flag"""
+    integration, _ = _build_handler()
+
+    integration._send_as_user("D123", "Hello", thread_ts="1700000000.000100")
+
+    integration.user_client.chat_postMessage.assert_called_once_with(
+        channel="D123", text="Hello", thread_ts="1700000000.000100"
+    )
+
+
+@pytest.mark.unit
+def test_dm_channel_opened_once_per_user():
+    """conversations.open is only called the first time a user's DM channel is needed"""
+    integration, _ = _build_handler()
+    integration.user_client.conversations_open.return_value = {"ok": True, "channel": {"id": "D456"}}
+
+    with patch.dict("app.integrations.slack_user._dm_channels", clear=True):
+        first = integration.get_dm_channel("UCACHED")
+        second = integration.get_dm_channel("UCACHED")
+
+    assert first == second == "D456"
+    integration.user_client.conversations_open.assert_called_once_with(users="UCACHED")
@@ -0,0 +1,153 @@
+"""Unit tests for Supabase query helpers"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+from postgrest.exceptions import APIError
+
+from app.utils.supabase_helpers import SupabaseQuery, handle_supabase_error
+
+
+ROW_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+
+@pytest.fixture
+def client():
+    return MagicMock()
+
+
+@pytest.mark.unit
+def test_insert_cleans_row(client):
+    """Top-level UUIDs become strings, None values are dropped, JSONB values pass through"""
+    table = client.table.return_value
+    table.insert.return_value.execute.return_value.data = [{"id": 1}]
+    payload = {"person_id": str(ROW_ID), "steps": [1, 2]}
+
+    SupabaseQuery.insert(client, "agent_execution_logs", {
+        "agent_id": ROW_ID,
+        "tokens_used": None,
+        "payload_jsonb": payload,
+    })
+
+    sent = table.insert.call_args.args[0]
+    assert sent == {"agent_id": str(ROW_ID), "payload_jsonb": payload}
+    assert sent["payload_jsonb"] is payload
+
+
+@pytest.mark.unit
+def test_bulk_insert_batches_rows(client):
+    """Rows are cleaned like insert() and sent in batch_size chunks"""
+    table = client.table.return_value
+    table.insert.return_value.execute.side_effect = lambda: MagicMock(
+        data=table.insert.call_args.args[0]
+    )
+    rows = [{"reminder_rule_id": ROW_ID, "lead_time_days": None, "n": n} for n in range(5)]
+
+    inserted = SupabaseQuery.bulk_insert(client, "reminder_rules", rows, batch_size=2)
+
+    assert [len(c.args[0]) for c in table.insert.call_args_list] == [2, 2, 1]
+    assert all(c.kwargs == {"default_to_null": False} for c in table.insert.call_args_list)
+    assert inserted == [{"reminder_rule_id": str(ROW_ID), "n": n} for n in range(5)]
+
+
+@pytest.mark.unit
+def test_select_active_list_filter_uses_in(client):
+    """List filter values become a single IN filter with stringified UUIDs"""
+    query = client.table.return_value.select.return_value.is_.return_value
+    query.in_.return_value.execute.return_value.data = [{"task_id": 1}]
+
+    rows = SupabaseQuery.select_active(client, "tasks", filters={"project_id": [ROW_ID, "abc"]})
+
+    query.in_.assert_called_once_with("project_id", [str(ROW_ID), "abc"])
+    query.eq.assert_not_called()
+    assert rows == [{"task_id": 1}]
+
+
+@pytest.mark.unit
+def test_select_active_exclude_uses_neq(client):
+    """Exclude pairs are applied as != filters after the equality filters"""
+    query = client.table.return_value.select.return_value.is_.return_value
+    query.eq.return_value.neq.return_value.execute.return_value.data = [{"conversation_id": "c2"}]
+
+    rows = SupabaseQuery.select_active(
+        client, "conversations", filters={"person_id": "p1"}, exclude={"conversation_id": ROW_ID}
+    )
+
+    query.eq.return_value.neq.assert_called_once_with("conversation_id", str(ROW_ID))
+    assert rows == [{"conversation_id": "c2"}]
+
+
+@pytest.mark.unit
+def test_select_active_range_filters(client):
+    """Range filters map onto the matching PostgREST comparison; unknown operators raise"""
+    query = client.table.return_value.select.return_value.is_.return_value
+
+    SupabaseQuery.select_active(client, "date_items", range_filters=[("next_occurrence", "lte", "2026-12-31")])
+
+    query.lte.assert_called_once_with("next_occurrence", "2026-12-31")
+    with pytest.raises(ValueError):
+        SupabaseQuery.select_active(client, "date_items", range_filters=[("next_occurrence", "like", "2026%")])
+
+
+@pytest.mark.unit
+def test_get_by_id_caches_lookup_tables_until_updated(client):
+    """date_categories reads hit PostgREST once, and update() evicts the cached row"""
+    query = client.table.return_value.select.return_value.eq.return_value.is_.return_value
+    query.execute.return_value.data = [{"category_id": str(ROW_ID), "category_name": "Family"}]
+
+    with patch.dict("app.utils.supabase_helpers._row_cache", clear=True):
+        for _ in range(3):
+            SupabaseQuery.get_by_id(client, "date_categories", ROW_ID, id_column="category_id")
+        SupabaseQuery.update(client, "date_categories", ROW_ID, {"category_name": "Kin"},
+                             id_column="category_id")
+        SupabaseQuery.get_by_id(client, "date_categories", ROW_ID, id_column="category_id")
+        SupabaseQuery.get_by_id(client, "persons", ROW_ID, id_column="person_id")
+        SupabaseQuery.get_by_id(client, "persons", ROW_ID, id_column="person_id")
+
+    assert query.execute.call_count == 4
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("code, expected_status", [
+    ("PGRST116", 404),
+    ("PGRST204", 400),
+    ("23505", 500),
+])
+def test_handle_supabase_error_maps_error_codes(code, expected_status):
+    """PostgREST error codes decide the HTTP status, not the message text"""
+    @handle_supabase_error
+    async def failing():
+        raise APIError({"code": code, "message": "boom"})
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(failing())
+
+    assert exc_info.value.status_code == expected_status
+
+
+@pytest.mark.unit
+def test_select_active_iter_pages_until_short_page(client):
+    """Rows are fetched page_size at a time and iteration stops after a short page"""
+    pages = [[{"n": 0}, {"n": 1}], [{"n": 2}, {"n": 3}], [{"n": 4}]]
+
+    with patch.object(SupabaseQuery, "select_active", side_effect=pages) as select_active:
+        rows = list(SupabaseQuery.select_active_iter(client, "persons", order_by="person_id", page_size=2))
+
+    assert [r["n"] for r in rows] == [0, 1, 2, 3, 4]
+    assert [c.kwargs["offset"] for c in select_active.call_args_list] == [0, 2, 4]
+
+
+@pytest.mark.unit
+def test_str_and_uuid_ids_share_filter_and_cache_entry(client):
+    """A UUID and its string form filter identically and hit the same cached row"""
+    query = client.table.return_value.select.return_value
+    query.eq.return_value.is_.return_value.execute.return_value.data = [{"category_id": str(ROW_ID)}]
+
+    with patch.dict("app.utils.supabase_helpers._row_cache", clear=True):
+        SupabaseQuery.get_by_id(client, "date_categories", ROW_ID, id_column="category_id")
+        SupabaseQuery.get_by_id(client, "date_categories", str(ROW_ID), id_column="category_id")
+
+    query.eq.assert_called_once_with("category_id", str(ROW_ID))
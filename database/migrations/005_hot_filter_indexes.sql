@@ -0,0 +1,44 @@
+-- =====================================================
+-- Migration 005: Composite Indexes for Slack Message Lookups
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Guarantee the composite partial indexes used by every inbound
+-- Slack message exist on databases created before schema_mvp.sql shipped them
+--
+-- Background:
+-- - handle_message looks up comm_identities by (channel_type, identity_value)
+--   and conversations by (person_id, channel_type, external_thread_id)
+-- - Both lookups also filter deleted_at IS NULL via SupabaseQuery.select_active
+-- - Without these indexes PostgREST falls back to sequential scans as the
+--   tables grow
+--
+-- Changes:
+-- 1. Partial composite index on comm_identities(channel_type, identity_value)
+-- 2. Partial composite index on conversations(channel_type, external_thread_id)
+--
+-- Both statements are idempotent and match the names in schema_mvp.sql.
+--
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_comm_identities_channel
+  ON comm_identities(channel_type, identity_value)
+  WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_conversations_external
+  ON conversations(channel_type, external_thread_id)
+  WHERE deleted_at IS NULL;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- Run this to verify the lookup uses the index:
+--
+-- EXPLAIN SELECT * FROM conversations
+-- WHERE channel_type = 'slack'
+--   AND external_thread_id = 'D1234567890'
+--   AND deleted_at IS NULL;
+--
+-- Expected: Index Scan using idx_conversations_external
+--
+-- =====================================================
@@ -0,0 +1,153 @@
+-- =====================================================
+-- Migration 006: Partition Append-Only Log Tables by Month
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Keep inserts into agent_execution_logs and event_log fast as the
+-- tables grow, and let retention/analytics scans prune by month
+--
+-- Background:
+-- - Every agent call (and so every inbound message) appends to
+--   agent_execution_logs; event_log is the unified audit trail
+-- - Both are insert-only and always filtered/ordered by created_at
+-- - Unpartitioned, their btrees bloat and vacuum pressure grows with volume
+--
+-- Changes:
+-- 1. Recreate both tables as PARTITION BY RANGE (created_at)
+--    (PostgreSQL cannot convert a table in place, so rows are copied across)
+-- 2. Primary keys become (id, created_at) - the partition key must be part
+--    of every unique constraint. Nothing references these PKs by FK.
+-- 3. Monthly partitions from the oldest existing row through 3 months ahead,
+--    plus a DEFAULT partition so inserts never fail
+-- 4. BRIN index on created_at; existing btree indexes are recreated
+-- 5. create_monthly_log_partitions() to be scheduled monthly (pg_cron or a
+--    Supabase scheduled function) to keep partitions ahead of time
+--
+-- Note: RLS policies do not carry over to the new tables. Re-apply
+-- database/rls_policies_full.sql after running this migration.
+--
+-- =====================================================
+
+BEGIN;
+
+-- Helper: create monthly partitions for a partitioned log table
+CREATE OR REPLACE FUNCTION create_monthly_log_partitions(
+    p_table TEXT,
+    p_from DATE,
+    p_months_ahead INTEGER DEFAULT 3
+)
+RETURNS VOID AS $$
+DECLARE
+    month_start DATE := date_trunc('month', p_from)::date;
+    last_month DATE := (date_trunc('month', CURRENT_DATE) + make_interval(months => p_months_ahead))::date;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            p_table || '_' || to_char(month_start, 'YYYY_MM'),
+            p_table,
+            month_start,
+            (month_start + INTERVAL '1 month')::date
+        );
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- -----------------------------------------------------
+-- agent_execution_logs
+-- -----------------------------------------------------
+ALTER TABLE agent_execution_logs RENAME TO agent_execution_logs_unpartitioned;
+
+CREATE TABLE agent_execution_logs (
+    log_id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    org_id UUID NOT NULL REFERENCES organizations(org_id),
+    agent_id UUID NOT NULL REFERENCES agent_roster(agent_id),
+    run_id UUID NOT NULL,
+    turn_index INTEGER NOT NULL,
+    conversation_id UUID REFERENCES conversations(conversation_id),
+    person_id UUID REFERENCES persons(person_id),
+    payload_jsonb JSONB NOT NULL,
+    execution_time_ms INTEGER,
+    tokens_used INTEGER,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (log_id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE agent_execution_logs_default PARTITION OF agent_execution_logs DEFAULT;
+
+SELECT create_monthly_log_partitions(
+    'agent_execution_logs',
+    COALESCE((SELECT MIN(created_at)::date FROM agent_execution_logs_unpartitioned), CURRENT_DATE)
+);
+
+INSERT INTO agent_execution_logs
+SELECT log_id, org_id, agent_id, run_id, turn_index, conversation_id, person_id,
+       payload_jsonb, execution_time_ms, tokens_used, created_at
+FROM agent_execution_logs_unpartitioned;
+
+DROP TABLE agent_execution_logs_unpartitioned;
+
+CREATE INDEX idx_agent_execution_logs_run ON agent_execution_logs(run_id, turn_index);
+CREATE INDEX idx_agent_execution_logs_conversation ON agent_execution_logs(conversation_id);
+CREATE INDEX idx_agent_execution_logs_org ON agent_execution_logs(org_id);
+CREATE INDEX idx_agent_execution_logs_created_brin ON agent_execution_logs USING brin(created_at);
+
+-- -----------------------------------------------------
+-- event_log
+-- -----------------------------------------------------
+ALTER TABLE event_log RENAME TO event_log_unpartitioned;
+
+CREATE TABLE event_log (
+    event_id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    org_id UUID NOT NULL REFERENCES organizations(org_id),
+    actor_type VARCHAR(50) NOT NULL CHECK (actor_type IN ('person', 'agent', 'system')),
+    actor_id UUID,
+    event_type VARCHAR(100) NOT NULL,
+    entity_type VARCHAR(100) NOT NULL,
+    entity_id UUID NOT NULL,
+    details_jsonb JSONB DEFAULT '{}'::jsonb,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (event_id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE event_log_default PARTITION OF event_log DEFAULT;
+
+SELECT create_monthly_log_partitions(
+    'event_log',
+    COALESCE((SELECT MIN(created_at)::date FROM event_log_unpartitioned), CURRENT_DATE)
+);
+
+INSERT INTO event_log
+SELECT event_id, org_id, actor_type, actor_id, event_type, entity_type, entity_id,
+       details_jsonb, created_at
+FROM event_log_unpartitioned;
+
+DROP TABLE event_log_unpartitioned;
+
+CREATE INDEX idx_event_log_org ON event_log(org_id, created_at DESC);
+CREATE INDEX idx_event_log_entity ON event_log(entity_type, entity_id);
+CREATE INDEX idx_event_log_actor ON event_log(actor_type, actor_id);
+CREATE INDEX idx_event_log_created_brin ON event_log USING brin(created_at);
+
+COMMIT;
+
+-- =====================================================
+-- Partition Maintenance
+-- =====================================================
+-- Schedule monthly (e.g. pg_cron on the 1st of each month):
+--
+-- SELECT create_monthly_log_partitions('agent_execution_logs', CURRENT_DATE);
+-- SELECT create_monthly_log_partitions('event_log', CURRENT_DATE);
+--
+-- Rows landing in *_default mean the job has fallen behind.
+--
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- SELECT inhrelid::regclass AS partition
+-- FROM pg_inherits
+-- WHERE inhparent IN ('agent_execution_logs'::regclass, 'event_log'::regclass)
+-- ORDER BY 1;
+--
+-- =====================================================
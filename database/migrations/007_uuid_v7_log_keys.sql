@@ -0,0 +1,54 @@
+-- =====================================================
+-- Migration 007: Time-Ordered (v7) UUIDs for High-Volume Keys
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Stop random UUIDv4 primary keys from splitting btree pages on
+-- every insert into the append-heavy tables
+--
+-- Background:
+-- - agent_execution_logs, event_log, embeddings and working_memory take a
+--   row per agent call / audit event
+-- - v4 keys land at random positions in the PK index; v7 keys start with a
+--   millisecond timestamp, so inserts append to the right edge of the index
+-- - PostgreSQL 15 (Supabase) has no built-in uuidv7(), so one is defined here
+--
+-- Changes:
+-- 1. uuid_generate_v7() function (requires pgcrypto, enabled in schema_mvp.sql)
+-- 2. Switch the PK defaults of the four tables to uuid_generate_v7()
+--
+-- Existing v4 keys are left untouched; only new rows get v7 keys.
+--
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION uuid_generate_v7()
+RETURNS UUID AS $$
+DECLARE
+    uuid_bytes BYTEA;
+BEGIN
+    -- 48-bit big-endian unix timestamp (ms) followed by 80 random bits
+    uuid_bytes := substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                  || gen_random_bytes(10);
+    -- Version 7 in the high nibble of byte 6, RFC 4122 variant in byte 8
+    uuid_bytes := set_byte(uuid_bytes, 6, (b'0111' || get_byte(uuid_bytes, 6)::bit(4))::bit(8)::int);
+    uuid_bytes := set_byte(uuid_bytes, 8, (b'10' || get_byte(uuid_bytes, 8)::bit(6))::bit(8)::int);
+    RETURN encode(uuid_bytes, 'hex')::uuid;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+ALTER TABLE agent_execution_logs ALTER COLUMN log_id SET DEFAULT uuid_generate_v7();
+ALTER TABLE event_log ALTER COLUMN event_id SET DEFAULT uuid_generate_v7();
+ALTER TABLE embeddings ALTER COLUMN embedding_id SET DEFAULT uuid_generate_v7();
+ALTER TABLE working_memory ALTER COLUMN memory_id SET DEFAULT uuid_generate_v7();
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- Consecutive calls should sort in creation order and report version 7:
+--
+-- SELECT uuid_generate_v7() AS id, substring(uuid_generate_v7()::text, 15, 1) AS version
+-- FROM generate_series(1, 3);
+--
+-- Expected: version = '7'
+--
+-- =====================================================
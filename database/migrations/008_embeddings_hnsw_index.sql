@@ -0,0 +1,48 @@
+-- =====================================================
+-- Migration 008: HNSW Index for Embedding Similarity Search
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Keep semantic retrieval over embeddings sub-linear as the table
+-- grows
+--
+-- Background:
+-- - The ivfflat index was built with lists = 100 on an (initially) empty
+--   table; ivfflat centroids are fixed at build time, so recall degrades and
+--   probes approach a full scan as rows accumulate
+-- - HNSW (pgvector >= 0.5.0, available on Supabase) needs no training data
+--   and keeps good recall under continuous inserts
+-- - Every similarity query is scoped to one org, so org_id gets a btree to
+--   pre-filter; a per-org partial HNSW index is not practical with
+--   dynamically created orgs
+--
+-- Changes:
+-- 1. Replace idx_embeddings_vector (ivfflat) with an HNSW cosine index
+-- 2. Add idx_embeddings_org
+--
+-- =====================================================
+
+CREATE EXTENSION IF NOT EXISTS "vector";
+
+DROP INDEX IF EXISTS idx_embeddings_vector;
+
+CREATE INDEX IF NOT EXISTS idx_embeddings_vector
+ON embeddings USING hnsw (embedding_vector vector_cosine_ops)
+WITH (m = 16, ef_construction = 64);
+
+CREATE INDEX IF NOT EXISTS idx_embeddings_org
+ON embeddings(org_id);
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- The plan should show an Index Scan using idx_embeddings_vector:
+--
+-- EXPLAIN
+-- SELECT entity_type, entity_id, content_text
+-- FROM embeddings
+-- WHERE org_id = '00000000-0000-0000-0000-000000000001'
+-- ORDER BY embedding_vector <=> (SELECT embedding_vector FROM embeddings LIMIT 1)
+-- LIMIT 10;
+--
+-- =====================================================
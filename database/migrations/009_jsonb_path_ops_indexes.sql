@@ -0,0 +1,54 @@
+-- =====================================================
+-- Migration 009: jsonb_path_ops GIN Indexes for Tag/Metadata Containment
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Smaller, faster GIN indexes for @> containment filters on
+-- tags_jsonb and metadata_jsonb
+--
+-- Background:
+-- - The tag and persons.metadata_jsonb GIN indexes use the default
+--   jsonb_ops class, which indexes every key and value separately
+-- - jsonb_path_ops hashes whole paths: roughly half the size and faster for
+--   @>, at the cost of the ?, ?| and ?& key-existence operators, which
+--   nothing in the app uses
+-- - projects.metadata_jsonb had no index at all
+--
+-- Changes:
+-- 1. Rebuild idx_persons_metadata and idx_{vendors,venues,restaurants,
+--    products}_tags with jsonb_path_ops
+-- 2. Add idx_projects_metadata
+--
+-- Query pattern: filter with containment so these indexes apply, e.g.
+--   tags_jsonb @> '["vip"]'  /  metadata_jsonb @> '{"dietary": "vegan"}'
+-- (PostgREST: .contains('tags_jsonb', ['vip'])), not ->> equality.
+--
+-- =====================================================
+
+DROP INDEX IF EXISTS idx_persons_metadata;
+CREATE INDEX idx_persons_metadata ON persons USING gin(metadata_jsonb jsonb_path_ops);
+
+DROP INDEX IF EXISTS idx_vendors_tags;
+CREATE INDEX idx_vendors_tags ON vendors USING gin(tags_jsonb jsonb_path_ops);
+
+DROP INDEX IF EXISTS idx_venues_tags;
+CREATE INDEX idx_venues_tags ON venues USING gin(tags_jsonb jsonb_path_ops);
+
+DROP INDEX IF EXISTS idx_restaurants_tags;
+CREATE INDEX idx_restaurants_tags ON restaurants USING gin(tags_jsonb jsonb_path_ops);
+
+DROP INDEX IF EXISTS idx_products_tags;
+CREATE INDEX idx_products_tags ON products USING gin(tags_jsonb jsonb_path_ops);
+
+CREATE INDEX IF NOT EXISTS idx_projects_metadata ON projects USING gin(metadata_jsonb jsonb_path_ops);
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- SELECT indexname, indexdef
+-- FROM pg_indexes
+-- WHERE indexdef LIKE '%jsonb_path_ops%';
+--
+-- Expected: 6 rows
+--
+-- =====================================================
@@ -0,0 +1,45 @@
+-- =====================================================
+-- Migration 010: Expression Indexes for Scalar JSONB Filters
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Index the scalar JSONB keys that are filtered with ->> equality
+-- or range comparisons
+--
+-- Background:
+-- - GIN indexes (migration 009) only serve containment (@>); a filter like
+--   address_jsonb ->> 'city' = 'Boston' still scans the table
+-- - A btree on the extracted expression is small, serves =, <, > and
+--   ORDER BY, and only covers the key that is actually queried
+-- - products.price is already a real NUMERIC column, so it gets a plain
+--   btree rather than a metadata_jsonb ->> 'price' cast
+--
+-- Queryable keys (filter on exactly these expressions so the index applies):
+-- - addresses: address_jsonb ->> 'city'
+-- - venues:    location_jsonb ->> 'neighborhood'
+-- - products:  price (column)
+--
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_addresses_city
+ON addresses((address_jsonb ->> 'city'))
+WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_venues_neighborhood
+ON venues((location_jsonb ->> 'neighborhood'))
+WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_products_price
+ON products(price)
+WHERE deleted_at IS NULL;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- EXPLAIN
+-- SELECT address_id FROM addresses
+-- WHERE address_jsonb ->> 'city' = 'Boston' AND deleted_at IS NULL;
+--
+-- Expected: Index Scan / Bitmap Index Scan using idx_addresses_city
+--
+-- =====================================================
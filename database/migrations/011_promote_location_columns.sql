@@ -0,0 +1,61 @@
+-- =====================================================
+-- Migration 011: Promote City/State/Postal Code to Columns
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Give the most-filtered address and venue location keys real,
+-- btree-indexed columns instead of JSONB path expressions
+--
+-- Background:
+-- - addresses.address_jsonb and venues.location_jsonb are filtered by city
+--   and state (and addresses by postal code) far more than any other key
+-- - Dedicated columns get proper statistics, so the planner estimates them
+--   correctly, which it cannot do for ->> expressions
+-- - STORED generated columns keep them in sync with the JSONB without any
+--   application changes; adding them rewrites the table, which backfills
+--   existing rows in the same step
+--
+-- Changes:
+-- 1. addresses.city / state / postal_code generated from address_jsonb
+-- 2. venues.city / state generated from location_jsonb
+--    (location_jsonb carries no postal code)
+-- 3. Column indexes; idx_addresses_city (expression, migration 010) is
+--    replaced by an index on the new column
+--
+-- The JSONB columns stay the source of truth for the long tail of keys.
+-- Generated columns cannot be written: keep inserting/updating the JSONB
+-- and filter on the columns (.eq('city', ...)).
+--
+-- =====================================================
+
+BEGIN;
+
+ALTER TABLE addresses
+    ADD COLUMN IF NOT EXISTS city VARCHAR(100) GENERATED ALWAYS AS (address_jsonb ->> 'city') STORED,
+    ADD COLUMN IF NOT EXISTS state VARCHAR(50) GENERATED ALWAYS AS (address_jsonb ->> 'state') STORED,
+    ADD COLUMN IF NOT EXISTS postal_code VARCHAR(20) GENERATED ALWAYS AS (address_jsonb ->> 'postal_code') STORED;
+
+ALTER TABLE venues
+    ADD COLUMN IF NOT EXISTS city VARCHAR(100) GENERATED ALWAYS AS (location_jsonb ->> 'city') STORED,
+    ADD COLUMN IF NOT EXISTS state VARCHAR(50) GENERATED ALWAYS AS (location_jsonb ->> 'state') STORED;
+
+DROP INDEX IF EXISTS idx_addresses_city;
+CREATE INDEX idx_addresses_city ON addresses(city) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_addresses_state ON addresses(state) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_addresses_postal_code ON addresses(postal_code) WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_venues_city ON venues(city) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_venues_state ON venues(state) WHERE deleted_at IS NULL;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- SELECT address_jsonb ->> 'city' AS jsonb_city, city
+-- FROM addresses
+-- WHERE city IS DISTINCT FROM address_jsonb ->> 'city';
+--
+-- Expected: 0 rows
+--
+-- =====================================================
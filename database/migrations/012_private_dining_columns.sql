@@ -0,0 +1,91 @@
+-- =====================================================
+-- Migration 012: Indexed Private Dining / Private Room Capacity
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Answer "restaurants with private dining for 20" and "venues with
+-- a private room for 50" from btree indexes instead of parsing JSONB per row
+--
+-- Background:
+-- - restaurants.private_dining_jsonb is {available, capacity, pricing}
+-- - venues.private_rooms_jsonb is an array of rooms, each with a capacity
+-- - Neither shape can use the GIN indexes for >= comparisons
+--
+-- - The JSONB values are free-form text ("yes", "40-60", ...); a bare cast
+--   would fail the table rewrite and reject later writes holding such values
+--
+-- Changes:
+-- 1. text_to_integer_or_null(text) / text_to_boolean_or_null(text):
+--    IMMUTABLE casts that return NULL instead of raising on values that
+--    don't parse
+-- 2. jsonb_max_room_capacity(jsonb): IMMUTABLE helper so the array
+--    aggregate can back a generated column (subqueries are not allowed
+--    directly in GENERATED expressions); rooms without a numeric capacity
+--    are ignored
+-- 3. restaurants.private_dining_available / private_dining_capacity and
+--    venues.max_private_room_capacity as STORED generated columns; adding
+--    them rewrites the tables, which backfills existing rows
+-- 4. Partial index on restaurants for available private dining, and an
+--    index on venue room capacity
+--
+-- =====================================================
+
+BEGIN;
+
+-- plpgsql rather than sql: an inlined CASE can still have its cast
+-- constant-folded at plan time
+CREATE OR REPLACE FUNCTION text_to_integer_or_null(value TEXT)
+RETURNS INTEGER AS $$
+BEGIN
+    IF value ~ '^\s*[+-]?\d{1,9}\s*$' THEN
+        RETURN value::integer;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION text_to_boolean_or_null(value TEXT)
+RETURNS BOOLEAN AS $$
+    SELECT CASE
+        WHEN lower(trim(value)) IN ('true', 't', 'yes', 'y', 'on', '1') THEN TRUE
+        WHEN lower(trim(value)) IN ('false', 'f', 'no', 'n', 'off', '0') THEN FALSE
+    END
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION jsonb_max_room_capacity(rooms JSONB)
+RETURNS INTEGER AS $$
+    SELECT MAX(text_to_integer_or_null(room ->> 'capacity'))
+    FROM jsonb_array_elements(CASE WHEN jsonb_typeof(rooms) = 'array' THEN rooms ELSE '[]'::jsonb END) AS room
+$$ LANGUAGE sql IMMUTABLE;
+
+ALTER TABLE restaurants
+    ADD COLUMN IF NOT EXISTS private_dining_available BOOLEAN
+        GENERATED ALWAYS AS (text_to_boolean_or_null(private_dining_jsonb ->> 'available')) STORED,
+    ADD COLUMN IF NOT EXISTS private_dining_capacity INTEGER
+        GENERATED ALWAYS AS (text_to_integer_or_null(private_dining_jsonb ->> 'capacity')) STORED;
+
+ALTER TABLE venues
+    ADD COLUMN IF NOT EXISTS max_private_room_capacity INTEGER
+        GENERATED ALWAYS AS (jsonb_max_room_capacity(private_rooms_jsonb)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_restaurants_private_dining
+ON restaurants(private_dining_capacity)
+WHERE private_dining_available AND deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_venues_private_room_capacity
+ON venues(max_private_room_capacity)
+WHERE deleted_at IS NULL;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- EXPLAIN
+-- SELECT restaurant_id, name FROM restaurants
+-- WHERE private_dining_available AND private_dining_capacity >= 20
+--   AND deleted_at IS NULL;
+--
+-- Expected: Index Scan using idx_restaurants_private_dining
+--
+-- =====================================================
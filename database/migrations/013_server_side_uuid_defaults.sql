@@ -0,0 +1,39 @@
+-- =====================================================
+-- Migration 013: Server-Generated IDs for Append-Heavy Tables
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Let the database assign primary keys for messages, dates,
+-- reminders and recommendations instead of the API generating them
+--
+-- Background:
+-- - The backend generated str(uuid4()) for every inserted message,
+--   reminder rule, date item and date category, even though every call
+--   site reads the id back from the inserted row
+-- - The app no longer sends these ids, so the column default is the only
+--   source; gen_random_uuid() is built in (PostgreSQL 13+) and avoids the
+--   uuid-ossp extension call
+--
+-- Changes:
+-- 1. PK default -> gen_random_uuid() on messages, date_categories,
+--    date_items, reminder_rules, recommendations, interaction_feedback
+--
+-- =====================================================
+
+ALTER TABLE messages ALTER COLUMN message_id SET DEFAULT gen_random_uuid();
+ALTER TABLE date_categories ALTER COLUMN category_id SET DEFAULT gen_random_uuid();
+ALTER TABLE date_items ALTER COLUMN date_item_id SET DEFAULT gen_random_uuid();
+ALTER TABLE reminder_rules ALTER COLUMN reminder_rule_id SET DEFAULT gen_random_uuid();
+ALTER TABLE recommendations ALTER COLUMN recommendation_id SET DEFAULT gen_random_uuid();
+ALTER TABLE interaction_feedback ALTER COLUMN feedback_id SET DEFAULT gen_random_uuid();
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- SELECT table_name, column_default
+-- FROM information_schema.columns
+-- WHERE column_default LIKE 'gen_random_uuid%';
+--
+-- Expected: 6 rows
+--
+-- =====================================================
@@ -0,0 +1,64 @@
+-- =====================================================
+-- Migration 014: Materialized Date Item Occurrences
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Answer "dates in the next N days" with an indexed range scan
+-- instead of expanding recurrence rules at read time
+--
+-- Background:
+-- - date_items.recurrence_rule is iCal RRULE text and next_occurrence was
+--   only ever set to date_value, so recurring dates never advanced
+-- - The backend now expands each rule ~2 years ahead (dateutil) when a date
+--   item is created or its date_value/recurrence_rule changes, stores the
+--   dates here, and sets next_occurrence to the first upcoming one
+-- - One-off dates get a single row
+--
+-- Changes:
+-- 1. date_item_occurrences(date_item_id, org_id, person_id, occurs_on)
+-- 2. (org_id, occurs_on) and (person_id, occurs_on) btree indexes
+-- 3. RLS: select mirrors date_items; writes are service-role only
+--
+-- Existing date items have no rows until they are next saved (migration
+-- 028 backfills them).
+--
+-- =====================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS date_item_occurrences (
+    date_item_id UUID NOT NULL REFERENCES date_items(date_item_id) ON DELETE CASCADE,
+    org_id UUID NOT NULL REFERENCES organizations(org_id),
+    person_id UUID NOT NULL REFERENCES persons(person_id),
+    occurs_on DATE NOT NULL,
+    PRIMARY KEY (date_item_id, occurs_on)
+);
+
+CREATE INDEX IF NOT EXISTS idx_date_item_occurrences_org ON date_item_occurrences(org_id, occurs_on);
+CREATE INDEX IF NOT EXISTS idx_date_item_occurrences_person ON date_item_occurrences(person_id, occurs_on);
+
+ALTER TABLE date_item_occurrences ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS date_item_occurrences_select_policy ON date_item_occurrences;
+CREATE POLICY date_item_occurrences_select_policy ON date_item_occurrences
+  FOR SELECT
+  USING (
+    org_id = public.user_org_id() AND (
+      public.user_account_type() IN ('admin', 'concierge', 'analyst') OR
+      person_id = public.user_person_id()
+    )
+  );
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- EXPLAIN
+-- SELECT date_item_id, occurs_on FROM date_item_occurrences
+-- WHERE person_id = '00000000-0000-0000-0000-000000000001'
+--   AND occurs_on BETWEEN CURRENT_DATE AND CURRENT_DATE + 90;
+--
+-- Expected: Index Scan using idx_date_item_occurrences_person
+--
+-- =====================================================
@@ -0,0 +1,59 @@
+-- =====================================================
+-- Migration 015: Composite Indexes for Per-Person/Per-Parent Listings
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Serve the app's list queries (filter on a parent id, order by a
+-- second column) from one index without a separate sort
+--
+-- Background:
+-- - ContextBuilder and the dashboard run these on every message/page view:
+--     conversations  WHERE person_id = ?       ORDER BY updated_at DESC
+--     messages       WHERE conversation_id = ? ORDER BY created_at
+--     date_items     WHERE person_id = ?       ORDER BY next_occurrence
+--     projects       WHERE person_id = ? [AND status IN (...)] ORDER BY priority
+--     recommendations WHERE project_id IN (...) ORDER BY created_at DESC
+--     vendors        WHERE org_id = ? AND vendor_type = ?
+-- - Each had a single-column index on the filter column only
+--
+-- Changes:
+-- Each single-column index is replaced by a composite with the same leading
+-- column, so the old index is redundant and dropped. Index names stay
+-- the same except idx_vendors_org -> idx_vendors_org_type.
+--
+-- =====================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_conversations_person;
+CREATE INDEX idx_conversations_person ON conversations(person_id, updated_at DESC) WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_messages_conversation;
+CREATE INDEX idx_messages_conversation ON messages(conversation_id, created_at DESC) WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_date_items_person;
+CREATE INDEX idx_date_items_person ON date_items(person_id, next_occurrence) WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_projects_person;
+CREATE INDEX idx_projects_person ON projects(person_id, status, priority) WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_recommendations_project;
+CREATE INDEX idx_recommendations_project ON recommendations(project_id, created_at DESC) WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_vendors_org;
+CREATE INDEX IF NOT EXISTS idx_vendors_org_type ON vendors(org_id, vendor_type) WHERE deleted_at IS NULL;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- EXPLAIN
+-- SELECT * FROM messages
+-- WHERE conversation_id = '00000000-0000-0000-0000-000000000001'
+--   AND deleted_at IS NULL
+-- ORDER BY created_at DESC LIMIT 20;
+--
+-- Expected: Index Scan using idx_messages_conversation, no Sort node
+--
+-- =====================================================
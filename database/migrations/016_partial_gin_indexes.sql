@@ -0,0 +1,55 @@
+-- =====================================================
+-- Migration 016: Exclude Soft-Deleted Rows from GIN Indexes
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Shrink the JSONB GIN indexes to the rows the app can actually
+-- query
+--
+-- Background:
+-- - Every btree on a soft-deletable table is already partial
+--   (WHERE deleted_at IS NULL); the tag/metadata GIN indexes from
+--   migration 009 were the exception
+-- - All app reads go through SupabaseQuery.select_active/get_by_id, which
+--   always add deleted_at IS NULL, so the partial indexes remain usable
+-- - GIN indexes are the most expensive to maintain and keep cached, so
+--   dropping dead rows from them pays off most
+-- - idx_persons_auth_user stays a full index: user_person_id() (RLS)
+--   looks up by auth_user_id without a deleted_at predicate
+--
+-- =====================================================
+
+DROP INDEX IF EXISTS idx_persons_metadata;
+CREATE INDEX idx_persons_metadata ON persons USING gin(metadata_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_projects_metadata;
+CREATE INDEX idx_projects_metadata ON projects USING gin(metadata_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_vendors_tags;
+CREATE INDEX idx_vendors_tags ON vendors USING gin(tags_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_venues_tags;
+CREATE INDEX idx_venues_tags ON venues USING gin(tags_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_restaurants_tags;
+CREATE INDEX idx_restaurants_tags ON restaurants USING gin(tags_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_products_tags;
+CREATE INDEX idx_products_tags ON products USING gin(tags_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- Indexes on soft-deletable tables that still include deleted rows:
+--
+-- SELECT i.indexname
+-- FROM pg_indexes i
+-- JOIN information_schema.columns c
+--   ON c.table_name = i.tablename AND c.column_name = 'deleted_at'
+-- WHERE i.schemaname = 'public'
+--   AND i.indexdef NOT LIKE '%WHERE%'
+--   AND i.indexname NOT LIKE '%_pkey';
+--
+-- Expected: idx_persons_auth_user only (intentionally full)
+--
+-- =====================================================
@@ -0,0 +1,36 @@
+-- =====================================================
+-- Migration 017: BRIN Indexes for Append-Only Timestamps
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Replace the ever-growing created_at btree on messages with a
+-- BRIN index, and give interaction_feedback a cheap time-range index
+--
+-- Background:
+-- - messages and interaction_feedback are insert-only; created_at follows
+--   physical row order, which is exactly what BRIN summarizes
+-- - BRIN keeps one min/max entry per 32 pages, so the index is orders of
+--   magnitude smaller than a btree and costs almost nothing on insert
+-- - Per-conversation history reads use idx_messages_conversation
+--   (conversation_id, created_at DESC) from migration 015, not this index
+-- - reminder_rules.scheduled_datetime is deliberately left on its partial
+--   btree: scheduled times are unrelated to insert order, so BRIN ranges
+--   would overlap and prune nothing
+--
+-- =====================================================
+
+DROP INDEX IF EXISTS idx_messages_created;
+CREATE INDEX IF NOT EXISTS idx_messages_created_brin
+ON messages USING brin(created_at) WITH (pages_per_range = 32);
+
+CREATE INDEX IF NOT EXISTS idx_interaction_feedback_created_brin
+ON interaction_feedback USING brin(created_at) WITH (pages_per_range = 32);
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- SELECT indexrelid::regclass, pg_size_pretty(pg_relation_size(indexrelid))
+-- FROM pg_index
+-- WHERE indrelid IN ('messages'::regclass, 'interaction_feedback'::regclass);
+--
+-- =====================================================
@@ -0,0 +1,48 @@
+-- =====================================================
+-- Migration 018: Full-Text Search for Vendors, Restaurants and Products
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Index name/description text so free-text lookups don't fall
+-- back to ILIKE '%...%' sequential scans
+--
+-- Changes:
+-- 1. search_vector TSVECTOR STORED generated column on vendors,
+--    restaurants and products: name weighted A, description weighted B
+-- 2. Partial GIN index on each search_vector
+--
+-- Query pattern (supabase-py):
+--   db.table('restaurants').select('*')
+--     .text_search('search_vector', 'rooftop italian',
+--                  options={'type': 'plain', 'config': 'english'})
+--     .is_('deleted_at', 'null')
+-- which PostgREST sends as search_vector @@ plainto_tsquery('english', ...)
+--
+-- =====================================================
+
+BEGIN;
+
+ALTER TABLE vendors ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED;
+ALTER TABLE restaurants ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED;
+ALTER TABLE products ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_vendors_search ON vendors USING gin(search_vector) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_restaurants_search ON restaurants USING gin(search_vector) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_products_search ON products USING gin(search_vector) WHERE deleted_at IS NULL;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- EXPLAIN
+-- SELECT name FROM restaurants
+-- WHERE search_vector @@ plainto_tsquery('english', 'private dining')
+--   AND deleted_at IS NULL;
+--
+-- Expected: Bitmap Index Scan on idx_restaurants_search
+--
+-- =====================================================
@@ -0,0 +1,52 @@
+-- =====================================================
+-- Migration 019: Hash Indexes for External Identifier Lookups
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Smaller indexes for the two equality-only lookups on long,
+-- opaque identifiers (Slack IDs, email addresses, Message-IDs)
+--
+-- Background:
+-- - Every inbound Slack message resolves the sender by
+--   comm_identities.identity_value and the thread by
+--   conversations.external_thread_id, always with = (never range/prefix)
+-- - A hash index stores a 4-byte hash per row regardless of value length,
+--   so it stays compact and shallow as identifiers get longer
+-- - A generated hash column was considered, but PostgREST filters cannot
+--   compute hashtextextended() client-side; the planner applies a hash
+--   index to plain eq filters automatically
+-- - channel_type is low-cardinality and is rechecked on the few matches
+-- - messages.external_message_id is never looked up, so it stays unindexed
+--
+-- Changes:
+-- Rebuild idx_comm_identities_channel and idx_conversations_external
+-- (migration 005) as partial HASH indexes. The UNIQUE
+-- (org_id, channel_type, identity_value) constraint is unchanged.
+--
+-- =====================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_comm_identities_channel;
+CREATE INDEX idx_comm_identities_channel
+ON comm_identities USING hash(identity_value)
+WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_conversations_external;
+CREATE INDEX idx_conversations_external
+ON conversations USING hash(external_thread_id)
+WHERE deleted_at IS NULL;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- EXPLAIN
+-- SELECT * FROM comm_identities
+-- WHERE channel_type = 'slack' AND identity_value = 'U0123456789'
+--   AND deleted_at IS NULL;
+--
+-- Expected: Index Scan using idx_comm_identities_channel
+--
+-- =====================================================
@@ -0,0 +1,59 @@
+-- =====================================================
+-- Migration 020: Per-Type Partial Indexes for Recommendation Items
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Make recommendation <-> catalog joins index-backed for each
+-- item type without a UNION across vendors/venues/restaurants/products
+--
+-- Background:
+-- - recommendations.item_id is a polymorphic reference: item_type says
+--   which catalog table it points at, so it cannot carry a real FK
+-- - Readers always resolve one type at a time (the dashboard batches one
+--   IN query per catalog table), and "which recommendations point at this
+--   vendor" is always item_type = 'vendor' AND item_id = ...
+-- - A partial index per type is smaller than the composite
+--   (item_type, item_id) index and drops the low-cardinality leading key
+-- - Splitting into four link tables with real FKs was considered; it would
+--   turn every recommendation insert into two writes for no read benefit
+--   the partial indexes do not already give
+--
+-- Changes:
+-- 1. Replace idx_recommendations_item with one partial index per item_type
+--
+-- =====================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_recommendations_item;
+
+CREATE INDEX IF NOT EXISTS idx_recommendations_vendor_item
+ON recommendations(item_id)
+WHERE item_type = 'vendor' AND deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_recommendations_venue_item
+ON recommendations(item_id)
+WHERE item_type = 'venue' AND deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_recommendations_restaurant_item
+ON recommendations(item_id)
+WHERE item_type = 'restaurant' AND deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_recommendations_product_item
+ON recommendations(item_id)
+WHERE item_type = 'product' AND deleted_at IS NULL;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- EXPLAIN
+-- SELECT recommendation_id FROM recommendations
+-- WHERE item_type = 'vendor'
+--   AND item_id = '00000000-0000-0000-0000-000000000000'
+--   AND deleted_at IS NULL;
+--
+-- Expected: Index Scan using idx_recommendations_vendor_item
+--
+-- =====================================================
@@ -0,0 +1,59 @@
+-- =====================================================
+-- Migration 021: Covering Indexes for Dashboard List Reads
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Let the dashboard's narrow list reads run as index-only scans
+-- instead of fetching every matching heap row
+--
+-- Background:
+-- - The dashboard reads projects as (project_id, title, status, priority,
+--   due_date) ordered by priority, created_at DESC per person
+-- - Task progress reads only (project_id, status) for the open projects
+-- - Message counts per conversation read only message_id
+-- - Each of these already has a btree on the filter columns; adding the
+--   projected columns as INCLUDE payload avoids the heap visit (messages
+--   and tasks are mostly-static rows, so the visibility map stays set)
+-- - The list API endpoints return full rows and are not affected
+--
+-- Changes:
+-- 1. New idx_projects_person_list (person_id, priority, created_at DESC)
+--    INCLUDE (project_id, title, status, due_date)
+-- 2. Rebuild idx_tasks_project (project_id, sort_order) INCLUDE (status)
+-- 3. Rebuild idx_messages_conversation (conversation_id, created_at DESC)
+--    INCLUDE (message_id)
+--
+-- =====================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_projects_person_list
+ON projects(person_id, priority, created_at DESC)
+INCLUDE (project_id, title, status, due_date)
+WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_tasks_project;
+CREATE INDEX idx_tasks_project
+ON tasks(project_id, sort_order)
+INCLUDE (status)
+WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_messages_conversation;
+CREATE INDEX idx_messages_conversation
+ON messages(conversation_id, created_at DESC)
+INCLUDE (message_id)
+WHERE deleted_at IS NULL;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- EXPLAIN
+-- SELECT message_id FROM messages
+-- WHERE conversation_id = '00000000-0000-0000-0000-000000000000'
+--   AND deleted_at IS NULL;
+--
+-- Expected: Index Only Scan using idx_messages_conversation
+--
+-- =====================================================
@@ -0,0 +1,194 @@
+-- =====================================================
+-- Migration 022: Normalized Tags for Vendors, Venues, Restaurants, Products
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Make tag analytics ("how many vendors are tagged X", tag counts
+-- per org) plain btree joins and GROUP BYs instead of GIN scans over
+-- tags_jsonb
+--
+-- Background:
+-- - The four catalog tables store tags as a JSONB array of strings
+-- - GIN (migration 009) serves "has tag X" filters well, but cannot
+--   aggregate over tags without unnesting every row
+-- - tags_jsonb stays the write path and the fast path for single-row
+--   reads; the link tables are maintained from it by a trigger, so no
+--   writer has to change
+--
+-- Changes:
+-- 1. tags(tag_id, org_id, name) with UNIQUE (org_id, name)
+-- 2. vendor_tags, venue_tags, restaurant_tags, product_tags
+--    (entity_id, tag_id) with a reverse (tag_id, entity_id) index
+-- 3. sync_tags_from_jsonb() trigger on INSERT / UPDATE OF tags_jsonb
+-- 4. Backfill from existing tags_jsonb
+-- 5. RLS: org-scoped reads; writes happen only through the trigger
+--
+-- =====================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS tags (
+    tag_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    org_id UUID NOT NULL REFERENCES organizations(org_id),
+    name TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE (org_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS vendor_tags (
+    vendor_id UUID NOT NULL REFERENCES vendors(vendor_id) ON DELETE CASCADE,
+    tag_id UUID NOT NULL REFERENCES tags(tag_id) ON DELETE CASCADE,
+    PRIMARY KEY (vendor_id, tag_id)
+);
+CREATE INDEX IF NOT EXISTS idx_vendor_tags_tag ON vendor_tags(tag_id, vendor_id);
+
+CREATE TABLE IF NOT EXISTS venue_tags (
+    venue_id UUID NOT NULL REFERENCES venues(venue_id) ON DELETE CASCADE,
+    tag_id UUID NOT NULL REFERENCES tags(tag_id) ON DELETE CASCADE,
+    PRIMARY KEY (venue_id, tag_id)
+);
+CREATE INDEX IF NOT EXISTS idx_venue_tags_tag ON venue_tags(tag_id, venue_id);
+
+CREATE TABLE IF NOT EXISTS restaurant_tags (
+    restaurant_id UUID NOT NULL REFERENCES restaurants(restaurant_id) ON DELETE CASCADE,
+    tag_id UUID NOT NULL REFERENCES tags(tag_id) ON DELETE CASCADE,
+    PRIMARY KEY (restaurant_id, tag_id)
+);
+CREATE INDEX IF NOT EXISTS idx_restaurant_tags_tag ON restaurant_tags(tag_id, restaurant_id);
+
+CREATE TABLE IF NOT EXISTS product_tags (
+    product_id UUID NOT NULL REFERENCES products(product_id) ON DELETE CASCADE,
+    tag_id UUID NOT NULL REFERENCES tags(tag_id) ON DELETE CASCADE,
+    PRIMARY KEY (product_id, tag_id)
+);
+CREATE INDEX IF NOT EXISTS idx_product_tags_tag ON product_tags(tag_id, product_id);
+
+-- Keep <entity>_tags in step with tags_jsonb.
+-- TG_ARGV: link table, entity id column. SECURITY DEFINER so RLS-scoped
+-- writers (concierges editing a vendor) can maintain the link rows.
+CREATE OR REPLACE FUNCTION sync_tags_from_jsonb()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    link_table TEXT := TG_ARGV[0];
+    id_column TEXT := TG_ARGV[1];
+    entity_id UUID;
+    tag_names TEXT[];
+BEGIN
+    EXECUTE format('SELECT ($1).%I', id_column) INTO entity_id USING NEW;
+
+    tag_names := ARRAY(
+        SELECT DISTINCT jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(NEW.tags_jsonb) = 'array' THEN NEW.tags_jsonb ELSE '[]'::jsonb END
+        )
+    );
+
+    INSERT INTO tags (org_id, name)
+    SELECT NEW.org_id, unnest(tag_names)
+    ON CONFLICT (org_id, name) DO NOTHING;
+
+    EXECUTE format('DELETE FROM %I WHERE %I = $1', link_table, id_column) USING entity_id;
+    EXECUTE format(
+        'INSERT INTO %I (%I, tag_id) SELECT $1, tag_id FROM tags WHERE org_id = $2 AND name = ANY($3)',
+        link_table, id_column
+    ) USING entity_id, NEW.org_id, tag_names;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    entity RECORD;
+BEGIN
+    FOR entity IN
+        SELECT * FROM (VALUES
+            ('vendors', 'vendor_tags', 'vendor_id'),
+            ('venues', 'venue_tags', 'venue_id'),
+            ('restaurants', 'restaurant_tags', 'restaurant_id'),
+            ('products', 'product_tags', 'product_id')
+        ) AS t(entity_table, link_table, id_column)
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS sync_%I ON %I', entity.link_table, entity.entity_table);
+        EXECUTE format(
+            'CREATE TRIGGER sync_%I
+             AFTER INSERT OR UPDATE OF tags_jsonb ON %I
+             FOR EACH ROW
+             EXECUTE FUNCTION sync_tags_from_jsonb(%L, %L)',
+            entity.link_table, entity.entity_table, entity.link_table, entity.id_column
+        );
+
+        -- Backfill
+        EXECUTE format(
+            'INSERT INTO tags (org_id, name)
+             SELECT DISTINCT e.org_id, t.name
+             FROM %I e
+             CROSS JOIN LATERAL jsonb_array_elements_text(
+                 CASE WHEN jsonb_typeof(e.tags_jsonb) = ''array'' THEN e.tags_jsonb ELSE ''[]''::jsonb END
+             ) AS t(name)
+             ON CONFLICT (org_id, name) DO NOTHING',
+            entity.entity_table
+        );
+        EXECUTE format(
+            'INSERT INTO %I (%I, tag_id)
+             SELECT DISTINCT e.%I, tags.tag_id
+             FROM %I e
+             CROSS JOIN LATERAL jsonb_array_elements_text(
+                 CASE WHEN jsonb_typeof(e.tags_jsonb) = ''array'' THEN e.tags_jsonb ELSE ''[]''::jsonb END
+             ) AS t(name)
+             JOIN tags ON tags.org_id = e.org_id AND tags.name = t.name
+             ON CONFLICT DO NOTHING',
+            entity.link_table, entity.id_column, entity.id_column, entity.entity_table
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+ALTER TABLE tags ENABLE ROW LEVEL SECURITY;
+ALTER TABLE vendor_tags ENABLE ROW LEVEL SECURITY;
+ALTER TABLE venue_tags ENABLE ROW LEVEL SECURITY;
+ALTER TABLE restaurant_tags ENABLE ROW LEVEL SECURITY;
+ALTER TABLE product_tags ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS tags_select_policy ON tags;
+CREATE POLICY tags_select_policy ON tags
+  FOR SELECT
+  USING (org_id = public.user_org_id());
+
+DROP POLICY IF EXISTS vendor_tags_select_policy ON vendor_tags;
+CREATE POLICY vendor_tags_select_policy ON vendor_tags
+  FOR SELECT
+  USING (tag_id IN (SELECT tag_id FROM tags WHERE org_id = public.user_org_id()));
+
+DROP POLICY IF EXISTS venue_tags_select_policy ON venue_tags;
+CREATE POLICY venue_tags_select_policy ON venue_tags
+  FOR SELECT
+  USING (tag_id IN (SELECT tag_id FROM tags WHERE org_id = public.user_org_id()));
+
+DROP POLICY IF EXISTS restaurant_tags_select_policy ON restaurant_tags;
+CREATE POLICY restaurant_tags_select_policy ON restaurant_tags
+  FOR SELECT
+  USING (tag_id IN (SELECT tag_id FROM tags WHERE org_id = public.user_org_id()));
+
+DROP POLICY IF EXISTS product_tags_select_policy ON product_tags;
+CREATE POLICY product_tags_select_policy ON product_tags
+  FOR SELECT
+  USING (tag_id IN (SELECT tag_id FROM tags WHERE org_id = public.user_org_id()));
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- Vendors per tag within an org:
+--
+-- SELECT tags.name, COUNT(*) AS vendors
+-- FROM tags
+-- JOIN vendor_tags USING (tag_id)
+-- WHERE tags.org_id = '00000000-0000-0000-0000-000000000001'
+-- GROUP BY tags.name
+-- ORDER BY vendors DESC;
+--
+-- =====================================================
@@ -0,0 +1,57 @@
+-- =====================================================
+-- Migration 023: Last-N Messages per Conversation in One Call
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Let the context builder fetch the latest messages of several
+-- conversations in a single round trip
+--
+-- Background:
+-- - Agent context includes the last 5 messages of the person's 3 most
+--   recent conversations; that was one PostgREST request per conversation
+-- - PostgREST can filter conversation_id IN (...) but cannot limit per
+--   group, so the per-conversation cap needs a window function
+-- - Each partition is read through idx_messages_conversation
+--   (conversation_id, created_at DESC)
+--
+-- Changes:
+-- 1. recent_conversation_messages(conversation_ids, per_conversation)
+--    returns (conversation_id, direction, content_text, created_at),
+--    newest first within each conversation. Called via PostgREST RPC.
+--
+-- =====================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION recent_conversation_messages(
+    p_conversation_ids UUID[],
+    p_per_conversation INTEGER DEFAULT 5
+)
+RETURNS TABLE (
+    conversation_id UUID,
+    direction TEXT,
+    content_text TEXT,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT ranked.conversation_id, ranked.direction, ranked.content_text, ranked.created_at
+    FROM (
+        SELECT m.conversation_id, m.direction::text AS direction, m.content_text, m.created_at,
+               row_number() OVER (PARTITION BY m.conversation_id ORDER BY m.created_at DESC) AS rn
+        FROM messages m
+        WHERE m.conversation_id = ANY(p_conversation_ids)
+          AND m.deleted_at IS NULL
+    ) ranked
+    WHERE ranked.rn <= p_per_conversation
+    ORDER BY ranked.conversation_id, ranked.created_at DESC;
+$$ LANGUAGE sql STABLE;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- SELECT * FROM recent_conversation_messages(
+--     ARRAY['00000000-0000-0000-0000-000000000000']::uuid[], 5
+-- );
+--
+-- =====================================================
@@ -0,0 +1,74 @@
+-- =====================================================
+-- Migration 024: Get-or-Create Conversation in One Call
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Resolve the conversation for a proactive message in a single
+-- round trip, without racing concurrent senders into duplicate rows
+--
+-- Background:
+-- - ProactiveMessagingService looked the conversation up, then inserted
+--   one on a miss: two round trips, and two workers messaging the same
+--   person at once could both miss and both insert
+-- - A unique index on (person_id, channel_type, external_thread_id) would
+--   allow INSERT ... ON CONFLICT, but existing duplicate rows would make
+--   the index build fail, and PostgREST's on_conflict cannot target the
+--   partial indexes that soft deletes require
+--
+-- Changes:
+-- 1. get_or_create_conversation(...) serializes callers per
+--    (person, channel, thread) with a transaction-scoped advisory lock,
+--    returns the live match if there is one, and inserts otherwise.
+--    A NULL p_external_thread_id matches any thread of that channel
+--    (email/sms keep a single conversation per person). Called via
+--    PostgREST RPC.
+--
+-- =====================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION get_or_create_conversation(
+    p_org_id UUID,
+    p_person_id UUID,
+    p_channel_type TEXT,
+    p_external_thread_id TEXT DEFAULT NULL,
+    p_subject TEXT DEFAULT NULL
+)
+RETURNS SETOF conversations AS $$
+DECLARE
+    found conversations;
+BEGIN
+    PERFORM pg_advisory_xact_lock(
+        hashtext(p_person_id::text || ':' || p_channel_type || ':' || COALESCE(p_external_thread_id, ''))
+    );
+
+    SELECT * INTO found
+    FROM conversations c
+    WHERE c.person_id = p_person_id
+      AND c.channel_type = p_channel_type
+      AND (p_external_thread_id IS NULL OR c.external_thread_id = p_external_thread_id)
+      AND c.deleted_at IS NULL
+    LIMIT 1;
+
+    IF FOUND THEN
+        RETURN NEXT found;
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    INSERT INTO conversations (org_id, person_id, channel_type, external_thread_id, subject, status)
+    VALUES (p_org_id, p_person_id, p_channel_type, p_external_thread_id, p_subject, 'active')
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- SELECT proname, pg_get_function_identity_arguments(oid)
+-- FROM pg_proc
+-- WHERE proname = 'get_or_create_conversation';
+--
+-- =====================================================
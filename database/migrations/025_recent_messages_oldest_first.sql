@@ -0,0 +1,55 @@
+-- =====================================================
+-- Migration 025: Return Recent Messages Oldest First
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Have recent_conversation_messages return rows in the order the
+-- context builder renders them
+--
+-- Background:
+-- - Migration 023 returns each conversation's last N messages newest first,
+--   and the context builder reversed every group in Python
+-- - Which rows are kept is still decided by row_number() over
+--   created_at DESC; only the output order changes
+--
+-- Changes:
+-- 1. recent_conversation_messages(...) now orders by conversation_id,
+--    created_at ASC. Signature and columns are unchanged.
+--
+-- =====================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION recent_conversation_messages(
+    p_conversation_ids UUID[],
+    p_per_conversation INTEGER DEFAULT 5
+)
+RETURNS TABLE (
+    conversation_id UUID,
+    direction TEXT,
+    content_text TEXT,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT ranked.conversation_id, ranked.direction, ranked.content_text, ranked.created_at
+    FROM (
+        SELECT m.conversation_id, m.direction::text AS direction, m.content_text, m.created_at,
+               row_number() OVER (PARTITION BY m.conversation_id ORDER BY m.created_at DESC) AS rn
+        FROM messages m
+        WHERE m.conversation_id = ANY(p_conversation_ids)
+          AND m.deleted_at IS NULL
+    ) ranked
+    WHERE ranked.rn <= p_per_conversation
+    ORDER BY ranked.conversation_id, ranked.created_at;
+$$ LANGUAGE sql STABLE;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- SELECT * FROM recent_conversation_messages(
+--     ARRAY['00000000-0000-0000-0000-000000000000']::uuid[], 5
+-- );
+-- (created_at should ascend within each conversation_id)
+--
+-- =====================================================
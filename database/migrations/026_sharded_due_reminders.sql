@@ -0,0 +1,53 @@
+-- =====================================================
+-- Migration 026: Sharded Due-Reminder Scan
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Let several reminder workers split the due reminders between
+-- them without coordinating
+--
+-- Background:
+-- - Every app process runs a reminder worker thread, and each scan sends
+--   the due reminders one after another (each waits on model generation)
+-- - With more than one process, every worker saw every due reminder
+-- - PostgREST filters cannot hash a column, so the shard predicate needs
+--   a function
+--
+-- Changes:
+-- 1. due_reminders(p_now, p_shard, p_shard_count) returns the unsent,
+--    undeleted reminders scheduled at or before p_now whose
+--    comm_identity_id hashes to p_shard, oldest first. Sharding by
+--    recipient identity keeps one person's reminders on one worker.
+--    Reads through idx_reminder_rules_pending. Called via PostgREST RPC.
+--
+-- =====================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION due_reminders(
+    p_now TIMESTAMPTZ,
+    p_shard INTEGER DEFAULT 0,
+    p_shard_count INTEGER DEFAULT 1
+)
+RETURNS SETOF reminder_rules AS $$
+    SELECT r.*
+    FROM reminder_rules r
+    WHERE r.sent_at IS NULL
+      AND r.deleted_at IS NULL
+      AND r.scheduled_datetime <= p_now
+      AND mod(abs(hashtext(r.comm_identity_id::text)::bigint), p_shard_count) = p_shard
+    ORDER BY r.scheduled_datetime;
+$$ LANGUAGE sql STABLE;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- Every due reminder lands in exactly one of N shards:
+--
+-- SELECT s, count(*)
+-- FROM generate_series(0, 3) s, due_reminders(NOW(), s, 4)
+-- GROUP BY s;
+--
+-- =====================================================
@@ -0,0 +1,62 @@
+-- =====================================================
+-- Migration 027: Latest Recommendations Per Project
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Let the dashboard fetch the latest few recommendations of
+-- several projects in one round trip without reading all of them
+--
+-- Background:
+-- - The dashboard shows at most 2 recommendations from each of its first
+--   5 projects
+-- - A single IN query cannot cap rows per project, so it returned every
+--   recommendation of those projects and Python discarded the rest
+--
+-- Changes:
+-- 1. recent_project_recommendations(p_project_ids, p_per_project) returns
+--    the newest p_per_project undeleted recommendations of each project,
+--    newest first overall. Each project is a LATERAL LIMIT over
+--    idx_recommendations_project. Called via PostgREST RPC.
+--
+-- =====================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION recent_project_recommendations(
+    p_project_ids UUID[],
+    p_per_project INTEGER DEFAULT 2
+)
+RETURNS TABLE (
+    recommendation_id UUID,
+    project_id UUID,
+    item_type VARCHAR,
+    item_id UUID,
+    rationale_text TEXT,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT r.recommendation_id, r.project_id, r.item_type, r.item_id, r.rationale_text, r.created_at
+    FROM unnest(p_project_ids) AS p(project_id)
+    CROSS JOIN LATERAL (
+        SELECT rec.*
+        FROM recommendations rec
+        WHERE rec.project_id = p.project_id
+          AND rec.deleted_at IS NULL
+        ORDER BY rec.created_at DESC
+        LIMIT p_per_project
+    ) r
+    ORDER BY r.created_at DESC;
+$$ LANGUAGE sql STABLE;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- EXPLAIN
+-- SELECT * FROM recent_project_recommendations(
+--     ARRAY['00000000-0000-0000-0000-000000000000']::uuid[], 2
+-- );
+--
+-- Expected: Index Scan using idx_recommendations_project per project
+--
+-- =====================================================
@@ -0,0 +1,147 @@
+-- =====================================================
+-- Migration 028: Date Item Occurrence Upkeep
+-- Date: 2026-10-15
+-- =====================================================
+--
+-- Purpose: Make date_item_occurrences (migration 014) the source the date
+-- views read from, and keep it current
+--
+-- Background:
+-- - Occurrences were replaced with a DELETE and a separate INSERT request,
+--   so a failure in between left an item with no occurrences
+-- - Nothing read the table; the dashboard and context builder still
+--   filtered next_occurrence
+-- - next_occurrence was only recomputed when an item was saved, so it
+--   stopped at the first expanded date and the horizon never rolled
+--
+-- Changes:
+-- 1. replace_date_item_occurrences(p_date_item_id, p_occurs_on,
+--    p_next_occurrence): swaps an item's occurrences and sets its
+--    next_occurrence in one transaction
+-- 2. Trigger: soft-deleting a date item removes its occurrences
+-- 3. upcoming_date_occurrences(p_person_id, p_from, p_to): each undeleted
+--    item's first occurrence in [p_from, p_to], soonest first, with the
+--    item columns the views show. Reads idx_date_item_occurrences_person.
+-- 4. date_items_due_for_expansion(p_today, p_limit): recurring items whose
+--    next_occurrence has passed, or that were never expanded. The reminder
+--    worker re-expands them from p_today.
+-- 5. Backfill: one-off items get their single occurrence; occurrences of
+--    already soft-deleted items are removed
+--
+-- =====================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION replace_date_item_occurrences(
+    p_date_item_id UUID,
+    p_occurs_on DATE[],
+    p_next_occurrence DATE
+)
+RETURNS VOID AS $$
+BEGIN
+    DELETE FROM date_item_occurrences WHERE date_item_id = p_date_item_id;
+
+    INSERT INTO date_item_occurrences (date_item_id, org_id, person_id, occurs_on)
+    SELECT di.date_item_id, di.org_id, di.person_id, o.occurs_on
+    FROM date_items di
+    CROSS JOIN (SELECT DISTINCT unnest(p_occurs_on) AS occurs_on) o
+    WHERE di.date_item_id = p_date_item_id
+      AND di.deleted_at IS NULL;
+
+    UPDATE date_items
+    SET next_occurrence = p_next_occurrence
+    WHERE date_item_id = p_date_item_id;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION delete_soft_deleted_date_item_occurrences()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM date_item_occurrences WHERE date_item_id = NEW.date_item_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS date_items_soft_delete_occurrences ON date_items;
+CREATE TRIGGER date_items_soft_delete_occurrences
+    AFTER UPDATE OF deleted_at ON date_items
+    FOR EACH ROW
+    WHEN (NEW.deleted_at IS NOT NULL AND OLD.deleted_at IS NULL)
+    EXECUTE FUNCTION delete_soft_deleted_date_item_occurrences();
+
+CREATE OR REPLACE FUNCTION upcoming_date_occurrences(
+    p_person_id UUID,
+    p_from DATE,
+    p_to DATE
+)
+RETURNS TABLE (
+    date_item_id UUID,
+    title VARCHAR,
+    category_id UUID,
+    date_value DATE,
+    notes TEXT,
+    occurs_on DATE
+) AS $$
+    SELECT nxt.date_item_id, di.title, di.category_id, di.date_value, di.notes, nxt.occurs_on
+    FROM (
+        SELECT DISTINCT ON (o.date_item_id) o.date_item_id, o.occurs_on
+        FROM date_item_occurrences o
+        WHERE o.person_id = p_person_id
+          AND o.occurs_on BETWEEN p_from AND p_to
+        ORDER BY o.date_item_id, o.occurs_on
+    ) nxt
+    JOIN date_items di ON di.date_item_id = nxt.date_item_id
+    WHERE di.deleted_at IS NULL
+    ORDER BY nxt.occurs_on, di.title;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION date_items_due_for_expansion(
+    p_today DATE,
+    p_limit INTEGER DEFAULT 100
+)
+RETURNS SETOF date_items AS $$
+    SELECT di.*
+    FROM date_items di
+    WHERE di.deleted_at IS NULL
+      AND di.recurrence_rule IS NOT NULL
+      AND (
+          di.next_occurrence < p_today
+          OR (
+              di.next_occurrence IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM date_item_occurrences o WHERE o.date_item_id = di.date_item_id
+              )
+          )
+      )
+    ORDER BY di.next_occurrence
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+INSERT INTO date_item_occurrences (date_item_id, org_id, person_id, occurs_on)
+SELECT di.date_item_id, di.org_id, di.person_id, di.date_value
+FROM date_items di
+WHERE di.recurrence_rule IS NULL
+  AND di.deleted_at IS NULL
+ON CONFLICT (date_item_id, occurs_on) DO NOTHING;
+
+DELETE FROM date_item_occurrences o
+USING date_items di
+WHERE di.date_item_id = o.date_item_id
+  AND di.deleted_at IS NOT NULL;
+
+COMMIT;
+
+-- =====================================================
+-- Verification Query
+-- =====================================================
+-- EXPLAIN
+-- SELECT * FROM upcoming_date_occurrences(
+--     '00000000-0000-0000-0000-000000000001', CURRENT_DATE, CURRENT_DATE + 90
+-- );
+--
+-- Expected: Index Scan using idx_date_item_occurrences_person
+--
+-- SELECT count(*) FROM date_items_due_for_expansion(CURRENT_DATE, 1000);
+-- (drops to 0 once the reminder worker has run)
+--
+-- =====================================================
@@ -98,6 +98,7 @@ ALTER TABLE addresses ENABLE ROW LEVEL SECURITY;
 -- Domain 4: Dates & Reminders
 ALTER TABLE date_categories ENABLE ROW LEVEL SECURITY;
 ALTER TABLE date_items ENABLE ROW LEVEL SECURITY;
+ALTER TABLE date_item_occurrences ENABLE ROW LEVEL SECURITY;
 ALTER TABLE reminder_rules ENABLE ROW LEVEL SECURITY;
 
 -- Domain 5: Projects & Tasks
@@ -110,6 +111,11 @@ ALTER TABLE vendors ENABLE ROW LEVEL SECURITY;
 ALTER TABLE venues ENABLE ROW LEVEL SECURITY;
 ALTER TABLE restaurants ENABLE ROW LEVEL SECURITY;
 ALTER TABLE products ENABLE ROW LEVEL SECURITY;
+ALTER TABLE tags ENABLE ROW LEVEL SECURITY;
+ALTER TABLE vendor_tags ENABLE ROW LEVEL SECURITY;
+ALTER TABLE venue_tags ENABLE ROW LEVEL SECURITY;
+ALTER TABLE restaurant_tags ENABLE ROW LEVEL SECURITY;
+ALTER TABLE product_tags ENABLE ROW LEVEL SECURITY;
 ALTER TABLE recommendations ENABLE ROW LEVEL SECURITY;
 ALTER TABLE interaction_feedback ENABLE ROW LEVEL SECURITY;
 
@@ -458,6 +464,17 @@ CREATE POLICY date_items_delete_policy ON date_items
     )
   );
 
+-- Date Item Occurrences: read-only mirror of date_items visibility
+-- (rows are written by the backend with the service role)
+CREATE POLICY date_item_occurrences_select_policy ON date_item_occurrences
+  FOR SELECT
+  USING (
+    org_id = public.user_org_id() AND (
+      public.user_account_type() IN ('admin', 'concierge', 'analyst') OR
+      person_id = public.user_person_id()
+    )
+  );
+
 -- Reminder Rules: Linked to date items OR comm_identity (for generic reminders)
 CREATE POLICY reminder_rules_select_policy ON reminder_rules
   FOR SELECT
@@ -672,6 +689,27 @@ CREATE POLICY products_delete_policy ON products
   FOR DELETE
   USING (org_id = public.user_org_id() AND public.is_admin());
 
+-- Tags: Org-scoped reads; rows are written only by sync_tags_from_jsonb()
+CREATE POLICY tags_select_policy ON tags
+  FOR SELECT
+  USING (org_id = public.user_org_id());
+
+CREATE POLICY vendor_tags_select_policy ON vendor_tags
+  FOR SELECT
+  USING (tag_id IN (SELECT tag_id FROM tags WHERE org_id = public.user_org_id()));
+
+CREATE POLICY venue_tags_select_policy ON venue_tags
+  FOR SELECT
+  USING (tag_id IN (SELECT tag_id FROM tags WHERE org_id = public.user_org_id()));
+
+CREATE POLICY restaurant_tags_select_policy ON restaurant_tags
+  FOR SELECT
+  USING (tag_id IN (SELECT tag_id FROM tags WHERE org_id = public.user_org_id()));
+
+CREATE POLICY product_tags_select_policy ON product_tags
+  FOR SELECT
+  USING (tag_id IN (SELECT tag_id FROM tags WHERE org_id = public.user_org_id()));
+
 -- Recommendations: Project-scoped
 CREATE POLICY recommendations_select_policy ON recommendations
   FOR SELECT
@@ -7,6 +7,22 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
 CREATE EXTENSION IF NOT EXISTS "vector";
 
+-- Time-ordered UUIDs for high-volume append-only keys (see migration 007)
+CREATE OR REPLACE FUNCTION uuid_generate_v7()
+RETURNS UUID AS $$
+DECLARE
+    uuid_bytes BYTEA;
+BEGIN
+    -- 48-bit big-endian unix timestamp (ms) followed by 80 random bits
+    uuid_bytes := substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                  || gen_random_bytes(10);
+    -- Version 7 in the high nibble of byte 6, RFC 4122 variant in byte 8
+    uuid_bytes := set_byte(uuid_bytes, 6, (b'0111' || get_byte(uuid_bytes, 6)::bit(4))::bit(8)::int);
+    uuid_bytes := set_byte(uuid_bytes, 8, (b'10' || get_byte(uuid_bytes, 8)::bit(6))::bit(8)::int);
+    RETURN encode(uuid_bytes, 'hex')::uuid;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
 -- =====================================================
 -- DOMAIN 1: IDENTITY & MULTI-TENANCY
 -- =====================================================
@@ -57,7 +73,7 @@ CREATE TABLE persons (
 CREATE INDEX idx_persons_org ON persons(org_id) WHERE deleted_at IS NULL;
 CREATE INDEX idx_persons_type ON persons(person_type) WHERE deleted_at IS NULL;
 CREATE INDEX idx_persons_auth_user ON persons(auth_user_id);
-CREATE INDEX idx_persons_metadata ON persons USING gin(metadata_jsonb);
+CREATE INDEX idx_persons_metadata ON persons USING gin(metadata_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
 
 -- =====================================================
 -- DOMAIN 2: COMMUNICATION INFRASTRUCTURE
@@ -81,7 +97,7 @@ CREATE TABLE comm_identities (
 );
 
 CREATE INDEX idx_comm_identities_person ON comm_identities(person_id) WHERE deleted_at IS NULL;
-CREATE INDEX idx_comm_identities_channel ON comm_identities(channel_type, identity_value) WHERE deleted_at IS NULL;
+CREATE INDEX idx_comm_identities_channel ON comm_identities USING hash(identity_value) WHERE deleted_at IS NULL;
 
 -- GDPR-compliant communication consent tracking
 CREATE TABLE comm_consent (
@@ -114,12 +130,12 @@ CREATE TABLE conversations (
     deleted_at TIMESTAMPTZ
 );
 
-CREATE INDEX idx_conversations_person ON conversations(person_id) WHERE deleted_at IS NULL;
-CREATE INDEX idx_conversations_external ON conversations(channel_type, external_thread_id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_conversations_person ON conversations(person_id, updated_at DESC) WHERE deleted_at IS NULL;
+CREATE INDEX idx_conversations_external ON conversations USING hash(external_thread_id) WHERE deleted_at IS NULL;
 
 -- Individual messages within conversations
 CREATE TABLE messages (
-    message_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    message_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     org_id UUID NOT NULL REFERENCES organizations(org_id),
     conversation_id UUID NOT NULL REFERENCES conversations(conversation_id),
     direction VARCHAR(20) NOT NULL CHECK (direction IN ('inbound', 'outbound')),
@@ -133,8 +149,8 @@ CREATE TABLE messages (
     deleted_at TIMESTAMPTZ
 );
 
-CREATE INDEX idx_messages_conversation ON messages(conversation_id) WHERE deleted_at IS NULL;
-CREATE INDEX idx_messages_created ON messages(created_at DESC) WHERE deleted_at IS NULL;
+CREATE INDEX idx_messages_conversation ON messages(conversation_id, created_at DESC) INCLUDE (message_id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_messages_created_brin ON messages USING brin(created_at) WITH (pages_per_range = 32);
 
 -- =====================================================
 -- DOMAIN 3: HOUSEHOLDS & ADDRESSES
@@ -181,6 +197,10 @@ CREATE TABLE addresses (
     person_id UUID REFERENCES persons(person_id),
     label VARCHAR(100), -- Primary, Billing, Shipping, etc.
     address_jsonb JSONB NOT NULL, -- {street, city, state, postal_code, country}
+    -- Promoted from address_jsonb for indexed filtering (see migration 011)
+    city VARCHAR(100) GENERATED ALWAYS AS (address_jsonb ->> 'city') STORED,
+    state VARCHAR(50) GENERATED ALWAYS AS (address_jsonb ->> 'state') STORED,
+    postal_code VARCHAR(20) GENERATED ALWAYS AS (address_jsonb ->> 'postal_code') STORED,
     is_primary BOOLEAN DEFAULT false,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
@@ -193,6 +213,9 @@ CREATE TABLE addresses (
 
 CREATE INDEX idx_addresses_household ON addresses(household_id) WHERE deleted_at IS NULL;
 CREATE INDEX idx_addresses_person ON addresses(person_id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_addresses_city ON addresses(city) WHERE deleted_at IS NULL;
+CREATE INDEX idx_addresses_state ON addresses(state) WHERE deleted_at IS NULL;
+CREATE INDEX idx_addresses_postal_code ON addresses(postal_code) WHERE deleted_at IS NULL;
 
 -- =====================================================
 -- DOMAIN 4: DATES & REMINDERS
@@ -200,7 +223,7 @@ CREATE INDEX idx_addresses_person ON addresses(person_id) WHERE deleted_at IS NU
 
 -- Date categories (types of important dates)
 CREATE TABLE date_categories (
-    category_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    category_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     org_id UUID NOT NULL REFERENCES organizations(org_id),
     category_name VARCHAR(255) NOT NULL,
     icon VARCHAR(50),
@@ -214,7 +237,7 @@ CREATE TABLE date_categories (
 
 -- Important dates
 CREATE TABLE date_items (
-    date_item_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    date_item_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     org_id UUID NOT NULL REFERENCES organizations(org_id),
     person_id UUID NOT NULL REFERENCES persons(person_id),
     category_id UUID NOT NULL REFERENCES date_categories(category_id),
@@ -229,12 +252,24 @@ CREATE TABLE date_items (
     deleted_at TIMESTAMPTZ
 );
 
-CREATE INDEX idx_date_items_person ON date_items(person_id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_date_items_person ON date_items(person_id, next_occurrence) WHERE deleted_at IS NULL;
 CREATE INDEX idx_date_items_next_occurrence ON date_items(next_occurrence) WHERE deleted_at IS NULL;
 
+-- Materialized occurrences of date items (recurrence rules expanded ~2 years ahead)
+CREATE TABLE date_item_occurrences (
+    date_item_id UUID NOT NULL REFERENCES date_items(date_item_id) ON DELETE CASCADE,
+    org_id UUID NOT NULL REFERENCES organizations(org_id),
+    person_id UUID NOT NULL REFERENCES persons(person_id),
+    occurs_on DATE NOT NULL,
+    PRIMARY KEY (date_item_id, occurs_on)
+);
+
+CREATE INDEX idx_date_item_occurrences_org ON date_item_occurrences(org_id, occurs_on);
+CREATE INDEX idx_date_item_occurrences_person ON date_item_occurrences(person_id, occurs_on);
+
 -- Reminder rules (when/how to notify)
 CREATE TABLE reminder_rules (
-    reminder_rule_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    reminder_rule_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     org_id UUID NOT NULL REFERENCES organizations(org_id),
     date_item_id UUID REFERENCES date_items(date_item_id), -- Optional: NULL for generic reminders, populated for date-based reminders
     comm_identity_id UUID NOT NULL REFERENCES comm_identities(comm_identity_id),
@@ -274,10 +309,12 @@ CREATE TABLE projects (
     deleted_at TIMESTAMPTZ
 );
 
-CREATE INDEX idx_projects_person ON projects(person_id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_projects_person ON projects(person_id, status, priority) WHERE deleted_at IS NULL;
+CREATE INDEX idx_projects_person_list ON projects(person_id, priority, created_at DESC) INCLUDE (project_id, title, status, due_date) WHERE deleted_at IS NULL;
 CREATE INDEX idx_projects_assigned ON projects(assigned_to_account_id) WHERE deleted_at IS NULL;
 CREATE INDEX idx_projects_status ON projects(status) WHERE deleted_at IS NULL;
 CREATE INDEX idx_projects_source_date ON projects(source_date_item_id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_projects_metadata ON projects USING gin(metadata_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
 
 -- Large/flexible project data (separate to avoid bloating main table)
 CREATE TABLE project_details (
@@ -311,7 +348,7 @@ CREATE TABLE tasks (
     deleted_at TIMESTAMPTZ
 );
 
-CREATE INDEX idx_tasks_project ON tasks(project_id, sort_order) WHERE deleted_at IS NULL;
+CREATE INDEX idx_tasks_project ON tasks(project_id, sort_order) INCLUDE (status) WHERE deleted_at IS NULL;
 CREATE INDEX idx_tasks_assigned ON tasks(assigned_to_account_id) WHERE deleted_at IS NULL;
 CREATE INDEX idx_tasks_parent ON tasks(parent_id) WHERE deleted_at IS NULL;
 
@@ -331,14 +368,42 @@ CREATE TABLE vendors (
     contact_info_jsonb JSONB,
     tags_jsonb JSONB DEFAULT '[]'::jsonb,
     metadata_jsonb JSONB DEFAULT '{}'::jsonb,
+    search_vector TSVECTOR GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     deleted_at TIMESTAMPTZ
 );
 
-CREATE INDEX idx_vendors_org ON vendors(org_id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_vendors_org_type ON vendors(org_id, vendor_type) WHERE deleted_at IS NULL;
 CREATE INDEX idx_vendors_type ON vendors(vendor_type) WHERE deleted_at IS NULL;
-CREATE INDEX idx_vendors_tags ON vendors USING gin(tags_jsonb);
+CREATE INDEX idx_vendors_tags ON vendors USING gin(tags_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
+CREATE INDEX idx_vendors_search ON vendors USING gin(search_vector) WHERE deleted_at IS NULL;
+
+-- Casts for free-form JSONB text in generated columns: NULL when the value doesn't parse
+CREATE OR REPLACE FUNCTION text_to_integer_or_null(value TEXT)
+RETURNS INTEGER AS $$
+BEGIN
+    IF value ~ '^\s*[+-]?\d{1,9}\s*$' THEN
+        RETURN value::integer;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION text_to_boolean_or_null(value TEXT)
+RETURNS BOOLEAN AS $$
+    SELECT CASE
+        WHEN lower(trim(value)) IN ('true', 't', 'yes', 'y', 'on', '1') THEN TRUE
+        WHEN lower(trim(value)) IN ('false', 'f', 'no', 'n', 'off', '0') THEN FALSE
+    END
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Largest capacity in a private_rooms_jsonb array (used by a generated column)
+CREATE OR REPLACE FUNCTION jsonb_max_room_capacity(rooms JSONB)
+RETURNS INTEGER AS $$
+    SELECT MAX(text_to_integer_or_null(room ->> 'capacity'))
+    FROM jsonb_array_elements(CASE WHEN jsonb_typeof(rooms) = 'array' THEN rooms ELSE '[]'::jsonb END) AS room
+$$ LANGUAGE sql IMMUTABLE;
 
 -- Event spaces
 CREATE TABLE venues (
@@ -351,7 +416,11 @@ CREATE TABLE venues (
     capacity_max INTEGER,
     price_band VARCHAR(10) CHECK (price_band IN ('$', '$$', '$$$', '$$$$')),
     location_jsonb JSONB, -- {neighborhood, city, state}
+    -- Promoted from location_jsonb for indexed filtering (see migration 011)
+    city VARCHAR(100) GENERATED ALWAYS AS (location_jsonb ->> 'city') STORED,
+    state VARCHAR(50) GENERATED ALWAYS AS (location_jsonb ->> 'state') STORED,
     private_rooms_jsonb JSONB DEFAULT '[]'::jsonb,
+    max_private_room_capacity INTEGER GENERATED ALWAYS AS (jsonb_max_room_capacity(private_rooms_jsonb)) STORED,
     contact_info_jsonb JSONB,
     tags_jsonb JSONB DEFAULT '[]'::jsonb,
     metadata_jsonb JSONB DEFAULT '{}'::jsonb,
@@ -362,7 +431,11 @@ CREATE TABLE venues (
 
 CREATE INDEX idx_venues_org ON venues(org_id) WHERE deleted_at IS NULL;
 CREATE INDEX idx_venues_capacity ON venues(capacity_min, capacity_max) WHERE deleted_at IS NULL;
-CREATE INDEX idx_venues_tags ON venues USING gin(tags_jsonb);
+CREATE INDEX idx_venues_tags ON venues USING gin(tags_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
+CREATE INDEX idx_venues_neighborhood ON venues((location_jsonb ->> 'neighborhood')) WHERE deleted_at IS NULL;
+CREATE INDEX idx_venues_city ON venues(city) WHERE deleted_at IS NULL;
+CREATE INDEX idx_venues_state ON venues(state) WHERE deleted_at IS NULL;
+CREATE INDEX idx_venues_private_room_capacity ON venues(max_private_room_capacity) WHERE deleted_at IS NULL;
 
 -- Dining recommendations
 CREATE TABLE restaurants (
@@ -375,9 +448,13 @@ CREATE TABLE restaurants (
     rating DECIMAL(2,1) CHECK (rating BETWEEN 1.0 AND 5.0),
     price_band VARCHAR(10) CHECK (price_band IN ('$', '$$', '$$$', '$$$$')),
     private_dining_jsonb JSONB, -- {available, capacity, pricing}
+    -- Promoted from private_dining_jsonb for indexed filtering (see migration 012)
+    private_dining_available BOOLEAN GENERATED ALWAYS AS (text_to_boolean_or_null(private_dining_jsonb ->> 'available')) STORED,
+    private_dining_capacity INTEGER GENERATED ALWAYS AS (text_to_integer_or_null(private_dining_jsonb ->> 'capacity')) STORED,
     contact_info_jsonb JSONB,
     tags_jsonb JSONB DEFAULT '[]'::jsonb,
     metadata_jsonb JSONB DEFAULT '{}'::jsonb,
+    search_vector TSVECTOR GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     deleted_at TIMESTAMPTZ
@@ -386,7 +463,9 @@ CREATE TABLE restaurants (
 CREATE INDEX idx_restaurants_org ON restaurants(org_id) WHERE deleted_at IS NULL;
 CREATE INDEX idx_restaurants_cuisine ON restaurants(cuisine) WHERE deleted_at IS NULL;
 CREATE INDEX idx_restaurants_neighborhood ON restaurants(neighborhood) WHERE deleted_at IS NULL;
-CREATE INDEX idx_restaurants_tags ON restaurants USING gin(tags_jsonb);
+CREATE INDEX idx_restaurants_tags ON restaurants USING gin(tags_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
+CREATE INDEX idx_restaurants_search ON restaurants USING gin(search_vector) WHERE deleted_at IS NULL;
+CREATE INDEX idx_restaurants_private_dining ON restaurants(private_dining_capacity) WHERE private_dining_available AND deleted_at IS NULL;
 
 -- Gift ideas and shopping recommendations
 CREATE TABLE products (
@@ -402,6 +481,7 @@ CREATE TABLE products (
     image_url TEXT,
     tags_jsonb JSONB DEFAULT '[]'::jsonb,
     metadata_jsonb JSONB DEFAULT '{}'::jsonb,
+    search_vector TSVECTOR GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     deleted_at TIMESTAMPTZ
@@ -409,11 +489,50 @@ CREATE TABLE products (
 
 CREATE INDEX idx_products_org ON products(org_id) WHERE deleted_at IS NULL;
 CREATE INDEX idx_products_category ON products(category) WHERE deleted_at IS NULL;
-CREATE INDEX idx_products_tags ON products USING gin(tags_jsonb);
+CREATE INDEX idx_products_tags ON products USING gin(tags_jsonb jsonb_path_ops) WHERE deleted_at IS NULL;
+CREATE INDEX idx_products_search ON products USING gin(search_vector) WHERE deleted_at IS NULL;
+CREATE INDEX idx_products_price ON products(price) WHERE deleted_at IS NULL;
+
+-- Normalized tags (maintained from tags_jsonb by sync_tags_from_jsonb)
+CREATE TABLE tags (
+    tag_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    org_id UUID NOT NULL REFERENCES organizations(org_id),
+    name TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE (org_id, name)
+);
+
+CREATE TABLE vendor_tags (
+    vendor_id UUID NOT NULL REFERENCES vendors(vendor_id) ON DELETE CASCADE,
+    tag_id UUID NOT NULL REFERENCES tags(tag_id) ON DELETE CASCADE,
+    PRIMARY KEY (vendor_id, tag_id)
+);
+CREATE INDEX idx_vendor_tags_tag ON vendor_tags(tag_id, vendor_id);
+
+CREATE TABLE venue_tags (
+    venue_id UUID NOT NULL REFERENCES venues(venue_id) ON DELETE CASCADE,
+    tag_id UUID NOT NULL REFERENCES tags(tag_id) ON DELETE CASCADE,
+    PRIMARY KEY (venue_id, tag_id)
+);
+CREATE INDEX idx_venue_tags_tag ON venue_tags(tag_id, venue_id);
+
+CREATE TABLE restaurant_tags (
+    restaurant_id UUID NOT NULL REFERENCES restaurants(restaurant_id) ON DELETE CASCADE,
+    tag_id UUID NOT NULL REFERENCES tags(tag_id) ON DELETE CASCADE,
+    PRIMARY KEY (restaurant_id, tag_id)
+);
+CREATE INDEX idx_restaurant_tags_tag ON restaurant_tags(tag_id, restaurant_id);
+
+CREATE TABLE product_tags (
+    product_id UUID NOT NULL REFERENCES products(product_id) ON DELETE CASCADE,
+    tag_id UUID NOT NULL REFERENCES tags(tag_id) ON DELETE CASCADE,
+    PRIMARY KEY (product_id, tag_id)
+);
+CREATE INDEX idx_product_tags_tag ON product_tags(tag_id, product_id);
 
 -- AI-generated recommendations (polymorphic references)
 CREATE TABLE recommendations (
-    recommendation_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    recommendation_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     org_id UUID NOT NULL REFERENCES organizations(org_id),
     project_id UUID NOT NULL REFERENCES projects(project_id),
     item_type VARCHAR(50) NOT NULL CHECK (item_type IN ('vendor', 'venue', 'restaurant', 'product')),
@@ -427,12 +546,15 @@ CREATE TABLE recommendations (
     deleted_at TIMESTAMPTZ
 );
 
-CREATE INDEX idx_recommendations_project ON recommendations(project_id) WHERE deleted_at IS NULL;
-CREATE INDEX idx_recommendations_item ON recommendations(item_type, item_id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_recommendations_project ON recommendations(project_id, created_at DESC) WHERE deleted_at IS NULL;
+CREATE INDEX idx_recommendations_vendor_item ON recommendations(item_id) WHERE item_type = 'vendor' AND deleted_at IS NULL;
+CREATE INDEX idx_recommendations_venue_item ON recommendations(item_id) WHERE item_type = 'venue' AND deleted_at IS NULL;
+CREATE INDEX idx_recommendations_restaurant_item ON recommendations(item_id) WHERE item_type = 'restaurant' AND deleted_at IS NULL;
+CREATE INDEX idx_recommendations_product_item ON recommendations(item_id) WHERE item_type = 'product' AND deleted_at IS NULL;
 
 -- Client feedback on recommendations
 CREATE TABLE interaction_feedback (
-    feedback_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    feedback_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     org_id UUID NOT NULL REFERENCES organizations(org_id),
     recommendation_id UUID NOT NULL REFERENCES recommendations(recommendation_id),
     person_id UUID NOT NULL REFERENCES persons(person_id),
@@ -443,6 +565,7 @@ CREATE TABLE interaction_feedback (
 
 CREATE INDEX idx_interaction_feedback_recommendation ON interaction_feedback(recommendation_id);
 CREATE INDEX idx_interaction_feedback_person ON interaction_feedback(person_id);
+CREATE INDEX idx_interaction_feedback_created_brin ON interaction_feedback USING brin(created_at) WITH (pages_per_range = 32);
 
 -- =====================================================
 -- DOMAIN 7: AI AGENT INFRASTRUCTURE
@@ -467,8 +590,9 @@ CREATE TABLE agent_roster (
 CREATE INDEX idx_agent_roster_org ON agent_roster(org_id, status) WHERE deleted_at IS NULL;
 
 -- Complete audit trail of agent decisions
+-- Partitioned by month on created_at (see migration 006)
 CREATE TABLE agent_execution_logs (
-    log_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    log_id UUID NOT NULL DEFAULT uuid_generate_v7(),
     org_id UUID NOT NULL REFERENCES organizations(org_id),
     agent_id UUID NOT NULL REFERENCES agent_roster(agent_id),
     run_id UUID NOT NULL, -- Groups related messages
@@ -478,16 +602,20 @@ CREATE TABLE agent_execution_logs (
     payload_jsonb JSONB NOT NULL, -- Full request/response for debugging
     execution_time_ms INTEGER,
     tokens_used INTEGER,
-    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
-);
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (log_id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE agent_execution_logs_default PARTITION OF agent_execution_logs DEFAULT;
 
 CREATE INDEX idx_agent_execution_logs_run ON agent_execution_logs(run_id, turn_index);
 CREATE INDEX idx_agent_execution_logs_conversation ON agent_execution_logs(conversation_id);
-CREATE INDEX idx_agent_execution_logs_created ON agent_execution_logs(created_at DESC);
+CREATE INDEX idx_agent_execution_logs_org ON agent_execution_logs(org_id);
+CREATE INDEX idx_agent_execution_logs_created_brin ON agent_execution_logs USING brin(created_at);
 
 -- Vector embeddings for semantic search
 CREATE TABLE embeddings (
-    embedding_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    embedding_id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
     org_id UUID NOT NULL REFERENCES organizations(org_id),
     entity_type VARCHAR(50) NOT NULL CHECK (entity_type IN ('person', 'project', 'message', 'recommendation', 'preference')),
     entity_id UUID NOT NULL,
@@ -499,11 +627,12 @@ CREATE TABLE embeddings (
 );
 
 CREATE INDEX idx_embeddings_entity ON embeddings(entity_type, entity_id);
-CREATE INDEX idx_embeddings_vector ON embeddings USING ivfflat (embedding_vector vector_cosine_ops) WITH (lists = 100);
+CREATE INDEX idx_embeddings_org ON embeddings(org_id);
+CREATE INDEX idx_embeddings_vector ON embeddings USING hnsw (embedding_vector vector_cosine_ops) WITH (m = 16, ef_construction = 64);
 
 -- Ephemeral agent state storage
 CREATE TABLE working_memory (
-    memory_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    memory_id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
     org_id UUID NOT NULL REFERENCES organizations(org_id),
     conversation_id UUID NOT NULL REFERENCES conversations(conversation_id),
     memory_key VARCHAR(255) NOT NULL,
@@ -521,9 +650,9 @@ CREATE INDEX idx_working_memory_expires ON working_memory(expires_at);
 -- DOMAIN 8: SYSTEM AUDIT
 -- =====================================================
 
--- Unified audit log
+-- Unified audit log, partitioned by month on created_at (see migration 006)
 CREATE TABLE event_log (
-    event_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    event_id UUID NOT NULL DEFAULT uuid_generate_v7(),
     org_id UUID NOT NULL REFERENCES organizations(org_id),
     actor_type VARCHAR(50) NOT NULL CHECK (actor_type IN ('person', 'agent', 'system')),
     actor_id UUID, -- person_id, agent_id, or NULL for system
@@ -531,12 +660,16 @@ CREATE TABLE event_log (
     entity_type VARCHAR(100) NOT NULL,
     entity_id UUID NOT NULL,
     details_jsonb JSONB DEFAULT '{}'::jsonb,
-    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
-);
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (event_id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE event_log_default PARTITION OF event_log DEFAULT;
 
 CREATE INDEX idx_event_log_org ON event_log(org_id, created_at DESC);
 CREATE INDEX idx_event_log_entity ON event_log(entity_type, entity_id);
 CREATE INDEX idx_event_log_actor ON event_log(actor_type, actor_id);
+CREATE INDEX idx_event_log_created_brin ON event_log USING brin(created_at);
 
 -- =====================================================
 -- FUNCTIONS & TRIGGERS
@@ -572,6 +705,254 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+-- Keep <entity>_tags in step with tags_jsonb.
+-- TG_ARGV: link table, entity id column. SECURITY DEFINER so RLS-scoped
+-- writers (concierges editing a vendor) can maintain the link rows.
+CREATE OR REPLACE FUNCTION sync_tags_from_jsonb()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    link_table TEXT := TG_ARGV[0];
+    id_column TEXT := TG_ARGV[1];
+    entity_id UUID;
+    tag_names TEXT[];
+BEGIN
+    EXECUTE format('SELECT ($1).%I', id_column) INTO entity_id USING NEW;
+
+    tag_names := ARRAY(
+        SELECT DISTINCT jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(NEW.tags_jsonb) = 'array' THEN NEW.tags_jsonb ELSE '[]'::jsonb END
+        )
+    );
+
+    INSERT INTO tags (org_id, name)
+    SELECT NEW.org_id, unnest(tag_names)
+    ON CONFLICT (org_id, name) DO NOTHING;
+
+    EXECUTE format('DELETE FROM %I WHERE %I = $1', link_table, id_column) USING entity_id;
+    EXECUTE format(
+        'INSERT INTO %I (%I, tag_id) SELECT $1, tag_id FROM tags WHERE org_id = $2 AND name = ANY($3)',
+        link_table, id_column
+    ) USING entity_id, NEW.org_id, tag_names;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    entity RECORD;
+BEGIN
+    FOR entity IN
+        SELECT * FROM (VALUES
+            ('vendors', 'vendor_tags', 'vendor_id'),
+            ('venues', 'venue_tags', 'venue_id'),
+            ('restaurants', 'restaurant_tags', 'restaurant_id'),
+            ('products', 'product_tags', 'product_id')
+        ) AS t(entity_table, link_table, id_column)
+    LOOP
+        EXECUTE format(
+            'CREATE TRIGGER sync_%I
+             AFTER INSERT OR UPDATE OF tags_jsonb ON %I
+             FOR EACH ROW
+             EXECUTE FUNCTION sync_tags_from_jsonb(%L, %L)',
+            entity.link_table, entity.entity_table, entity.link_table, entity.id_column
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Soft-deleting a date item removes its materialized occurrences
+CREATE OR REPLACE FUNCTION delete_soft_deleted_date_item_occurrences()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM date_item_occurrences WHERE date_item_id = NEW.date_item_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER date_items_soft_delete_occurrences
+    AFTER UPDATE OF deleted_at ON date_items
+    FOR EACH ROW
+    WHEN (NEW.deleted_at IS NOT NULL AND OLD.deleted_at IS NULL)
+    EXECUTE FUNCTION delete_soft_deleted_date_item_occurrences();
+
+-- Last N messages of each given conversation (context builder)
+CREATE OR REPLACE FUNCTION recent_conversation_messages(
+    p_conversation_ids UUID[],
+    p_per_conversation INTEGER DEFAULT 5
+)
+RETURNS TABLE (
+    conversation_id UUID,
+    direction TEXT,
+    content_text TEXT,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT ranked.conversation_id, ranked.direction, ranked.content_text, ranked.created_at
+    FROM (
+        SELECT m.conversation_id, m.direction::text AS direction, m.content_text, m.created_at,
+               row_number() OVER (PARTITION BY m.conversation_id ORDER BY m.created_at DESC) AS rn
+        FROM messages m
+        WHERE m.conversation_id = ANY(p_conversation_ids)
+          AND m.deleted_at IS NULL
+    ) ranked
+    WHERE ranked.rn <= p_per_conversation
+    ORDER BY ranked.conversation_id, ranked.created_at;
+$$ LANGUAGE sql STABLE;
+
+-- Conversation lookup-or-insert for proactive messages (serialized per thread)
+CREATE OR REPLACE FUNCTION get_or_create_conversation(
+    p_org_id UUID,
+    p_person_id UUID,
+    p_channel_type TEXT,
+    p_external_thread_id TEXT DEFAULT NULL,
+    p_subject TEXT DEFAULT NULL
+)
+RETURNS SETOF conversations AS $$
+DECLARE
+    found conversations;
+BEGIN
+    PERFORM pg_advisory_xact_lock(
+        hashtext(p_person_id::text || ':' || p_channel_type || ':' || COALESCE(p_external_thread_id, ''))
+    );
+
+    SELECT * INTO found
+    FROM conversations c
+    WHERE c.person_id = p_person_id
+      AND c.channel_type = p_channel_type
+      AND (p_external_thread_id IS NULL OR c.external_thread_id = p_external_thread_id)
+      AND c.deleted_at IS NULL
+    LIMIT 1;
+
+    IF FOUND THEN
+        RETURN NEXT found;
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    INSERT INTO conversations (org_id, person_id, channel_type, external_thread_id, subject, status)
+    VALUES (p_org_id, p_person_id, p_channel_type, p_external_thread_id, p_subject, 'active')
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Due reminders for one reminder-worker shard (hash of comm_identity_id)
+CREATE OR REPLACE FUNCTION due_reminders(
+    p_now TIMESTAMPTZ,
+    p_shard INTEGER DEFAULT 0,
+    p_shard_count INTEGER DEFAULT 1
+)
+RETURNS SETOF reminder_rules AS $$
+    SELECT r.*
+    FROM reminder_rules r
+    WHERE r.sent_at IS NULL
+      AND r.deleted_at IS NULL
+      AND r.scheduled_datetime <= p_now
+      AND mod(abs(hashtext(r.comm_identity_id::text)::bigint), p_shard_count) = p_shard
+    ORDER BY r.scheduled_datetime;
+$$ LANGUAGE sql STABLE;
+
+-- Latest N recommendations of each given project (dashboard)
+CREATE OR REPLACE FUNCTION recent_project_recommendations(
+    p_project_ids UUID[],
+    p_per_project INTEGER DEFAULT 2
+)
+RETURNS TABLE (
+    recommendation_id UUID,
+    project_id UUID,
+    item_type VARCHAR,
+    item_id UUID,
+    rationale_text TEXT,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT r.recommendation_id, r.project_id, r.item_type, r.item_id, r.rationale_text, r.created_at
+    FROM unnest(p_project_ids) AS p(project_id)
+    CROSS JOIN LATERAL (
+        SELECT rec.*
+        FROM recommendations rec
+        WHERE rec.project_id = p.project_id
+          AND rec.deleted_at IS NULL
+        ORDER BY rec.created_at DESC
+        LIMIT p_per_project
+    ) r
+    ORDER BY r.created_at DESC;
+$$ LANGUAGE sql STABLE;
+
+-- Swap a date item's occurrences and next_occurrence atomically
+CREATE OR REPLACE FUNCTION replace_date_item_occurrences(
+    p_date_item_id UUID,
+    p_occurs_on DATE[],
+    p_next_occurrence DATE
+)
+RETURNS VOID AS $$
+BEGIN
+    DELETE FROM date_item_occurrences WHERE date_item_id = p_date_item_id;
+
+    INSERT INTO date_item_occurrences (date_item_id, org_id, person_id, occurs_on)
+    SELECT di.date_item_id, di.org_id, di.person_id, o.occurs_on
+    FROM date_items di
+    CROSS JOIN (SELECT DISTINCT unnest(p_occurs_on) AS occurs_on) o
+    WHERE di.date_item_id = p_date_item_id
+      AND di.deleted_at IS NULL;
+
+    UPDATE date_items
+    SET next_occurrence = p_next_occurrence
+    WHERE date_item_id = p_date_item_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- First occurrence of each date item in a window (dashboard, context builder)
+CREATE OR REPLACE FUNCTION upcoming_date_occurrences(
+    p_person_id UUID,
+    p_from DATE,
+    p_to DATE
+)
+RETURNS TABLE (
+    date_item_id UUID,
+    title VARCHAR,
+    category_id UUID,
+    date_value DATE,
+    notes TEXT,
+    occurs_on DATE
+) AS $$
+    SELECT nxt.date_item_id, di.title, di.category_id, di.date_value, di.notes, nxt.occurs_on
+    FROM (
+        SELECT DISTINCT ON (o.date_item_id) o.date_item_id, o.occurs_on
+        FROM date_item_occurrences o
+        WHERE o.person_id = p_person_id
+          AND o.occurs_on BETWEEN p_from AND p_to
+        ORDER BY o.date_item_id, o.occurs_on
+    ) nxt
+    JOIN date_items di ON di.date_item_id = nxt.date_item_id
+    WHERE di.deleted_at IS NULL
+    ORDER BY nxt.occurs_on, di.title;
+$$ LANGUAGE sql STABLE;
+
+-- Recurring date items whose occurrences need re-expanding (reminder worker)
+CREATE OR REPLACE FUNCTION date_items_due_for_expansion(
+    p_today DATE,
+    p_limit INTEGER DEFAULT 100
+)
+RETURNS SETOF date_items AS $$
+    SELECT di.*
+    FROM date_items di
+    WHERE di.deleted_at IS NULL
+      AND di.recurrence_rule IS NOT NULL
+      AND (
+          di.next_occurrence < p_today
+          OR (
+              di.next_occurrence IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM date_item_occurrences o WHERE o.date_item_id = di.date_item_id
+              )
+          )
+      )
+    ORDER BY di.next_occurrence
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
 -- Function to compute next_occurrence for recurring dates
 CREATE OR REPLACE FUNCTION compute_next_occurrence(
     date_value DATE,
@@ -597,6 +978,34 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql IMMUTABLE;
 
+-- Create monthly partitions for a partitioned log table.
+-- Schedule monthly for agent_execution_logs and event_log (e.g. pg_cron).
+CREATE OR REPLACE FUNCTION create_monthly_log_partitions(
+    p_table TEXT,
+    p_from DATE,
+    p_months_ahead INTEGER DEFAULT 3
+)
+RETURNS VOID AS $$
+DECLARE
+    month_start DATE := date_trunc('month', p_from)::date;
+    last_month DATE := (date_trunc('month', CURRENT_DATE) + make_interval(months => p_months_ahead))::date;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            p_table || '_' || to_char(month_start, 'YYYY_MM'),
+            p_table,
+            month_start,
+            (month_start + INTERVAL '1 month')::date
+        );
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT create_monthly_log_partitions('agent_execution_logs', CURRENT_DATE);
+SELECT create_monthly_log_partitions('event_log', CURRENT_DATE);
+
 -- =====================================================
 -- ROW LEVEL SECURITY (RLS) - Optional but recommended
 -- =====================================================